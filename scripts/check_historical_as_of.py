@@ -0,0 +1,119 @@
+"""과거 기준일 포트폴리오 집계 점검
+
+기준일 현재 발행 전인 채권이 유니버스에 남아 있어도 포트폴리오별
+합계가 유한한지 확인한다. 각 점검 기준일마다 다음 포트폴리오를 만든다.
+
+- 전체: 발행액 전액 보유
+- 발행채권: 기준일 현재 시장금리가 있는 채권만 보유
+
+'발행채권'의 PV01 집계와 시나리오 손실은 항상 유한해야 한다. 몬테카를로
+손실 분포는 시세 없는 채권을 제외하므로 두 포트폴리오 모두 유한해야 한다.
+
+사용법: python -m scripts.check_historical_as_of
+"""
+
+import numpy as np
+import pandas as pd
+from src.analysis.pv01_analysis import PV01Analysis
+from src.analysis.scenario.bad_scenario import BadScenarioAnalysis
+from src.analysis.scenario.baseline_scenario import BaselineScenarioAnalysis
+from src.analysis.scenario.worst_scenario import WorstScenarioAnalysis
+from src.utils.holdings import Holdings
+
+# 점검 기준일 (일부 채권 발행 전 시점, 2024-07-08은 당일 발행 채권 시세 없음)
+CHECK_DATES = ("2022-01-03", "2023-01-02", "2024-07-08")
+
+SCENARIO_CLASSES = (
+    BaselineScenarioAnalysis,
+    BadScenarioAnalysis,
+    WorstScenarioAnalysis,
+)
+
+
+def check_holdings(analysis, as_of):
+    """'전체'와 '발행채권' 두 포트폴리오의 보유 내역"""
+    universe = analysis.universe
+    priced = np.isfinite(analysis.get_market_rates(as_of))
+    positions = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "포트폴리오": "전체",
+                    "종목명": universe.names,
+                    "액면금액": universe.notionals,
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "포트폴리오": "발행채권",
+                    "종목명": universe.names[priced],
+                    "액면금액": universe.notionals[priced],
+                }
+            ),
+        ]
+    )
+    return Holdings.from_frame(positions, universe)
+
+
+def _assert_finite(values, message):
+    assert np.isfinite(np.asarray(values, dtype=float)).all(), message
+
+
+def check_holdings_pv01(analysis, as_of):
+    """포트폴리오별 PV01 집계가 유한한지 확인 (실패 시 AssertionError)"""
+    holdings = check_holdings(analysis, as_of)
+    totals = analysis.calculate_holdings_pv01(holdings, as_of=as_of)
+    issued = totals[totals["포트폴리오"] == "발행채권"]
+    _assert_finite(
+        issued[["평가금액", "PV01", "달러듀레이션"]],
+        f"{as_of}: PV01 집계가 유한하지 않습니다\n{totals}",
+    )
+    return totals
+
+
+def check_scenario_losses(analysis, as_of):
+    """시나리오 모듈별 포트폴리오 손실이 유한한지 확인 (실패 시 AssertionError)"""
+    holdings = check_holdings(analysis, as_of)
+    losses = pd.concat(
+        [
+            cls(as_of=as_of).calculate_portfolio_losses(holdings)
+            for cls in SCENARIO_CLASSES
+        ]
+    )
+    _assert_finite(
+        losses["발행채권"], f"{as_of}: 시나리오 손실이 유한하지 않습니다\n{losses}"
+    )
+    return losses
+
+
+def check_simulations(analysis, as_of, n_samples=200):
+    """Bad·Worst 몬테카를로 포트폴리오 손실 분포가 유한한지 확인"""
+    holdings = check_holdings(analysis, as_of)
+    simulations = {
+        "Bad": BadScenarioAnalysis(as_of=as_of).simulate_spread_widening(
+            n_samples=n_samples, holdings=holdings
+        ),
+        "Worst": WorstScenarioAnalysis(as_of=as_of).simulate_credit_crisis(
+            n_samples=n_samples, holdings=holdings
+        ),
+    }
+    for name, simulation in simulations.items():
+        _assert_finite(
+            simulation["portfolio"],
+            f"{as_of}: {name} 손실 분포가 유한하지 않습니다\n{simulation['portfolio']}",
+        )
+    return simulations
+
+
+if __name__ == "__main__":
+    analysis = PV01Analysis(as_of=CHECK_DATES[-1])
+    for as_of in CHECK_DATES:
+        totals = check_holdings_pv01(analysis, as_of)
+        losses = check_scenario_losses(analysis, as_of)
+        simulations = check_simulations(analysis, as_of)
+        print(f"[{as_of}]")
+        print(totals[["포트폴리오", "평가금액", "PV01"]].to_string(index=False))
+        print(losses)
+        for name, simulation in simulations.items():
+            print(f"{name} 제외 채권: {list(simulation['excluded'])}")
+    print("점검 통과")
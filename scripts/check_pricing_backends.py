@@ -0,0 +1,102 @@
+"""numba·NumPy 가격 계산 커널 결과 일치 점검
+
+합성 현금흐름으로 src.analysis.pricing_kernels의 두 백엔드를 실행해
+커널별 최대 상대오차가 BACKEND_RTOL 이내인지 확인한다 (numba 필요).
+
+사용법: python -m scripts.check_pricing_backends
+"""
+
+import numpy as np
+from src.analysis.pricing_kernels import (
+    NUMBA_AVAILABLE,
+    analytic_moments,
+    discount,
+    discount_cashflows,
+    newton_yields,
+)
+
+# 백엔드 비교 시 허용하는 상대오차 (합산 순서 차이에 따른 반올림 오차)
+BACKEND_RTOL = 1e-10
+
+
+def compare_backends(n_rows=500, n_periods=40, n_scenarios=8, seed=0):
+    """합성 현금흐름으로 numba와 NumPy 커널 결과 비교
+
+    만기 경과(현금흐름 전부 0) 행과 NaN 금리·가격 행을 포함한 입력에서
+    커널별 최대 상대오차를 계산한다. NaN 위치가 다르면 오차는 inf이다.
+
+    Returns:
+    --------
+    dict : 커널명 → 최대 상대오차
+
+    Raises:
+    -------
+    ValueError : numba가 없거나 오차가 BACKEND_RTOL을 넘는 경우
+    """
+    if not NUMBA_AVAILABLE:
+        raise ValueError("numba가 설치되어 있지 않습니다")
+    rng = np.random.default_rng(seed)
+
+    # 채권별 지급회차 수가 달라 남는 칸은 금액·기간 0 (엔진 행렬과 같은 형태)
+    counts = rng.integers(0, n_periods + 1, n_rows)
+    counts[0] = 0
+    paid = np.arange(n_periods)[None, :] < counts[:, None]
+    coupon = rng.uniform(100, 500, n_rows)[:, None]
+    amounts = np.where(paid, coupon, 0.0)
+    amounts[np.arange(n_rows), np.maximum(counts - 1, 0)] += 10000.0 * (counts > 0)
+    times = np.where(paid, (np.arange(n_periods) + 1) / 4 - 0.1, 0.0)
+
+    yields = rng.uniform(0.01, 0.08, n_rows)
+    yields[[0, 1]] = np.nan
+    rates = yields + rng.uniform(-0.02, 0.02, (n_scenarios, 1))
+    cashflow_rates = yields[:, None] + rng.normal(0, 0.005, (n_scenarios, *times.shape))
+    base_rates = rng.uniform(0.02, 0.04, times.shape)
+    prices = discount(amounts, times, yields[None], backend="numpy")[0]
+    spread_prices = discount_cashflows(
+        amounts, times, (base_rates + 0.01)[None], backend="numpy"
+    )[0]
+
+    kernels = {
+        "discount": lambda backend: discount(amounts, times, rates, backend),
+        "discount_cashflows": lambda backend: discount_cashflows(
+            amounts, times, cashflow_rates, backend
+        ),
+        "analytic_moments": lambda backend: np.stack(
+            analytic_moments(amounts, times, yields, backend)
+        ),
+        "newton_yields": lambda backend: np.stack(
+            newton_yields(amounts, times, prices, backend=backend)
+        ).astype(float),
+        "newton_spreads": lambda backend: np.stack(
+            newton_yields(
+                amounts,
+                times,
+                spread_prices,
+                guess=0.005,
+                base_rates=base_rates,
+                backend=backend,
+            )
+        ).astype(float),
+    }
+
+    errors = {}
+    for name, kernel in kernels.items():
+        fast, reference = kernel("numba"), kernel("numpy")
+        same_nan = np.array_equal(np.isnan(fast), np.isnan(reference))
+        finite = np.isfinite(reference)
+        scale = np.maximum(np.abs(reference[finite]), 1.0)
+        errors[name] = (
+            float(np.max(np.abs(fast[finite] - reference[finite]) / scale, initial=0))
+            if same_nan
+            else np.inf
+        )
+
+    failed = [name for name, error in errors.items() if not error <= BACKEND_RTOL]
+    if failed:
+        raise ValueError(f"numba와 NumPy 결과가 다른 커널: {failed} ({errors})")
+    return errors
+
+
+if __name__ == "__main__":
+    for name, error in compare_backends().items():
+        print(f"{name}: 최대 상대오차 {error:.2e}")
@@ -27,8 +27,16 @@ class VaRAnalysisResult:
 
 
 class MonteCarloVaRAnalysis:
-    def __init__(self):
+    def __init__(self, holdings=None):
         self.db = WooriBondDB()
+        # 보유 내역 (None이면 발행액 전액을 포지션으로 사용)
+        self.holdings = holdings
+
+    def get_position_sizes(self, data: pd.DataFrame) -> pd.Series:
+        """채권별 포지션 규모 (보유 내역의 액면금액 합계, 없으면 발행액)"""
+        if self.holdings is None:
+            return data.groupby("bond_name")["issue_amount"].last()
+        return self.holdings.universe.to_series(self.holdings.bond_face)
 
     def get_portfolio_data(self) -> Tuple[pd.DataFrame, np.ndarray]:
         query = """
@@ -193,6 +201,7 @@ class MonteCarloVaRAnalysis:
         # 개별 채권 분석
         individual_results = {}
         positions = []
+        position_sizes = self.get_position_sizes(data)
 
         for bond_name in data["bond_name"].unique():
             bond_data = data[data["bond_name"] == bond_name].iloc[-1]
@@ -205,7 +214,7 @@ class MonteCarloVaRAnalysis:
 
             result = self.calculate_individual_var(
                 returns=returns,
-                position_size=bond_data["issue_amount"],
+                position_size=position_sizes.get(bond_name, 0.0),
                 current_price=bond_data["price"],
                 remaining_maturity=bond_data["remaining_maturity"],
                 n_simulations=n_simulations,
@@ -213,7 +222,7 @@ class MonteCarloVaRAnalysis:
             )
 
             individual_results[bond_name] = result
-            positions.append(bond_data["issue_amount"])
+            positions.append(position_sizes.get(bond_name, 0.0))
 
         # 포트폴리오 VaR 계산
         positions = np.array(positions)
@@ -0,0 +1,242 @@
+import numpy as np
+from src.utils.bond_universe import BondUniverse
+from src.utils.data_loader import (
+    load_bond_market_panel,
+    load_govt_zero_curve,
+    load_spread_data,
+)
+from src.analysis import pricing_kernels
+from src.analysis.pricing_engine import CashflowPricingEngine, solve_yields
+
+# 시장 가격 표시 기준 액면 (액면 10,000원당 가격)
+PRICE_FACE = 10000
+
+# 수익률 복리 기준 ('annual': 연 복리, 'periodic': 이자지급주기 복리)
+COMPOUNDING_METHODS = ("annual", "periodic")
+
+
+class PriceYieldAnalysis:
+    """전 채권·전 일자 수익률 ↔ 가격 일괄 변환
+
+    (채권, 일자) 관측치 전체를 하나의 현금흐름 행렬로 만들어 수익률에서
+    가격(경과이자 포함/제외)을, 가격에서 수익률을 배열 연산으로 계산한다.
+    가격은 액면 10,000원 기준이며, 시장 평균가격은 경과이자 포함 가격과
+    비교한다.
+
+    Parameters:
+    -----------
+    universe : BondUniverse
+        채권 유니버스 (기본값: 채권 기본 정보 파일)
+    compounding : str
+        수익률 복리 기준. 'periodic'(기본값)은 시장 관행인 이자지급주기 복리,
+        'annual'은 PV01 엔진과 같은 연 복리
+    """
+
+    def __init__(self, universe=None, compounding="periodic"):
+        if compounding not in COMPOUNDING_METHODS:
+            raise ValueError(f"지원하지 않는 복리 기준입니다: {compounding}")
+
+        self.universe = universe if universe is not None else BondUniverse.load()
+        self.compounding = compounding
+        self.engine = CashflowPricingEngine(
+            self.universe, self.universe.issue_dates.min()
+        )
+
+    def _to_annual(self, bond_index, yields):
+        """복리 기준 수익률을 연 복리 수익률로 변환"""
+        yields = np.asarray(yields, dtype=float)
+        if self.compounding == "annual":
+            return yields
+        periods = 12 / self.universe.payment_freq[bond_index]
+        return (1 + yields / periods) ** periods - 1
+
+    def _from_annual(self, bond_index, yields):
+        """연 복리 수익률을 복리 기준 수익률로 변환"""
+        if self.compounding == "annual":
+            return yields
+        periods = 12 / self.universe.payment_freq[bond_index]
+        return periods * ((1 + yields) ** (1 / periods) - 1)
+
+    def _face_matrices(self, bond_index, dates):
+        """관측치별 액면 10,000원 기준 (현금흐름 금액, 기간) 행렬"""
+        amounts, times = self.engine.cashflow_matrices(dates, bond_index)
+        scale = PRICE_FACE / self.engine.principal[bond_index]
+        return amounts * scale[:, None], times
+
+    def accrued_interest(self, bond_index, dates):
+        """관측치별 경과이자 (액면 10,000원 기준)"""
+        accrued = self.engine.accrued_interest(dates, bond_index)
+        return accrued * PRICE_FACE / self.engine.principal[bond_index]
+
+    def yield_to_price(self, bond_index, dates, yields):
+        """수익률(소수)에서 가격 계산
+
+        Parameters:
+        -----------
+        bond_index : array-like
+            관측치별 채권 ID
+        dates : array-like
+            관측치별 기준일
+        yields : array-like
+            관측치별 수익률 (소수)
+
+        Returns:
+        --------
+        dict : 경과이자포함가격, 경과이자, 경과이자제외가격 (액면 10,000원 기준)
+        """
+        bond_index = np.asarray(bond_index, dtype=np.int64)
+        amounts, times = self._face_matrices(bond_index, dates)
+        annual = self._to_annual(bond_index, yields)
+        dirty = pricing_kernels.discount(amounts, times, annual[None])[0]
+        accrued = self.accrued_interest(bond_index, dates)
+        return {
+            "경과이자포함가격": dirty,
+            "경과이자": accrued,
+            "경과이자제외가격": dirty - accrued,
+        }
+
+    def price_to_yield(
+        self, bond_index, dates, prices, clean=False, guess=0.03, tol=1e-10
+    ):
+        """가격에서 수익률(소수) 역산
+
+        Parameters:
+        -----------
+        bond_index : array-like
+            관측치별 채권 ID
+        dates : array-like
+            관측치별 기준일
+        prices : array-like
+            관측치별 가격 (액면 10,000원 기준)
+        clean : bool
+            True이면 경과이자 제외 가격으로 간주하여 경과이자를 더한 뒤 계산
+        guess : float or array-like
+            초기 수익률 (소수)
+        tol : float
+            수익률 수렴 기준
+
+        Returns:
+        --------
+        tuple : (수익률, 수렴 여부)
+        """
+        bond_index = np.asarray(bond_index, dtype=np.int64)
+        prices = np.asarray(prices, dtype=float)
+        if clean:
+            prices = prices + self.accrued_interest(bond_index, dates)
+
+        amounts, times = self._face_matrices(bond_index, dates)
+        annual, converged = solve_yields(
+            amounts,
+            times,
+            prices,
+            guess=self._to_annual(bond_index, np.broadcast_to(guess, prices.shape)),
+            tol=tol,
+        )
+        return self._from_annual(bond_index, annual), converged
+
+    def z_spread(self, bond_index, dates, prices, zero_curve, tol=1e-10):
+        """국고채 무이표 곡선 대비 Z-스프레드 (소수, 연 복리 기준)
+
+        각 현금흐름을 '해당 만기 국고채 무이표금리 + Z-스프레드'로 할인한
+        가격이 시장 가격(경과이자 포함)과 같아지는 스프레드를 전 관측치에
+        대해 한 번에 구한다.
+
+        Parameters:
+        -----------
+        bond_index : array-like
+            관측치별 채권 ID
+        dates : array-like
+            관측치별 기준일
+        prices : array-like
+            관측치별 경과이자 포함 가격 (액면 10,000원 기준)
+        zero_curve : ZeroCurve
+            국고채 무이표 할인계수 곡선
+
+        Returns:
+        --------
+        tuple : (Z-스프레드, 수렴 여부)
+        """
+        bond_index = np.asarray(bond_index, dtype=np.int64)
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        amounts, times = self._face_matrices(bond_index, dates)
+        zero_rates = zero_curve.zero_rate(dates[:, None], times) / 100
+        return solve_yields(
+            amounts,
+            times,
+            np.asarray(prices, dtype=float),
+            guess=0.005,
+            tol=tol,
+            base_rates=zero_rates,
+        )
+
+    def reconcile(self):
+        """시장 수익률과 시장 가격의 정합성 점검 (전 채권·전 일자)
+
+        Returns:
+        --------
+        DataFrame : 일자·종목명별 이론가격, 가격차이, 내재수익률, 수익률차이(bp),
+            수렴여부
+        """
+        panel = load_bond_market_panel().dropna(subset=["수익률", "가격"])
+        panel = panel[self.universe.contains(panel["종목명"])]
+        bond_index = self.universe.indices(panel["종목명"])
+        dates = panel["일자"].to_numpy().astype("datetime64[D]")
+        market_yields = panel["수익률"].to_numpy() / 100
+
+        prices = self.yield_to_price(bond_index, dates, market_yields)
+        implied, converged = self.price_to_yield(
+            bond_index, dates, panel["가격"].to_numpy(), guess=market_yields
+        )
+
+        for column, values in prices.items():
+            panel[column] = values
+        panel["가격차이"] = panel["가격"] - panel["경과이자포함가격"]
+        panel["내재수익률"] = implied * 100
+        panel["수익률차이(bp)"] = (implied - market_yields) * 10000
+        panel["수렴여부"] = converged
+
+        return panel.sort_values(["일자", "종목명"]).reset_index(drop=True)
+
+    def spread_table(self, zero_curve=None):
+        """스프레드 데이터에 국고채 무이표 곡선 대비 Z스프레드(%) 추가
+
+        스프레드 데이터의 전 관측치를 시장 가격(경과이자 포함)과 결합해
+        Z-스프레드를 일괄 계산한다. 가격이 없는 관측치는 NaN이다.
+
+        Parameters:
+        -----------
+        zero_curve : ZeroCurve
+            국고채 무이표 할인계수 곡선 (기본값: 국고채 금리 전 일자 부트스트랩)
+
+        Returns:
+        --------
+        DataFrame : 스프레드 데이터 + Z스프레드 (%)
+        """
+        if zero_curve is None:
+            zero_curve = load_govt_zero_curve()
+
+        spreads = load_spread_data()
+        spreads = spreads[self.universe.contains(spreads["종목명"])]
+        prices = spreads.merge(
+            load_bond_market_panel()[["일자", "종목명", "가격"]],
+            on=["일자", "종목명"],
+            how="left",
+        )["가격"]
+
+        z_spread, _ = self.z_spread(
+            self.universe.indices(spreads["종목명"]),
+            spreads["일자"].to_numpy().astype("datetime64[D]"),
+            prices.to_numpy(),
+            zero_curve,
+        )
+        return spreads.assign(Z스프레드=z_spread * 100).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    analysis = PriceYieldAnalysis()
+    results = analysis.reconcile()
+    print(results.tail(12))
+
+    print("\n종목별 수익률 차이(bp) 요약:")
+    print(results.groupby("종목명")["수익률차이(bp)"].describe().round(3))
+    print(f"\n미수렴 관측치: {(~results['수렴여부']).sum()}개")
@@ -0,0 +1,423 @@
+import numpy as np
+from src.analysis import pricing_kernels
+from src.utils.bond_universe import BondUniverse
+from src.utils.coupon_schedule import generate_schedules
+from src.utils.day_count import year_fraction, PRICING_CONVENTION
+from src.utils.yield_curve import key_rate_weights
+
+
+class CashflowPricingEngine:
+    """채권 × 현금흐름 행렬 기반 포트폴리오 가격 계산
+
+    전 채권의 현금흐름 금액 행렬과 기준일로부터의 기간(년) 행렬을 한 번
+    만들어 두고, 가격·PV01 계산은 NumPy 브로드캐스트로 처리한다.
+    지급 횟수가 적은 채권의 남는 칸은 금액 0으로 채운다. 기준일 현재
+    발행 전이거나 상환된 채권의 가격·위험지표는 0으로 반환한다.
+
+    Parameters:
+    -----------
+    universe : BondUniverse or DataFrame
+        채권 유니버스 또는 채권 기본 정보 (발행일, 만기일, 이자지급주기,
+        표면금리, 발행액)
+    analysis_date : datetime
+        기준일 (기준일 이후 현금흐름만 반영)
+    """
+
+    def __init__(self, universe, analysis_date):
+        if not isinstance(universe, BondUniverse):
+            universe = BondUniverse.from_frame(universe)
+        self.universe = universe
+        self.bond_names = universe.names
+        self.analysis_date = analysis_date
+
+        schedule = generate_schedules(
+            universe.issue_dates,
+            universe.maturity_dates,
+            universe.payment_freq,
+            convention="following",
+        )
+        payment_freq = universe.payment_freq.astype(float)
+        coupon_rate = universe.coupon_rates
+        principal = universe.notionals.astype(float)
+
+        # 각 지급일의 이자금액 = 발행액 × (표면금리/연간 지급횟수), 만기일에는 원금 추가
+        bond_index = schedule.bond_index
+        coupon = principal * coupon_rate / (12 / payment_freq)
+        flows = coupon[bond_index] + principal[bond_index] * schedule.is_final
+
+        # 채권 × 지급회차 행렬 (남는 칸은 금액 0, 지급일은 기준일 이전 값으로 채움)
+        column = np.arange(len(bond_index)) - schedule.offsets[bond_index]
+        shape = (schedule.n_bonds, int(schedule.counts.max()))
+
+        self.flows = np.zeros(shape)
+        self.payment_dates = np.full(shape, np.datetime64("1970-01-01", "D"))
+        self.flows[bond_index, column] = flows
+        self.payment_dates[bond_index, column] = schedule.dates
+        self.principal = principal
+        self.coupons = coupon
+        self.schedule = schedule
+
+        self.amounts, self.times = self.cashflow_matrices(analysis_date)
+        self.outstanding = universe.outstanding(analysis_date)
+
+    def _outstanding_only(self, values, bond_index=None):
+        """미발행·상환 채권(마지막 축)의 값을 0으로 대체 (시장금리 NaN 차단)"""
+        outstanding = self.outstanding
+        if bond_index is not None:
+            outstanding = outstanding[bond_index]
+        return np.where(outstanding, values, 0.0)
+
+    def cashflow_matrices(self, dates, bond_index=None):
+        """기준일별 (현금흐름 금액, 기간) 행렬 (기준일 이후 현금흐름만 반영)
+
+        Parameters:
+        -----------
+        dates : array-like
+            기준일 (스칼라 또는 bond_index와 같은 길이의 배열)
+        bond_index : array-like
+            행별 채권 인덱스 (기본값: 전 채권)
+
+        Returns:
+        --------
+        tuple : (금액 행렬, 기간(년) 행렬)
+        """
+        if bond_index is None:
+            bond_index = np.arange(len(self.flows))
+        dates = np.asarray(dates, dtype="datetime64[D]")
+
+        times = year_fraction(
+            dates[..., None], self.payment_dates[bond_index], PRICING_CONVENTION
+        )
+        alive = times > 0
+        amounts = np.where(alive, self.flows[bond_index], 0.0)
+        return amounts, np.where(alive, times, 0.0)
+
+    def accrued_interest(self, dates, bond_index=None):
+        """기준일별 경과이자 (직전 이자지급일부터 기준일까지, 이자계산기간 비례)
+
+        Parameters:
+        -----------
+        dates : array-like
+            기준일 (스칼라 또는 bond_index와 같은 길이의 배열)
+        bond_index : array-like
+            행별 채권 인덱스 (기본값: 전 채권)
+
+        Returns:
+        --------
+        ndarray : 경과이자 (만기 경과 채권은 0)
+        """
+        if bond_index is None:
+            bond_index = np.arange(self.schedule.n_bonds)
+        bond_index = np.asarray(bond_index, dtype=np.int64)
+        dates = np.broadcast_to(
+            np.asarray(dates, dtype="datetime64[D]"), bond_index.shape
+        )
+        schedule = self.schedule
+
+        # (채권, 지급일) 정렬 키로 채권별 기준일 다음 지급 회차를 한 번에 검색
+        stride = np.int64(1) << 32
+        keys = schedule.bond_index * stride + schedule.dates.astype(np.int64)
+        position = np.searchsorted(
+            keys, bond_index * stride + dates.astype(np.int64), side="right"
+        )
+        alive = position < schedule.offsets[bond_index + 1]
+        position = np.minimum(position, len(keys) - 1)
+
+        start = schedule.accrual_starts[position]
+        end = schedule.unadjusted_dates[position]
+        fraction = np.clip(
+            (dates - start).astype(np.int64) / (end - start).astype(np.int64), 0, 1
+        )
+        return np.where(alive, self.coupons[bond_index] * fraction, 0.0)
+
+    def price(self, yields, shift=0.0):
+        """시장금리(소수)로 할인한 채권별 현재가치
+
+        Parameters:
+        -----------
+        yields : array-like
+            채권별 할인금리 (길이 = 채권 수)
+        shift : float or array-like
+            금리 평행이동 폭, 배열이면 앞쪽 축으로 브로드캐스트
+
+        Returns:
+        --------
+        ndarray : 현재가치 (shift 형태 + 채권 수)
+        """
+        return self._outstanding_only(
+            present_value(self.amounts, self.times, yields, shift)
+        )
+
+    def pv01(self, yields, shock=0.0001):
+        """PV01 = -(1bp 상승 후 현재가치 - 기본 현재가치)"""
+        base, shocked = self.price(yields, shift=np.array([0.0, shock]))
+        return -(shocked - base)
+
+    def reprice(self, new_yields, bond_index=None, method="analytic", shock=0.0001):
+        """시장금리만 바뀐 경우의 재계산 (캐시된 현금흐름·기간 행렬 재사용)
+
+        스케줄 생성과 일수 계산 없이 할인 단계만 다시 수행한다.
+
+        Parameters:
+        -----------
+        new_yields : array-like
+            채권별 새 할인금리 (소수, bond_index와 같은 길이)
+        bond_index : array-like
+            재계산할 채권 인덱스 (기본값: 전 채권)
+        method : str
+            'analytic' 또는 'numeric'
+        shock : float
+            PV01 금리 변동폭 (기본값 1bp)
+
+        Returns:
+        --------
+        dict : 가격, 맥컬리듀레이션, 수정듀레이션, 달러듀레이션, PV01, 컨벡서티
+        """
+        amounts, times = self.amounts, self.times
+        if bond_index is not None:
+            amounts, times = amounts[bond_index], times[bond_index]
+        measures = risk_measures(amounts, times, new_yields, method, shock)
+        return {
+            key: self._outstanding_only(value, bond_index)
+            for key, value in measures.items()
+        }
+
+    def price_shifted(self, yields, cashflow_shifts):
+        """현금흐름별 금리 충격을 반영한 채권별 현재가치 (비평행 충격 재평가)
+
+        Parameters:
+        -----------
+        yields : array-like
+            채권별 할인금리 (소수, 길이 = 채권 수)
+        cashflow_shifts : ndarray
+            현금흐름별 금리 충격 (소수, 시나리오 수 × 채권 수 × 지급회차)
+
+        Returns:
+        --------
+        ndarray : 현재가치 (시나리오 수 × 채권 수)
+        """
+        rates = np.asarray(yields, dtype=float)[:, None] + cashflow_shifts
+        return self._outstanding_only(
+            pricing_kernels.discount_cashflows(self.amounts, self.times, rates)
+        )
+
+    def shock_grid(self, yields, shifts, chunk_size=128):
+        """금리 평행이동 격자 전체에 대한 완전 재평가 손익 (충격 수 × 채권 수)
+
+        Parameters:
+        -----------
+        yields : array-like
+            채권별 기본 할인금리 (소수)
+        shifts : array-like
+            금리 평행이동 폭 (소수, 예: -0.03 ~ +0.03)
+        chunk_size : int
+            한 번에 계산할 충격 수 (중간 배열 메모리 제한)
+
+        Returns:
+        --------
+        ndarray : 충격별 손익 (충격 후 현재가치 - 기본 현재가치)
+        """
+        shifts = np.asarray(shifts, dtype=float)
+        base = self.price(yields)
+        pnl = np.empty((len(shifts), len(base)))
+        for start in range(0, len(shifts), chunk_size):
+            block = shifts[start : start + chunk_size]
+            pnl[start : start + chunk_size] = self.price(yields, shift=block) - base
+        return pnl
+
+    def risk_measures(self, yields, method="analytic", shock=0.0001):
+        """가격·듀레이션·PV01·컨벡서티 일괄 계산
+
+        Parameters:
+        -----------
+        yields : array-like
+            채권별 할인금리 (소수)
+        method : str
+            'analytic': 현금흐름/기간 행렬에서 해석적으로 계산
+            'numeric': 금리를 ±shock 만큼 재평가하여 수치 미분
+        shock : float
+            수치 미분 및 PV01 금리 변동폭 (기본값 1bp)
+
+        Returns:
+        --------
+        dict : 가격, 맥컬리듀레이션, 수정듀레이션, 달러듀레이션, PV01, 컨벡서티
+        """
+        return self.reprice(yields, method=method, shock=shock)
+
+    def risk_measures_at(
+        self, bond_index, dates, yields, method="analytic", shock=0.0001
+    ):
+        """(채권, 기준일) 관측치별 위험지표 일괄 계산
+
+        관측치마다 해당 기준일 이후 현금흐름과 해당일 금리를 사용하며,
+        전 관측치를 하나의 (관측치 × 지급회차) 행렬로 계산한다.
+        """
+        amounts, times = self.cashflow_matrices(dates, bond_index)
+        return risk_measures(amounts, times, yields, method, shock)
+
+    def key_rate_pv01(self, discount_rates, pillars, shock=0.0001):
+        """키레이트 PV01 (채권 × 기준만기 행렬)
+
+        할인금리 곡선을 기준만기별 삼각형 가중치로 shock 만큼 올렸을 때의
+        가치 감소분을 전 기준만기에 대해 한 번에 계산한다.
+
+        Parameters:
+        -----------
+        discount_rates : array-like
+            현금흐름별 할인금리 (소수, amounts와 같은 형태)
+        pillars : array-like
+            기준만기(년)
+        shock : float
+            기준만기 금리 변동폭 (기본값 1bp)
+
+        Returns:
+        --------
+        ndarray : 키레이트 PV01 (채권 수 × 기준만기 수)
+        """
+        discount_rates = np.asarray(discount_rates, dtype=float)
+        weights = key_rate_weights(self.times, pillars)
+
+        base = pricing_kernels.discount_cashflows(
+            self.amounts, self.times, discount_rates[None]
+        )
+        bumped = pricing_kernels.discount_cashflows(
+            self.amounts, self.times, discount_rates + shock * weights
+        )
+        return self._outstanding_only(-(bumped - base)).T
+
+
+def present_value(amounts, times, yields, shift=0.0):
+    """(금액, 기간) 행렬을 행별 금리(소수)로 할인한 현재가치
+
+    shift가 배열이면 앞쪽 축으로 브로드캐스트하여 (shift 형태 + 행 수)를 반환한다.
+    """
+    rates = np.asarray(yields, dtype=float) + np.asarray(shift, dtype=float)[..., None]
+    shape = rates.shape
+    values = pricing_kernels.discount(amounts, times, rates.reshape(-1, shape[-1]))
+    return values.reshape(shape)
+
+
+def solve_yields(
+    amounts,
+    times,
+    prices,
+    guess=0.03,
+    lower=-0.5,
+    upper=1.0,
+    tol=1e-10,
+    max_iter=100,
+    base_rates=None,
+):
+    """현재가치가 prices가 되는 행별 할인금리 (이분법으로 보호한 뉴턴법)
+
+    뉴턴 스텝이 해를 포함하는 구간을 벗어나면 구간 중점으로 대체한다.
+    base_rates가 주어지면 현금흐름별 기준금리에 더하는 행별 스프레드
+    (Z-스프레드)를 구한다.
+
+    Parameters:
+    -----------
+    amounts, times : ndarray
+        현금흐름 금액·기간(년) 행렬
+    prices : array-like
+        목표 현재가치 (행 수)
+    guess : float or array-like
+        초기 금리 (소수)
+    lower, upper : float
+        탐색 구간 (소수)
+    tol : float
+        금리 변동폭 수렴 기준
+    max_iter : int
+        최대 반복 횟수
+    base_rates : ndarray
+        현금흐름별 기준 할인금리 (소수, amounts와 같은 형태)
+
+    Returns:
+    --------
+    tuple : (금리 또는 스프레드, 수렴 여부), 구간 안에 해가 없거나 현금흐름이
+        없는 행은 NaN
+    """
+    return pricing_kernels.newton_yields(
+        amounts,
+        times,
+        prices,
+        guess=guess,
+        lower=lower,
+        upper=upper,
+        tol=tol,
+        max_iter=max_iter,
+        base_rates=base_rates,
+    )
+
+
+def interpolate_shock_pnl(shifts, pnl_grid, shocks):
+    """충격 격자 손익에서 채권별 임의 충격의 손익 조회 (격자 사이는 선형 보간)
+
+    Parameters:
+    -----------
+    shifts : array-like
+        격자 충격 (오름차순)
+    pnl_grid : ndarray
+        격자 손익 (충격 수 × 채권 수)
+    shocks : array-like
+        채권별 충격 (채권 수) 또는 (시나리오 수 × 채권 수)
+
+    Returns:
+    --------
+    ndarray : shocks와 같은 형태의 손익 (격자 밖 충격은 끝점 손익)
+    """
+    shifts = np.asarray(shifts, dtype=float)
+    shocks = np.clip(np.asarray(shocks, dtype=float), shifts[0], shifts[-1])
+
+    lower = np.clip(
+        np.searchsorted(shifts, shocks, side="right") - 1, 0, len(shifts) - 2
+    )
+    weight = (shocks - shifts[lower]) / (shifts[lower + 1] - shifts[lower])
+    bond = np.arange(pnl_grid.shape[1])
+    return (1 - weight) * pnl_grid[lower, bond] + weight * pnl_grid[lower + 1, bond]
+
+
+def risk_measures(amounts, times, yields, method="analytic", shock=0.0001):
+    """(금액, 기간) 행렬의 행별 가격·듀레이션·PV01·컨벡서티"""
+    yields = np.asarray(yields, dtype=float)
+
+    if method == "analytic":
+        price, weighted, convex = pricing_kernels.analytic_moments(
+            amounts, times, yields
+        )
+        macaulay = _safe_divide(weighted, price)
+        modified = macaulay / (1 + yields)
+        convexity = _safe_divide(convex, price * (1 + yields) ** 2)
+        dollar_duration = modified * price
+        pv01 = dollar_duration * shock
+    elif method == "numeric":
+        down, price, up = present_value(
+            amounts, times, yields, shift=np.array([-shock, 0.0, shock])
+        )
+        modified = _safe_divide(down - up, 2 * price * shock)
+        macaulay = modified * (1 + yields)
+        convexity = _safe_divide(up + down - 2 * price, price * shock**2)
+        dollar_duration = modified * price
+        pv01 = -(up - price)
+    else:
+        raise ValueError(f"지원하지 않는 계산 방식입니다: {method}")
+
+    return {
+        "가격": price,
+        "맥컬리듀레이션": macaulay,
+        "수정듀레이션": modified,
+        "달러듀레이션": dollar_duration,
+        "PV01": pv01,
+        "컨벡서티": convexity,
+    }
+
+
+def _safe_divide(numerator, denominator):
+    """분모가 0인 경우(만기 경과 채권) 0을 반환하는 나눗셈"""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.broadcast(numerator, denominator).shape),
+        where=denominator != 0,
+    )
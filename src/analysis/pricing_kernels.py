@@ -0,0 +1,287 @@
+import numpy as np
+
+# numba가 설치되어 있으면 JIT 컴파일 커널 사용 (없으면 NumPy 구현)
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+BACKENDS = ("numba", "numpy")
+DEFAULT_BACKEND = "numba" if NUMBA_AVAILABLE else "numpy"
+
+
+def _resolve_backend(backend):
+    if backend is None:
+        return DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 계산 백엔드입니다: {backend}")
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        raise ValueError("numba가 설치되어 있지 않습니다")
+    return backend
+
+
+def _prepare(amounts, times):
+    return (
+        np.ascontiguousarray(amounts, dtype=float),
+        np.ascontiguousarray(times, dtype=float),
+    )
+
+
+def discount(amounts, times, rates, backend=None):
+    """(금액, 기간) 행렬을 시나리오별 금리로 할인한 현재가치
+
+    두 백엔드 모두 전 현금흐름에 amount × (1 + rate)^(-t)를 그대로 적용하므로
+    금리가 NaN인 행의 결과(NaN 전파 여부)도 같다.
+
+    Parameters:
+    -----------
+    amounts, times : ndarray
+        현금흐름 금액·기간(년) 행렬 (행 수 × 지급회차)
+    rates : ndarray
+        시나리오별 행 할인금리 (소수, 시나리오 수 × 행 수)
+    backend : str
+        'numba' 또는 'numpy' (기본값: numba 설치 시 numba)
+
+    Returns:
+    --------
+    ndarray : 현재가치 (시나리오 수 × 행 수)
+    """
+    amounts, times = _prepare(amounts, times)
+    rates = np.ascontiguousarray(rates, dtype=float)
+    if _resolve_backend(backend) == "numba":
+        return _discount_numba(amounts, times, rates)
+    return (amounts * (1 + rates[..., None]) ** -times).sum(axis=-1)
+
+
+def discount_cashflows(amounts, times, rates, backend=None):
+    """현금흐름별 할인금리(비평행 충격 포함)로 할인한 현재가치
+
+    Parameters:
+    -----------
+    amounts, times : ndarray
+        현금흐름 금액·기간(년) 행렬 (행 수 × 지급회차)
+    rates : ndarray
+        시나리오별 현금흐름 할인금리 (소수, 시나리오 수 × 행 수 × 지급회차)
+    backend : str
+        'numba' 또는 'numpy' (기본값: numba 설치 시 numba)
+
+    Returns:
+    --------
+    ndarray : 현재가치 (시나리오 수 × 행 수)
+    """
+    amounts, times = _prepare(amounts, times)
+    rates = np.ascontiguousarray(rates, dtype=float)
+    if _resolve_backend(backend) == "numba":
+        return _discount_cashflows_numba(amounts, times, rates)
+    return (amounts * (1 + rates) ** -times).sum(axis=-1)
+
+
+def analytic_moments(amounts, times, yields, backend=None):
+    """한 번의 순회로 가격, Σt·PV, Σt(t+1)·PV 계산 (듀레이션·컨벡서티용)
+
+    Returns:
+    --------
+    tuple : (가격, 기간 가중 현재가치 합, 컨벡서티 가중 현재가치 합)
+    """
+    amounts, times = _prepare(amounts, times)
+    yields = np.ascontiguousarray(yields, dtype=float)
+    if _resolve_backend(backend) == "numba":
+        return _analytic_moments_numba(amounts, times, yields)
+
+    pv = amounts * (1 + yields[:, None]) ** -times
+    return (
+        pv.sum(axis=1),
+        (times * pv).sum(axis=1),
+        (times * (times + 1) * pv).sum(axis=1),
+    )
+
+
+def newton_yields(
+    amounts,
+    times,
+    prices,
+    guess=0.03,
+    lower=-0.5,
+    upper=1.0,
+    tol=1e-10,
+    max_iter=100,
+    base_rates=None,
+    backend=None,
+):
+    """가격을 만족하는 행별 할인금리 (이분법으로 보호한 뉴턴법)
+
+    뉴턴 스텝이 해를 포함하는 구간을 벗어나면 구간 중점으로 대체한다.
+    행마다 독립적으로 같은 순서의 갱신을 수행하므로 두 백엔드의 반복
+    경로가 같다. 인자와 반환값은 pricing_engine.solve_yields 참고.
+    """
+    amounts, times = _prepare(amounts, times)
+    prices = np.ascontiguousarray(prices, dtype=float)
+    guess = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(guess, dtype=float), prices.shape)
+    )
+    if _resolve_backend(backend) == "numba":
+        if base_rates is None:
+            base_rates = np.zeros_like(amounts)
+        return _newton_numba(
+            amounts,
+            times,
+            prices,
+            guess,
+            np.ascontiguousarray(base_rates, dtype=float),
+            float(lower),
+            float(upper),
+            tol,
+            max_iter,
+        )
+
+    n_rows = len(prices)
+    lo = np.full(n_rows, float(lower))
+    hi = np.full(n_rows, float(upper))
+
+    # 가격은 금리에 대해 단조 감소하므로 구간 양 끝 가격으로 해 존재 여부 확인
+    price_lo = _price_and_slope(amounts, times, lo, base_rates)[0]
+    price_hi = _price_and_slope(amounts, times, hi, base_rates)[0]
+    bracketed = (price_lo >= prices) & (prices >= price_hi) & (price_lo > price_hi)
+
+    yields = np.clip(guess, lo, hi)
+    converged = np.zeros(n_rows, dtype=bool)
+    active = bracketed.copy()
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        y = yields[idx]
+        price, slope = _price_and_slope(
+            amounts[idx],
+            times[idx],
+            y,
+            None if base_rates is None else base_rates[idx],
+        )
+        value = price - prices[idx]
+
+        # 이론가격이 목표보다 높으면 해는 현재 금리보다 위쪽
+        lo[idx] = np.where(value > 0, y, lo[idx])
+        hi[idx] = np.where(value > 0, hi[idx], y)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidate = y - value / slope
+        outside = (
+            ~np.isfinite(candidate) | (candidate <= lo[idx]) | (candidate >= hi[idx])
+        )
+        candidate = np.where(outside, 0.5 * (lo[idx] + hi[idx]), candidate)
+        candidate = np.where(value == 0, y, candidate)
+
+        done = np.abs(candidate - y) < tol
+        yields[idx] = candidate
+        converged[idx] = done
+        active[idx] = ~done
+
+    yields[~bracketed] = np.nan
+    return yields, converged
+
+
+def _price_and_slope(amounts, times, yields, base_rates=None):
+    """행별 현재가치와 금리(스프레드)에 대한 미분값 (NumPy)"""
+    rates = 1 + yields[:, None]
+    if base_rates is not None:
+        rates = rates + base_rates
+    pv = amounts * rates**-times
+    return pv.sum(axis=1), -(times * pv / rates).sum(axis=1)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _discount_numba(amounts, times, rates):
+        n_scenarios, n_rows = rates.shape
+        out = np.zeros((n_scenarios, n_rows))
+        for s in prange(n_scenarios):
+            for i in range(n_rows):
+                growth = 1.0 + rates[s, i]
+                total = 0.0
+                for j in range(amounts.shape[1]):
+                    total += amounts[i, j] * growth ** -times[i, j]
+                out[s, i] = total
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _discount_cashflows_numba(amounts, times, rates):
+        n_scenarios, n_rows, n_periods = rates.shape
+        out = np.zeros((n_scenarios, n_rows))
+        for s in prange(n_scenarios):
+            for i in range(n_rows):
+                total = 0.0
+                for j in range(n_periods):
+                    total += amounts[i, j] * (1.0 + rates[s, i, j]) ** -times[i, j]
+                out[s, i] = total
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _analytic_moments_numba(amounts, times, yields):
+        n_rows = amounts.shape[0]
+        price = np.zeros(n_rows)
+        weighted = np.zeros(n_rows)
+        convex = np.zeros(n_rows)
+        for i in prange(n_rows):
+            growth = 1.0 + yields[i]
+            for j in range(amounts.shape[1]):
+                t = times[i, j]
+                pv = amounts[i, j] * growth**-t
+                price[i] += pv
+                weighted[i] += t * pv
+                convex[i] += t * (t + 1) * pv
+        return price, weighted, convex
+
+    @njit(cache=True)
+    def _row_price_and_slope(amounts, times, base_rates, i, y):
+        price = 0.0
+        slope = 0.0
+        for j in range(amounts.shape[1]):
+            rate = 1.0 + y + base_rates[i, j]
+            pv = amounts[i, j] * rate ** -times[i, j]
+            price += pv
+            slope -= times[i, j] * pv / rate
+        return price, slope
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _newton_numba(
+        amounts, times, prices, guess, base_rates, lower, upper, tol, max_iter
+    ):
+        n_rows = amounts.shape[0]
+        yields = np.full(n_rows, np.nan)
+        converged = np.zeros(n_rows, dtype=np.bool_)
+        for i in prange(n_rows):
+            lo = lower
+            hi = upper
+            price_lo = _row_price_and_slope(amounts, times, base_rates, i, lo)[0]
+            price_hi = _row_price_and_slope(amounts, times, base_rates, i, hi)[0]
+            if not (
+                price_lo >= prices[i] and prices[i] >= price_hi and price_lo > price_hi
+            ):
+                continue
+
+            y = min(max(guess[i], lo), hi)
+            for _ in range(max_iter):
+                price, slope = _row_price_and_slope(amounts, times, base_rates, i, y)
+                value = price - prices[i]
+                if value > 0:
+                    lo = y
+                else:
+                    hi = y
+
+                candidate = y - value / slope
+                if not np.isfinite(candidate) or candidate <= lo or candidate >= hi:
+                    candidate = 0.5 * (lo + hi)
+                if value == 0:
+                    candidate = y
+
+                done = abs(candidate - y) < tol
+                y = candidate
+                if done:
+                    converged[i] = True
+                    break
+            yields[i] = y
+        return yields, converged
@@ -1,96 +1,479 @@
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from src.utils.data_loader import (
+    get_data_version,
+    get_project_root,
     load_bond_info,
+    load_bond_market_panel,
+    load_govt_zero_curve,
     load_individual_bond_data,
 )
+from src.utils.date_utils import calculate_remaining_maturity
+from src.utils.bond_universe import BondUniverse
+from src.utils.holdings import Holdings
+from src.utils.yield_curve import GOVT_TENORS
+from src.analysis.pricing_engine import (
+    CashflowPricingEngine,
+    interpolate_shock_pnl,
+    solve_yields,
+)
+
+# (계산 항목, 기준일, 데이터 버전, 채권 구성, 인자)별 결과 캐시 (인스턴스 간 공유)
+# 최대 RESULT_CACHE_SIZE개까지 보관하고, 넘치면 가장 오래 쓰지 않은 항목부터 삭제
+RESULT_CACHE_SIZE = 64
+_result_cache = OrderedDict()
+
+# 인스턴스별 현금흐름 엔진·시장금리를 보관하는 최대 (기준일, 데이터 버전) 수
+ENGINE_CACHE_SIZE = 8
+
+
+def _lru_lookup(cache, key, compute, max_size):
+    """OrderedDict 캐시 조회 (없으면 계산 후 저장, 크기 초과 시 오래된 항목 삭제)"""
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    value = cache[key] = compute()
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+    return value
+
+
+def clear_result_cache(as_of=None):
+    """PV01 계산 결과 캐시 초기화 (as_of 지정 시 해당 기준일 결과만 삭제)
+
+    데이터 파일이 바뀌면 데이터 버전이 달라져 자동으로 다시 계산되므로,
+    파일 외부 요인(시장금리 직접 수정 등)으로 결과를 버려야 할 때 사용한다.
+    """
+    if as_of is None:
+        _result_cache.clear()
+        return
+    as_of = np.datetime64(pd.Timestamp(as_of).normalize(), "D")
+    for key in [key for key in _result_cache if key[1] == as_of]:
+        del _result_cache[key]
+
+
+@dataclass(frozen=True)
+class Sensitivities:
+    """기준일 채권별 민감도 묶음 (유니버스 순서, 읽기 전용 배열)
+
+    시나리오 분석이 공유하는 PV01·가격·듀레이션·컨벡서티로, 결과 캐시에
+    한 번 저장된 뒤 복사 없이 재사용된다.
+    """
+
+    as_of: np.datetime64
+    names: np.ndarray  # 종목명
+    yields: np.ndarray  # 시장금리 (소수)
+    price: np.ndarray  # 가격 (발행액 기준)
+    pv01: np.ndarray
+    modified_duration: np.ndarray
+    dollar_duration: np.ndarray
+    convexity: np.ndarray
+
+    def __post_init__(self):
+        for value in self.__dict__.values():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
 
 
 class PV01Analysis:
-    def __init__(self):
+    """
+    Parameters:
+    -----------
+    as_of : str or datetime
+        분석 기준일 (기본값: 오늘). 현금흐름 필터, 시장금리 조회, 일수 계산에 사용
+    """
+
+    def __init__(self, as_of=None):
         self.bond_info = load_bond_info()
-        self.analysis_date = datetime.now()
-
-    def calculate_cashflows(self, bond):
-        # 채권의 모든 미래 현금흐름(이자+원금) 계산
-        start_date = bond["발행일"]
-        end_date = bond["만기일"]
-        payment_freq = bond["이자지급주기"]
-        coupon_rate = bond["표면금리"] / 100
-        principal = bond["발행액"]
-
-        # 이자지급주기에 따라 payment_dates 생성
-        payment_dates = pd.date_range(
-            start=start_date, end=end_date, freq=f"{payment_freq}ME"
+        self.universe = BondUniverse.from_frame(self.bond_info)
+        self.analysis_date = (
+            pd.Timestamp(datetime.now() if as_of is None else as_of)
+            .normalize()
+            .to_pydatetime()
         )
+        # (기준일, 데이터 버전)별 현금흐름 엔진 및 시장금리 캐시
+        self._engines = OrderedDict()
+        self._market_rates = OrderedDict()
 
-        cashflows = []
-
-        # 각 지급일의 이자금액 = 발행액 × (표면금리/연간 지급횟수)
-        for date in payment_dates:
-            cf = principal * (coupon_rate / (12 / payment_freq))
-            # 만기일에는 이자 + 원금
-            if date == end_date:
-                cf += principal
-
-            cashflows.append(
-                {
-                    "date": date,
-                    "amount": cf,
-                    "days_to_cf": (date - self.analysis_date).days,
-                }
-            )
+    def _as_of(self, as_of=None):
+        """기준일을 일 단위 datetime64로 정규화 (기본값: 인스턴스 기준일)"""
+        as_of = self.analysis_date if as_of is None else as_of
+        return np.datetime64(pd.Timestamp(as_of).normalize(), "D")
 
-        return pd.DataFrame(cashflows)
+    def _cached(self, name, as_of, params, compute, copy=True):
+        """(기준일, 데이터 버전) 기준 결과 캐시 조회, 없으면 계산 후 저장
+
+        copy=False는 읽기 전용 결과(Sensitivities 등)에만 사용한다.
+        """
+        key = (
+            name,
+            as_of,
+            get_data_version(),
+            tuple(self.universe.names),
+            params,
+        )
+        value = _lru_lookup(_result_cache, key, compute, RESULT_CACHE_SIZE)
+        return value.copy() if copy else value
+
+    def invalidate(self, as_of=None):
+        """기준일의 결과 캐시·현금흐름 엔진·시장금리 캐시 삭제
+
+        as_of를 생략하면 인스턴스 기준일, 'all'이면 전체 기준일을 삭제한다.
+        """
+        if isinstance(as_of, str) and as_of == "all":
+            clear_result_cache()
+            self._engines.clear()
+            self._market_rates.clear()
+            return
+        as_of = self._as_of(as_of)
+        clear_result_cache(as_of)
+        for cache in (self._engines, self._market_rates):
+            for key in [key for key in cache if key[0] == as_of]:
+                del cache[key]
+
+    def get_engine(self, as_of=None):
+        """기준일의 현금흐름 엔진 (데이터 버전이 같으면 재사용)"""
+        as_of = self._as_of(as_of)
+        return _lru_lookup(
+            self._engines,
+            (as_of, get_data_version()),
+            lambda: CashflowPricingEngine(self.universe, as_of),
+            ENGINE_CACHE_SIZE,
+        )
 
-    def get_market_rate(self, bond_series):
-        """채권 시리즈별 최신 시장금리 불러오기"""
+    def get_market_rate(self, bond_series, as_of=None):
+        """채권 시리즈별 기준일(포함) 이전 최근 시장금리 불러오기 (없으면 NaN)"""
+        as_of = self._as_of(as_of)
         bond_data = load_individual_bond_data(bond_series)
+        bond_data = bond_data[bond_data["일자"] <= pd.Timestamp(as_of)]
+        if bond_data.empty:
+            # 기준일 현재 발행 전이거나 시장 데이터가 없는 채권
+            return np.nan
         latest_data = bond_data[bond_data["일자"] == bond_data["일자"].max()]
         return latest_data["채권평가사 평균수익률_수익률"].iloc[0] / 100
 
-    def calculate_pv01(self, cashflows, market_rate):
+    def get_market_rates(self, as_of=None, refresh=False):
+        """전 채권의 기준일 시장금리 배열 (데이터 버전이 같으면 캐시 사용)
+
+        시장 데이터 파일이 바뀌면 데이터 버전이 달라져 다시 로드하므로,
+        결과 캐시에 예전 시장금리로 계산한 값이 저장되지 않는다.
+        """
+        as_of = self._as_of(as_of)
+        key = (as_of, get_data_version())
+        if refresh:
+            self._market_rates.pop(key, None)
+        return _lru_lookup(
+            self._market_rates,
+            key,
+            lambda: np.array(
+                [
+                    self.get_market_rate(code, as_of)
+                    for code in self.universe.series_codes
+                ]
+            ),
+            ENGINE_CACHE_SIZE,
+        )
+
+    def calculate_portfolio_pv01(self, method="numeric", as_of=None):
+        """전 채권 PV01·듀레이션·컨벡서티 일괄 계산 (현금흐름 행렬 엔진 사용)
+
+        method='numeric'은 1bp 재평가(bump-and-reprice), 'analytic'은
+        현금흐름/기간 행렬에서 해석적으로 계산한다. 같은 기준일·데이터
+        버전의 결과는 캐시에서 반환한다.
+        """
+        as_of = self._as_of(as_of)
+
+        def compute():
+            measures = self.get_engine(as_of).risk_measures(
+                self.get_market_rates(as_of), method=method
+            )
+            return self._risk_table(measures)
+
+        return self._cached("portfolio_pv01", as_of, (method,), compute)
+
+    def get_sensitivities(self, method="numeric", as_of=None):
+        """시나리오 분석 공용 채권별 민감도 (기준일·데이터 버전·유니버스별 캐시)
+
+        Parameters:
+        -----------
+        method : str
+            'analytic' 또는 'numeric'
+        as_of : str or datetime
+            기준일 (기본값: 인스턴스 기준일)
+
+        Returns:
+        --------
+        Sensitivities : 읽기 전용 민감도 묶음 (호출 간 같은 객체 공유)
+        """
+        as_of = self._as_of(as_of)
+
+        def compute():
+            table = self.calculate_portfolio_pv01(method=method, as_of=as_of)
+            return Sensitivities(
+                as_of=as_of,
+                names=self.universe.names.copy(),
+                yields=np.array(self.get_market_rates(as_of), dtype=float),
+                price=table["가격"].to_numpy(dtype=float),
+                pv01=table["PV01"].to_numpy(dtype=float),
+                modified_duration=table["수정듀레이션"].to_numpy(dtype=float),
+                dollar_duration=table["달러듀레이션"].to_numpy(dtype=float),
+                convexity=table["컨벡서티"].to_numpy(dtype=float),
+            )
+
+        return self._cached("sensitivities", as_of, (method,), compute, copy=False)
+
+    def calculate_holdings_pv01(self, holdings=None, method="numeric", as_of=None):
+        """포트폴리오별 평가금액·PV01·듀레이션·컨벡서티
+
+        발행액 기준 채권별 위험지표를 보유 내역 희소 행렬(액면금액/발행액)과
+        곱해 포트폴리오별로 집계한다. 듀레이션·컨벡서티는 평가금액 가중이다.
+
+        Parameters:
+        -----------
+        holdings : Holdings
+            보유 내역 (기본값: 보유 내역 파일, 없으면 발행액 기준 단일 포트폴리오)
+        method : str
+            'analytic' 또는 'numeric'
+        as_of : str or datetime
+            기준일 (기본값: 인스턴스 기준일)
+        """
+        if holdings is None:
+            holdings = Holdings.load(self.universe)
+
+        bond_risk = self.calculate_portfolio_pv01(method=method, as_of=as_of)
+        totals = holdings.aggregate(
+            np.column_stack(
+                [
+                    bond_risk["가격"],
+                    bond_risk["PV01"],
+                    bond_risk["달러듀레이션"],
+                    bond_risk["컨벡서티"] * bond_risk["가격"],
+                ]
+            )
+        )
+        market_value = totals[:, 0]
+
+        return pd.DataFrame(
+            {
+                "포트폴리오": holdings.portfolio_names,
+                "액면금액": np.asarray(holdings.matrix.sum(axis=1)).ravel(),
+                "평가금액": market_value,
+                "PV01": totals[:, 1],
+                "달러듀레이션": totals[:, 2],
+                "수정듀레이션": totals[:, 2] / market_value,
+                "컨벡서티": totals[:, 3] / market_value,
+            }
+        )
+
+    def reprice(self, new_yields, method="analytic", as_of=None):
+        """시장금리 변경분만 반영한 PV01 재계산 (장중 재평가용)
+
+        기준일의 현금흐름·기간 행렬은 캐시된 엔진을 그대로 사용하고
+        할인 단계만 다시 계산한다. 결과 형식은 calculate_portfolio_pv01과 같다.
+
+        Parameters:
+        -----------
+        new_yields : array-like or Series
+            채권별 시장금리 (소수), Series이면 종목명 기준으로 정렬
+        method : str
+            'analytic' 또는 'numeric'
+        as_of : str or datetime
+            기준일 (기본값: 인스턴스 기준일)
         """
-        - 각 현금흐름의 현재가치 계산
-        - 기본금리와 1bp 상승 금리 각각 계산
-        - PV01 = -(충격 후 현재가치 - 기본 현재가치)
+        if isinstance(new_yields, pd.Series):
+            new_yields = new_yields.reindex(self.universe.names).to_numpy()
+        measures = self.get_engine(as_of).reprice(
+            np.asarray(new_yields, dtype=float), method=method
+        )
+        return self._risk_table(measures)
+
+    def _risk_table(self, measures):
+        """위험지표 딕셔너리를 종목별 결과 테이블로 변환"""
+        issue_amount = self.universe.notionals
+
+        results = pd.DataFrame(
+            {
+                "종목명": self.universe.names,
+                "만기": self.universe.tenors,
+                "PV01": measures["PV01"],
+                "발행액": issue_amount,
+                "PV01_per_billion": measures["PV01"] / (issue_amount / 1_000_000),
+            }
+        )
+        for column in [
+            "가격",
+            "맥컬리듀레이션",
+            "수정듀레이션",
+            "달러듀레이션",
+            "컨벡서티",
+        ]:
+            results[column] = measures[column]
+
+        return results
+
+    def calculate_shock_grid(self, shifts_bp=None, as_of=None):
+        """금리 평행이동 격자별 전 채권 완전 재평가 손익
+
+        Parameters:
+        -----------
+        shifts_bp : array-like
+            금리 충격(bp), 기본값 -300bp ~ +300bp (1bp 간격)
+        as_of : str or datetime
+            기준일 (기본값: 인스턴스 기준일)
+
+        Returns:
+        --------
+        DataFrame : 손익 곡면 (행: 충격(bp), 열: 종목명)
         """
-        total_pv_base = 0
-        total_pv_shock = 0
-        shock = 0.0001  # 1bp
-
-        for _, cf in cashflows.iterrows():
-            t = cf["days_to_cf"] / 365
-            if t > 0:
-                # 각 현금흐름을 시장금리로 할인
-                pv_base = cf["amount"] / (1 + market_rate) ** t
-                pv_shock = cf["amount"] / (1 + market_rate + shock) ** t
-
-                total_pv_base += pv_base
-                total_pv_shock += pv_shock
-
-        return -(total_pv_shock - total_pv_base)
-
-    def calculate_portfolio_pv01(self):
-        results = []
-
-        for _, bond in self.bond_info.iterrows():
-            series_code = bond["종목명"].split("우리금융지주")[1]
-            cashflows = self.calculate_cashflows(bond)
-            market_rate = self.get_market_rate(series_code)
-            pv01 = self.calculate_pv01(cashflows, market_rate)
-
-            results.append(
-                {
-                    "종목명": bond["종목명"],
-                    "만기": bond["발행시만기"],
-                    "PV01": pv01,
-                    "발행액": bond["발행액"],
-                    "PV01_per_billion": pv01 / (bond["발행액"] / 1_000_000),
-                }
+        if shifts_bp is None:
+            shifts_bp = np.arange(-300, 301)
+        shifts_bp = np.asarray(shifts_bp, dtype=float)
+        as_of = self._as_of(as_of)
+
+        def compute():
+            pnl = self.get_engine(as_of).shock_grid(
+                self.get_market_rates(as_of), shifts_bp / 10000
             )
+            return pd.DataFrame(
+                pnl,
+                index=pd.Index(shifts_bp, name="충격(bp)"),
+                columns=self.universe.names,
+            )
+
+        return self._cached("shock_grid", as_of, (shifts_bp.tobytes(),), compute)
 
-        return pd.DataFrame(results)
+    def lookup_shock_pnl(self, shock_grid, shocks_bp):
+        """충격 격자에서 채권별 충격(bp)의 재평가 손익 조회 (종목 순서는 격자 기준)"""
+        return interpolate_shock_pnl(
+            shock_grid.index.to_numpy(), shock_grid.to_numpy(), shocks_bp
+        )
+
+    def calculate_historical_pv01(self, method="analytic", save=False):
+        """전 채권·전 과거 일자의 PV01·듀레이션·컨벡서티 패널 일괄 계산
+
+        각 (채권, 일자) 관측치는 해당일 시장금리와 해당일 이후 현금흐름
+        (잔존만기)을 사용하며, 전 관측치를 한 번의 행렬 연산으로 계산한다.
+        기준일 이후 관측치는 제외한다.
+
+        Parameters:
+        -----------
+        method : str
+            'analytic' 또는 'numeric'
+        save : bool
+            True이면 data/processed/risk_data/pv01_history.csv로 저장
+
+        Returns:
+        --------
+        DataFrame : 일자·종목명별 위험지표 패널 (long format)
+        """
+        panel = load_bond_market_panel().drop(columns="가격")
+        panel = panel.dropna(subset=["수익률"])
+
+        panel = panel[
+            self.universe.contains(panel["종목명"])
+            & (panel["일자"] <= pd.Timestamp(self.analysis_date))
+        ]
+        bond_index = self.universe.indices(panel["종목명"])
+        dates = panel["일자"].to_numpy().astype("datetime64[D]")
+
+        engine = self.get_engine()
+        measures = engine.risk_measures_at(
+            bond_index, dates, panel["수익률"].to_numpy() / 100, method=method
+        )
+
+        panel["잔존만기"] = calculate_remaining_maturity(
+            self.universe.maturity_dates[bond_index], dates
+        )
+        for column, values in measures.items():
+            panel[column] = values
+        panel = panel.sort_values(["일자", "종목명"]).reset_index(drop=True)
+
+        if save:
+            output_dir = get_project_root() / "data" / "processed" / "risk_data"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            panel.to_csv(output_dir / "pv01_history.csv", index=False, encoding="utf-8")
+
+        return panel
+
+    def calculate_key_rate_pv01(self, zero_curve=None, as_of=None, pillars=None):
+        """국고채 무이표 곡선 기준만기별 키레이트 PV01 (채권 × 기준만기)
+
+        각 현금흐름은 '해당 기간 국고채 무이표금리 + 채권별 Z-스프레드'로
+        할인한다. Z-스프레드는 이 할인가격이 시장금리 기준 가격과 같아지도록
+        구하며, 기준만기 무이표금리를 삼각형 가중치로 1bp씩 올려 가치 변화를
+        계산한다. 기본 곡선·기준만기를 사용하는 경우 결과를 캐시한다.
+
+        Parameters:
+        -----------
+        zero_curve : ZeroCurve
+            국고채 무이표 할인계수 곡선 (기본값: load_govt_zero_curve())
+        as_of : str or datetime
+            기준일 (기본값: 분석 기준일)
+        pillars : array-like
+            기준만기(년) (기본값: 국고채 금리곡선 고시 만기)
+        """
+        as_of = self._as_of(as_of)
+
+        def compute(zero_curve=zero_curve, pillars=pillars):
+            if zero_curve is None:
+                zero_curve = load_govt_zero_curve()
+            if pillars is None:
+                pillars = list(GOVT_TENORS.values())
+            pillars = np.asarray(pillars, dtype=float)
+
+            engine = self.get_engine(as_of)
+            zero_rates = zero_curve.zero_rate(as_of, engine.times) / 100
+            z_spread, _ = solve_yields(
+                engine.amounts,
+                engine.times,
+                engine.price(self.get_market_rates(as_of)),
+                guess=0.005,
+                base_rates=zero_rates,
+            )
+
+            key_rate_pv01 = engine.key_rate_pv01(
+                zero_rates + z_spread[:, None], pillars
+            )
+            return pd.DataFrame(
+                key_rate_pv01,
+                index=self.universe.names,
+                columns=[f"{tenor:g}년" for tenor in pillars],
+            )
+
+        if zero_curve is not None or pillars is not None:
+            return compute()
+        return self._cached("key_rate_pv01", as_of, (), compute)
+
+    def validate_risk_measures(self, as_of=None):
+        """해석적 계산과 재평가(수치) 계산 결과 비교 보고서"""
+        engine = self.get_engine(as_of)
+        market_rates = self.get_market_rates(as_of)
+        analytic = engine.risk_measures(market_rates, method="analytic")
+        numeric = engine.risk_measures(market_rates, method="numeric")
+
+        rows = []
+        for measure in ["수정듀레이션", "PV01", "컨벡서티"]:
+            for i, bond_name in enumerate(self.universe.names):
+                difference = analytic[measure][i] - numeric[measure][i]
+                rows.append(
+                    {
+                        "종목명": bond_name,
+                        "지표": measure,
+                        "해석적": analytic[measure][i],
+                        "수치": numeric[measure][i],
+                        "차이": difference,
+                        "상대오차(%)": (
+                            difference / numeric[measure][i] * 100
+                            if numeric[measure][i] != 0
+                            else 0.0
+                        ),
+                    }
+                )
+
+        return pd.DataFrame(rows)
 
 
 if __name__ == "__main__":
@@ -98,3 +481,6 @@ if __name__ == "__main__":
     results = analysis.calculate_portfolio_pv01()
     print("\nPV01 Analysis Results:")
     print(results)
+
+    print("\nAnalytic vs Numeric Validation:")
+    print(analysis.validate_risk_measures().round(6))
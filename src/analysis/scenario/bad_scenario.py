@@ -2,138 +2,177 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from src.utils.data_loader import (
-    load_bond_info,
     load_spread_data,
     load_all_bond_data,
 )
-from src.analysis.pv01_analysis import PV01Analysis
+from src.utils.scenario_library import HYPOTHETICAL_SCENARIO_FILE, compile_scenarios
+from src.analysis.scenario.scenario_engine import (
+    ScenarioEngine,
+    ScenarioShock,
+    business_day_horizons,
+    maturity_buckets,
+    resolve_assumptions,
+)
+
+# Bad 시나리오 가정 (assumptions 인자로 일부만 바꿔 민감도 분석 가능)
+DEFAULT_ASSUMPTIONS = {
+    "interaction": 0.03,  # 금리충격손실 × 스프레드손실 상호작용 계수
+    "annual_growth": 0.2,  # 연간 스트레스 강도 증가율
+    "maturity_slope": 0.0,  # 만기 10년당 추가 강도 (Bad는 만기 무관)
+}
 
 
 class BadScenarioAnalysis:
-    def __init__(self):
-        self.pv01_analyzer = PV01Analysis()
-        self.bond_info = load_bond_info()
+    def __init__(self, as_of=None, engine=None, assumptions=None):
+        # engine을 넘기면 다른 시나리오와 민감도(PV01 등)를 공유
+        self.assumptions = resolve_assumptions(DEFAULT_ASSUMPTIONS, assumptions)
+        self.engine = engine if engine is not None else ScenarioEngine(as_of=as_of)
+        self.pv01_analyzer = self.engine.pv01_analyzer
+        self.bond_info = self.pv01_analyzer.bond_info
+        self.universe = self.engine.universe
+        self.library = compile_scenarios(HYPOTHETICAL_SCENARIO_FILE, self.universe)
         self.bond_spreads = load_spread_data()
         self.market_data = load_all_bond_data()
 
+    def rate_shock_bp(self):
+        """만기별 금리 충격 크기 (2년 이하 100bp, 5년 이하 75bp, 그 외 50bp)"""
+        return self.library.bond_shock("rate_shock").copy()
+
+    def draw_spread_widening(self, rng=None, n_samples=None):
+        """스프레드 확대 폭 (2년 이하 20~30bp, 5년 이하 30~40bp, 그 외 40~50bp)
+
+        rng(np.random.Generator)와 n_samples를 주면 (표본 수 × 채권 수) 배열을
+        추출한다 (기본값: 전역 난수 상태에서 채권별 1개).
+        """
+        low = maturity_buckets(self.universe.tenors, [20.0, 30.0, 40.0])
+        if rng is None:
+            return np.random.uniform(low, low + 10)
+        return rng.uniform(low, low + 10, size=(n_samples, len(low)))
+
+    def define_scenario(self, spread_widening=None, assumptions=None):
+        """Bad 시나리오 정의 (금리 충격 + 스프레드 확대, 기본 상호작용 3% 가정)"""
+        a = resolve_assumptions(self.assumptions, assumptions)
+        if spread_widening is None:
+            spread_widening = self.draw_spread_widening()
+        return ScenarioShock(
+            name="Bad",
+            rate_shock_bp=self.rate_shock_bp(),
+            spread_shock_bp=spread_widening,
+            interaction=a["interaction"],
+        )
+
     def apply_rate_shock(self):
         """만기별 금리 충격 시나리오 적용"""
-        results = []
-
-        # PV01 계산
-        pv01_results = self.pv01_analyzer.calculate_portfolio_pv01()
-
-        for _, bond in self.bond_info.iterrows():
-            maturity = float(bond["발행시만기"])
-
-            # 만기별 금리 충격 크기 설정
-            if maturity <= 2:
-                rate_shock = 0.01  # 100bp
-            elif maturity <= 5:
-                rate_shock = 0.0075  # 75bp
-            else:
-                rate_shock = 0.005  # 50bp
-
-            # 해당 채권의 PV01 데이터 찾기
-            bond_pv01 = pv01_results[pv01_results["종목명"] == bond["종목명"]][
-                "PV01"
-            ].iloc[0]
-
-            # 금리 충격으로 인한 손실 계산
-            rate_loss = bond_pv01 * (rate_shock * 10000)  # bp 단위로 변환
-
-            results.append(
-                {
-                    "종목명": bond["종목명"],
-                    "만기": maturity,
-                    "금리충격(bp)": rate_shock * 10000,
-                    "PV01": bond_pv01,
-                    "금리충격손실": rate_loss,
-                }
-            )
-
-        return pd.DataFrame(results)
-
-    def analyze_spread_widening(self):
-        results = []
-        pv01_results = self.pv01_analyzer.calculate_portfolio_pv01()
-
-        for _, bond in self.bond_info.iterrows():
-            maturity = float(bond["발행시만기"])
-
-            # 스프레드 확대 폭 설정
-            if maturity <= 2:
-                spread_widening = np.random.uniform(20, 30)
-            elif maturity <= 5:
-                spread_widening = np.random.uniform(30, 40)
-            else:
-                spread_widening = np.random.uniform(40, 50)
-
-            current_spread = (
-                self.bond_spreads[self.bond_spreads["종목명"] == bond["종목명"]][
-                    "스프레드"
-                ].iloc[-1]
-                * 100
-            )
-
-            # PV01 기반 손실 계산
-            bond_pv01 = pv01_results[pv01_results["종목명"] == bond["종목명"]][
-                "PV01"
-            ].iloc[0]
-            spread_loss = bond_pv01 * spread_widening
-
-            results.append(
-                {
-                    "종목명": bond["종목명"],
-                    "만기": maturity,
-                    "현재스프레드(bp)": current_spread,
-                    "스프레드확대(bp)": spread_widening,
-                    "스프레드손실": spread_loss,
-                }
-            )
-
-        return pd.DataFrame(results)
-
-    def calculate_total_impact(self):
-        """금리충격과 스프레드 확대의 복합 효과 분석"""
-        rate_impact = self.apply_rate_shock()
-        spread_impact = self.analyze_spread_widening()
-
-        total_results = pd.merge(
-            rate_impact, spread_impact[["종목명", "스프레드손실"]], on="종목명"
+        rate_shock_bp = self.rate_shock_bp()
+        result = self.engine.evaluate(
+            [ScenarioShock(name="금리충격", rate_shock_bp=rate_shock_bp)],
+            revaluation=True,
         )
 
-        # 상호작용 효과 추정 (3% 가정)
-        total_results["상호작용효과"] = (
-            total_results["금리충격손실"] * total_results["스프레드손실"] * 0.03
+        # 재평가손실: 충격 격자 조회 (PV01 선형 근사와 달리 컨벡서티 반영)
+        return pd.DataFrame(
+            {
+                "종목명": self.universe.names,
+                "만기": self.universe.tenors,
+                "금리충격(bp)": rate_shock_bp,
+                "PV01": self.engine.pv01,
+                "금리충격손실": result.components["금리충격손실"][0],
+                "재평가손실": result.components["재평가손실"][0],
+            }
         )
 
-        # 총 손실 계산
-        total_results["총손실"] = (
-            total_results["금리충격손실"]
-            + total_results["스프레드손실"]
-            + total_results["상호작용효과"]
+    def latest_spreads(self):
+        """채권별 최근 스프레드 (유니버스 순서)"""
+        latest = self.bond_spreads.drop_duplicates("종목명", keep="last")
+        return latest.set_index("종목명")["스프레드"].reindex(self.universe.names)
+
+    def analyze_spread_widening(self, spread_widening=None):
+        """스프레드 확대 영향 분석 (PV01 기반 손실)"""
+        scenario = self.define_scenario(spread_widening)
+        result = self.engine.evaluate([scenario])
+
+        return pd.DataFrame(
+            {
+                "종목명": self.universe.names,
+                "만기": self.universe.tenors,
+                "현재스프레드(bp)": self.latest_spreads().to_numpy() * 100,
+                "스프레드확대(bp)": scenario.spread_shock_bp,
+                "스프레드손실": result.components["스프레드손실"][0],
+            }
         )
 
+    def calculate_total_impact(self):
+        """금리충격과 스프레드 확대의 복합 효과 분석"""
+        scenario = self.define_scenario()
+        result = self.engine.evaluate([scenario])
+
+        total_results = self.apply_rate_shock()
+        total_results["스프레드손실"] = result.components["스프레드손실"][0]
+        total_results["상호작용효과"] = result.components["상호작용효과"][0]
+        total_results["총손실"] = result.total[0]
+
         return total_results
 
+    def simulate_spread_widening(self, n_samples=10000, seed=None, holdings=None):
+        """스프레드 확대 몬테카를로 손실 분포 (같은 seed면 같은 결과)
+
+        Parameters:
+        -----------
+        n_samples : int
+            채권별 스프레드 확대 표본 수
+        seed : int
+            난수 시드
+        holdings : Holdings
+            포트폴리오 집계용 보유 내역 (기본값: 보유 내역 파일 기준)
+
+        Returns:
+        --------
+        dict : result, bond (채권별 분포 통계), portfolio (포트폴리오별 분포 통계)
+        """
+        rng = np.random.default_rng(seed)
+        scenario = self.define_scenario(self.draw_spread_widening(rng, n_samples))
+        return self.engine.simulate(scenario, holdings)
+
+    def calculate_portfolio_losses(self, holdings=None):
+        """포트폴리오별 Bad 시나리오 손실 (기본값: 보유 내역 파일 기준)"""
+        return self.engine.portfolio_losses([self.define_scenario()], holdings)
+
+    def calculate_time_paths(self, horizons=None):
+        """경과 기간별 손실 경로 (채권 수 × 기간 수, 연간 20% 강도 증가 가정)
+
+        Parameters:
+        -----------
+        horizons : array-like
+            경과 기간 (월), 기본값: 기준일 이후 24개월간 KRX 영업일 격자
+        """
+        if horizons is None:
+            horizons = business_day_horizons(self.engine.sensitivities.as_of)
+        base_losses = self.engine.evaluate([self.define_scenario()]).total[0]
+        return self.engine.progression(
+            base_losses,
+            horizons,
+            annual_growth=self.assumptions["annual_growth"],
+            maturity_slope=self.assumptions["maturity_slope"],
+        )
+
     def analyze_time_progression(self, periods=[3, 6, 12]):
-        """시간 경과에 따른 스트레스 강도 변화 분석"""
+        """시간 경과에 따른 스트레스 강도 변화 분석 (기간별 long format)"""
         base_results = self.calculate_total_impact()
-        time_results = []
-
-        for period in periods:
-            # 기간별 스트레스 강도 조정 계수
-            intensity_factor = 1 + (period / 12) * 0.2  # 연간 20% 강도 증가 가정
-
-            period_result = base_results.copy()
-            period_result["기간(월)"] = period
-            period_result["스트레스강도"] = intensity_factor
-            period_result["기간별총손실"] = period_result["총손실"] * intensity_factor
+        paths = self.engine.progression(
+            base_results["총손실"].to_numpy(),
+            periods,
+            annual_growth=self.assumptions["annual_growth"],
+            maturity_slope=self.assumptions["maturity_slope"],
+        )
 
-            time_results.append(period_result)
+        n_bonds = len(base_results)
+        time_results = base_results.iloc[np.tile(np.arange(n_bonds), len(periods))]
+        time_results = time_results.reset_index(drop=True)
+        time_results["기간(월)"] = np.repeat(periods, n_bonds)
+        time_results["스트레스강도"] = paths.intensity.T.ravel()
+        time_results["기간별총손실"] = paths.losses.T.ravel()
 
-        return pd.concat(time_results, ignore_index=True)
+        return time_results
 
 
 def run_analysis():
@@ -1,76 +1,71 @@
 from datetime import datetime
 import pandas as pd
 import numpy as np
-from src.analysis.pv01_analysis import PV01Analysis
+from src.utils.scenario_library import HYPOTHETICAL_SCENARIO_FILE, compile_scenarios
+from src.analysis.scenario.scenario_engine import (
+    ScenarioEngine,
+    ScenarioShock,
+)
 
 
 class BaselineScenarioAnalysis:
-    def __init__(self):
-        self.pv01_analyzer = PV01Analysis()
+    def __init__(self, as_of=None, engine=None):
+        # engine을 넘기면 다른 시나리오와 민감도(PV01 등)를 공유
+        self.engine = engine if engine is not None else ScenarioEngine(as_of=as_of)
+        self.pv01_analyzer = self.engine.pv01_analyzer
         self.portfolio_pv01 = self.pv01_analyzer.calculate_portfolio_pv01()
         self.bond_info = self.pv01_analyzer.bond_info
+        self.universe = self.engine.universe
+        self.library = compile_scenarios(HYPOTHETICAL_SCENARIO_FILE, self.universe)
 
     def calculate_rate_changes(self):
         """만기별 금리 인하 폭 설정"""
-        rate_changes = []
-
-        for _, bond in self.bond_info.iterrows():
-            maturity = bond["발행시만기"]
-
-            # 만기별 금리인하 폭 차등 적용
-            if maturity <= 2:
-                rate_change = -0.0025  # -25bp
-            elif maturity <= 5:
-                rate_change = -0.0020  # -20bp
-            else:
-                rate_change = -0.0015  # -15bp
-
-            # 신용스프레드 축소 효과 추가 (-7bp)
-            total_change = rate_change - 0.0007
-
-            rate_changes.append(
-                {
-                    "종목명": bond["종목명"],
-                    "만기": maturity,
-                    "금리변동": total_change,
-                    "금리변동(bp)": total_change * 10000,
-                }
-            )
+        maturity = self.universe.tenors
+
+        # 만기별 금리인하(-25bp, -20bp, -15bp) + 신용스프레드 축소(-7bp)
+        total_change = self.library.bond_shock("baseline") / 10000
+
+        return pd.DataFrame(
+            {
+                "종목명": self.universe.names,
+                "만기": maturity,
+                "금리변동": total_change,
+                "금리변동(bp)": total_change * 10000,
+            }
+        )
 
-        return pd.DataFrame(rate_changes)
+    def define_scenario(self):
+        """Baseline 시나리오 정의 (금리 인하, 컨벡서티 효과 반영)"""
+        return ScenarioShock(
+            name="Baseline",
+            rate_shock_bp=self.calculate_rate_changes()["금리변동(bp)"].to_numpy(),
+            convexity=True,
+        )
 
     def calculate_price_changes(self):
-        """금리 변동에 따른 가격 변화 계산"""
-        rate_changes = self.calculate_rate_changes()
-        results = []
-
-        for _, row in self.portfolio_pv01.iterrows():
-            bond_rate_change = rate_changes[rate_changes["종목명"] == row["종목명"]][
-                "금리변동"
-            ].iloc[0]
-
-            # 1차 효과 (PV01)
-            price_change_linear = -row["PV01"] * (bond_rate_change * 10000)
-
-            # 컨벡서티 효과 (근사치: PV01 효과의 약 2~3% 추가)
-            convexity_effect = price_change_linear * 0.025
-
-            total_price_change = price_change_linear + convexity_effect
-            price_change_ratio = (total_price_change / row["발행액"]) * 100
-
-            results.append(
-                {
-                    "종목명": row["종목명"],
-                    "만기": row["만기"],
-                    "발행액": row["발행액"],
-                    "PV01": row["PV01"],
-                    "가격변화": total_price_change,
-                    "수익률(%)": price_change_ratio,
-                    "금리변동(bp)": bond_rate_change * 10000,
-                }
-            )
-
-        return pd.DataFrame(results)
+        """금리 변동에 따른 가격 변화 계산 (1차 PV01 효과 + 컨벡서티 효과)"""
+        scenario = self.define_scenario()
+        result = self.engine.evaluate([scenario])
+        pv01 = self.portfolio_pv01
+
+        # 가격변화는 손실의 부호 반대
+        total_price_change = -result.total[0]
+
+        return pd.DataFrame(
+            {
+                "종목명": pv01["종목명"],
+                "만기": pv01["만기"],
+                "발행액": pv01["발행액"],
+                "PV01": pv01["PV01"],
+                "가격변화": total_price_change,
+                "수익률(%)": (total_price_change / pv01["발행액"]) * 100,
+                "금리변동(bp)": scenario.rate_shock_bp,
+            }
+        )
+
+    def calculate_portfolio_losses(self, holdings=None):
+        """포트폴리오별 Baseline 시나리오 손실 (음수는 이익)"""
+        return self.engine.portfolio_losses([self.define_scenario()], holdings)
 
     def analyze_portfolio_impact(self):
         """포트폴리오 전체 영향 분석"""
@@ -0,0 +1,154 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from src.analysis.scenario.scenario_engine import progression_intensity
+
+# 작업 프로세스별 시나리오 분석 객체 (풀 초기화 시 1회 전달)
+_worker_analysis = None
+
+
+def parameter_grid(ranges):
+    """가정별 후보값의 전체 조합 (행: 변형, 열: 가정명)
+
+    Parameters:
+    -----------
+    ranges : dict
+        가정명 → 후보값 목록 (예: {'interaction': [0.1, 0.3, 0.5]})
+    """
+    names = list(ranges)
+    return pd.DataFrame(
+        list(itertools.product(*(np.atleast_1d(ranges[name]) for name in names))),
+        columns=names,
+    )
+
+
+def _init_worker(analysis):
+    global _worker_analysis
+    _worker_analysis = analysis
+
+
+def _evaluate_chunk(analysis, combos, spread_widening, horizons):
+    """변형 묶음의 채권별 기준 손실과 기간별 손실 (한 번의 엔진 평가)"""
+    scenarios = [
+        analysis.define_scenario(spread_widening, assumptions=combo) for combo in combos
+    ]
+    base_losses = analysis.engine.evaluate(scenarios).total
+
+    assumptions = pd.DataFrame([{**analysis.assumptions, **combo} for combo in combos])
+    intensity = progression_intensity(
+        analysis.universe.tenors,
+        horizons,
+        assumptions["annual_growth"].to_numpy(),
+        assumptions["maturity_slope"].to_numpy(),
+    )
+    return base_losses, base_losses[:, :, None] * intensity
+
+
+def _evaluate_in_worker(combos, spread_widening, horizons):
+    return _evaluate_chunk(_worker_analysis, combos, spread_widening, horizons)
+
+
+def run_parameter_sweep(
+    analysis,
+    ranges,
+    horizons=(3, 6, 12),
+    seed=0,
+    n_workers=None,
+    chunk_size=256,
+):
+    """시나리오 가정 민감도 분석 (가정 후보값의 전체 조합 병렬 평가)
+
+    스프레드 확대는 seed로 한 번만 추출해 모든 변형에 공통 적용하므로
+    변형 간 차이는 가정 변화만 반영한다. 조합은 chunk_size 단위로 작업
+    프로세스에 나누어 보내고, 각 프로세스는 묶음 전체를 한 번의 엔진
+    평가(변형 × 채권 행렬)로 계산한다.
+
+    Parameters:
+    -----------
+    analysis : BadScenarioAnalysis or WorstScenarioAnalysis
+        가정(assumptions)을 받는 시나리오 분석 객체
+    ranges : dict
+        가정명 → 후보값 목록 (예: {'interaction': np.linspace(0.1, 0.5, 9)})
+    horizons : sequence
+        손실을 보고할 경과 기간 (월)
+    seed : int
+        스프레드 확대 추출 난수 시드
+    n_workers : int
+        작업 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 계산)
+    chunk_size : int
+        작업 단위당 변형 수
+
+    Returns:
+    --------
+    DataFrame : 변형·종목명·기간(월)별 가정값, 기준손실, 기간별손실 (long format)
+    """
+    grid = parameter_grid(ranges)
+    horizons = np.asarray(horizons, dtype=float)
+    spread_widening = analysis.draw_spread_widening(np.random.default_rng(seed), 1)[0]
+
+    records = grid.to_dict("records")
+    chunks = [
+        records[start : start + chunk_size]
+        for start in range(0, len(records), chunk_size)
+    ]
+    n_workers = n_workers or os.cpu_count()
+
+    if n_workers == 1 or len(chunks) == 1:
+        results = [
+            _evaluate_chunk(analysis, chunk, spread_widening, horizons)
+            for chunk in chunks
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(analysis,),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _evaluate_in_worker,
+                    chunks,
+                    itertools.repeat(spread_widening),
+                    itertools.repeat(horizons),
+                )
+            )
+
+    base_losses = np.concatenate([base for base, _ in results])
+    period_losses = np.concatenate([losses for _, losses in results])
+
+    # (변형 × 채권 × 기간) 큐브를 long format으로 변환
+    n_variants, n_bonds, n_horizons = period_losses.shape
+    variant = np.repeat(np.arange(n_variants), n_bonds * n_horizons)
+    sweep = grid.iloc[variant].reset_index(drop=True)
+    sweep.insert(0, "변형", variant)
+    sweep["종목명"] = np.tile(
+        np.repeat(analysis.universe.names, n_horizons), n_variants
+    )
+    sweep["기간(월)"] = np.tile(horizons, n_variants * n_bonds)
+    sweep["기준손실"] = np.repeat(base_losses.ravel(), n_horizons)
+    sweep["기간별손실"] = period_losses.ravel()
+    return sweep
+
+
+if __name__ == "__main__":
+    from src.analysis.scenario.worst_scenario import WorstScenarioAnalysis
+
+    sweep = run_parameter_sweep(
+        WorstScenarioAnalysis(),
+        {
+            "interaction": np.linspace(0.1, 0.5, 5),
+            "illiquidity_base": np.linspace(0.02, 0.08, 4),
+            "liquidity_premium": np.linspace(0.002, 0.006, 5),
+            "annual_growth": np.linspace(0.4, 0.8, 5),
+        },
+    )
+    summary = (
+        sweep[sweep["기간(월)"] == 12]
+        .groupby(["변형", "interaction", "annual_growth"])["기간별손실"]
+        .sum()
+        .groupby(["interaction", "annual_growth"])
+        .describe()
+    )
+    print(summary)
@@ -0,0 +1,193 @@
+import itertools
+import numpy as np
+import pandas as pd
+from src.analysis.pv01_analysis import PV01Analysis
+from src.utils.holdings import Holdings
+from src.utils.yield_curve import GOVT_TENORS, key_rate_weights
+
+# 평행이동 외 기본 충격 형태 (BCBS IRRBB 금리충격 시나리오의 단기/장기 비율)
+# 단기 가중치 e^(-t/4), 장기 가중치 1 - e^(-t/4), t는 현금흐름 기간(년)
+CURVE_SHAPES = {
+    "steepening": (-0.65, 0.9),  # 단기 하락, 장기 상승
+    "flattening": (0.8, -0.6),  # 단기 상승, 장기 하락
+}
+
+# 전체 포트폴리오 대상명
+TOTAL_TARGET = "전체"
+
+
+class ReverseStressTest:
+    """역스트레스 테스트 (손실 한도를 넘는 최소 금리 충격 크기 역산)
+
+    충격 형태(평행이동, 스티프닝/플래트닝, 기준만기별 키레이트)별로
+    현금흐름 단위 금리 충격을 만들고, 충격 크기(bp)를 이분법으로 찾는다.
+    모든 (대상, 충격 형태, 손실 한도) 조합을 하나의 배치로 묶어 반복마다
+    한 번의 재평가로 계산한다.
+
+    Parameters:
+    -----------
+    pv01_analyzer : PV01Analysis
+        현금흐름 엔진과 시장금리를 제공하는 PV01 분석 객체 (기본값: 새로 생성)
+    holdings : Holdings
+        손실 집계용 보유 내역 (기본값: 보유 내역 파일 기준)
+    as_of : str or datetime
+        기준일 (pv01_analyzer를 새로 만드는 경우)
+    """
+
+    def __init__(self, pv01_analyzer=None, holdings=None, as_of=None):
+        self.pv01_analyzer = (
+            pv01_analyzer if pv01_analyzer is not None else PV01Analysis(as_of=as_of)
+        )
+        self.universe = self.pv01_analyzer.universe
+        self.holdings = (
+            holdings if holdings is not None else Holdings.load(self.universe)
+        )
+        self.engine = self.pv01_analyzer.get_engine()
+        self.yields = self.pv01_analyzer.get_sensitivities().yields
+        self.pillars = np.array(list(GOVT_TENORS.values()), dtype=float)
+
+        # 시장금리가 없는 채권은 손실 집계에서 제외
+        self.base_prices = np.nan_to_num(self.engine.price(self.yields))
+
+    @property
+    def shape_names(self):
+        """지원하는 충격 형태 (parallel, 곡선 형태, 기준만기별 키레이트)"""
+        return ["parallel", *CURVE_SHAPES, *self._pillar_labels()]
+
+    def _pillar_labels(self):
+        return [f"{tenor:g}년" for tenor in self.pillars]
+
+    def shock_shape(self, name):
+        """충격 크기 1bp당 현금흐름별 금리 충격(bp) (채권 수 × 지급회차)"""
+        times = self.engine.times
+        if name == "parallel":
+            return np.ones_like(times)
+        if name in CURVE_SHAPES:
+            short, long = CURVE_SHAPES[name]
+            short_weight = np.exp(-times / 4)
+            return short * short_weight + long * (1 - short_weight)
+        labels = self._pillar_labels()
+        if name in labels:
+            return key_rate_weights(times, self.pillars)[labels.index(name)]
+        raise ValueError(f"지원하지 않는 충격 형태입니다: {name}")
+
+    def target_weights(self, target=TOTAL_TARGET):
+        """손실 집계 가중치 (채권별 보유 비율)
+
+        target은 '전체', 포트폴리오명 또는 만기그룹 라벨(예: '3.0년')이다.
+        """
+        exposure = self.holdings.exposure
+        if target == TOTAL_TARGET:
+            return np.asarray(exposure.sum(axis=0)).ravel()
+        portfolios = list(self.holdings.portfolio_names)
+        if target in portfolios:
+            return exposure[portfolios.index(target)].toarray().ravel()
+        in_bucket = self.universe.maturity_groups == target
+        if in_bucket.any():
+            return np.asarray(exposure.sum(axis=0)).ravel() * in_bucket
+        raise ValueError(f"포트폴리오 또는 만기그룹이 아닙니다: {target}")
+
+    def losses(self, magnitudes_bp, shapes, weights):
+        """충격 크기별 집계 손실 (배치 재평가)
+
+        Parameters:
+        -----------
+        magnitudes_bp : ndarray
+            배치별 충격 크기 (bp)
+        shapes : ndarray
+            배치별 1bp당 충격 형태 (배치 수 × 채권 수 × 지급회차)
+        weights : ndarray
+            배치별 손실 집계 가중치 (배치 수 × 채권 수)
+        """
+        shifts = shapes * (np.asarray(magnitudes_bp)[:, None, None] / 10000)
+        prices = np.nan_to_num(self.engine.price_shifted(self.yields, shifts))
+        return ((self.base_prices - prices) * weights).sum(axis=1)
+
+    def solve(
+        self,
+        thresholds,
+        shapes=("parallel", "steepening"),
+        targets=(TOTAL_TARGET,),
+        max_shock_bp=1000.0,
+        tol_bp=0.01,
+        max_iter=100,
+    ):
+        """손실 한도를 처음 넘는 충격 크기 일괄 계산
+
+        충격 크기 0 ~ max_shock_bp 구간에서 손실이 한도와 같아지는 지점을
+        이분법으로 찾는다. 손실이 충격 크기에 대해 단조 증가한다고 가정하며,
+        구간 끝에서도 한도를 넘지 않으면 NaN을 반환한다.
+
+        Parameters:
+        -----------
+        thresholds : array-like
+            손실 한도 (백만원)
+        shapes : sequence
+            충격 형태명 (shape_names 참고)
+        targets : sequence
+            손실 집계 대상 ('전체', 포트폴리오명, 만기그룹 라벨)
+        max_shock_bp : float
+            탐색 상한 충격 크기 (bp)
+        tol_bp : float
+            충격 크기 수렴 기준 (bp)
+        max_iter : int
+            최대 반복 횟수
+
+        Returns:
+        --------
+        dict : summary (대상·충격형태·손실한도별 충격크기(bp), 손실, 수렴여부),
+            shocks (조합별 채권 잔존만기 기준 금리 충격(bp), 열: 종목명)
+        """
+        combos = pd.DataFrame(
+            list(itertools.product(targets, shapes, np.atleast_1d(thresholds))),
+            columns=["대상", "충격형태", "손실한도"],
+        )
+        shape_arrays = {name: self.shock_shape(name) for name in shapes}
+        weight_arrays = {target: self.target_weights(target) for target in targets}
+        batch_shapes = np.stack([shape_arrays[name] for name in combos["충격형태"]])
+        batch_weights = np.stack([weight_arrays[t] for t in combos["대상"]])
+        limits = combos["손실한도"].to_numpy(dtype=float)
+
+        lower = np.zeros(len(combos))
+        upper = np.full(len(combos), float(max_shock_bp))
+        breached = self.losses(upper, batch_shapes, batch_weights) >= limits
+        for _ in range(max_iter):
+            if np.all(upper - lower < tol_bp):
+                break
+            middle = (lower + upper) / 2
+            above = self.losses(middle, batch_shapes, batch_weights) >= limits
+            upper = np.where(above, middle, upper)
+            lower = np.where(above, lower, middle)
+
+        magnitude = np.where(breached, upper, np.nan)
+        summary = combos.copy()
+        summary["충격크기(bp)"] = magnitude
+        summary["손실"] = np.where(
+            breached,
+            self.losses(np.nan_to_num(magnitude), batch_shapes, batch_weights),
+            np.nan,
+        )
+        summary["수렴여부"] = breached & (upper - lower < tol_bp)
+
+        # 채권별 충격은 잔존만기(마지막 현금흐름 기간) 지점의 금리 충격으로 표시
+        paid = self.engine.amounts != 0
+        last = paid.shape[1] - 1 - np.argmax(paid[:, ::-1], axis=1)
+        bond_shape = batch_shapes[:, np.arange(len(self.universe)), last]
+        shocks = pd.DataFrame(
+            bond_shape * magnitude[:, None],
+            index=summary.index,
+            columns=self.universe.names,
+        )
+
+        return {"summary": summary, "shocks": shocks}
+
+
+if __name__ == "__main__":
+    reverse_stress = ReverseStressTest()
+    results = reverse_stress.solve(
+        thresholds=[50_000, 100_000, 200_000],
+        shapes=["parallel", "steepening", "3년"],
+        targets=[TOTAL_TARGET, "3.0년"],
+    )
+    print(results["summary"])
+    print(results["shocks"].round(1))
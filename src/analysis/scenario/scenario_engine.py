@@ -0,0 +1,418 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from src.analysis.pv01_analysis import PV01Analysis
+from src.utils.business_calendar import get_krx_calendar
+from src.utils.day_count import year_fraction, MATURITY_CONVENTION
+from src.utils.holdings import Holdings
+
+# 만기 구간 경계 (2년 이하, 5년 이하, 그 외)
+MATURITY_EDGES = (2, 5)
+
+# 몬테카를로 손실 분포 보고 분위수
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# 시나리오 손실 구성요소 (ScenarioResult.components 키)
+LOSS_COMPONENTS = (
+    "금리충격손실",
+    "재평가손실",
+    "스프레드손실",
+    "신용리스크손실",
+    "신용손실",
+    "상호작용효과",
+    "총손실",
+)
+
+
+def maturity_buckets(tenors, values, edges=MATURITY_EDGES):
+    """만기 구간별 값 배정 (edges 이하 구간 순서대로, 마지막 값은 나머지)"""
+    tenors = np.asarray(tenors, dtype=float)
+    conditions = [tenors <= edge for edge in edges]
+    return np.select(conditions, values[:-1], values[-1])
+
+
+def resolve_assumptions(defaults, overrides=None):
+    """기본 가정에 일부 값을 덮어쓴 가정 사전 (없는 항목이면 ValueError)"""
+    overrides = overrides or {}
+    unknown = set(overrides) - set(defaults)
+    if unknown:
+        raise ValueError(f"지원하지 않는 시나리오 가정입니다: {sorted(unknown)}")
+    return {**defaults, **overrides}
+
+
+def progression_intensity(tenors, horizons, annual_growth, maturity_slope=0.0):
+    """경과 기간별 강도 계수
+
+    강도 = (1 + 기간/12 × annual_growth) × (1 + 만기/10 × maturity_slope)
+
+    annual_growth, maturity_slope가 (변형 수) 배열이면 결과는
+    (변형 수 × 채권 수 × 기간 수), 스칼라이면 (채권 수 × 기간 수)
+    """
+    horizons = np.asarray(horizons, dtype=float)
+    annual_growth = np.asarray(annual_growth, dtype=float)[..., None, None]
+    maturity_slope = np.asarray(maturity_slope, dtype=float)[..., None, None]
+    tenors = np.asarray(tenors, dtype=float)[:, None]
+    return (1 + (horizons / 12) * annual_growth) * (1 + (tenors / 10) * maturity_slope)
+
+
+@dataclass
+class ScenarioShock:
+    """시나리오 정의 (각 값은 채권별 배열, 전 채권 공통 스칼라 또는
+    몬테카를로 표본별 (표본 수 × 채권 수) 배열)
+
+    손실 = (금리충격손실 + 스프레드손실 + 신용손실 + 상호작용효과) × 손실배수
+    """
+
+    name: str
+    rate_shock_bp: object = 0.0  # 금리 충격(bp), PV01 기반 손실
+    spread_shock_bp: object = 0.0  # 스프레드 충격(bp), PV01 기반 손실
+    credit_spread: object = 0.0  # 발행액 대비 신용손실률 (소수)
+    credit_multiplier: object = 1.0  # 신용손실 추가 배수 (예: 1 + 유동성 할인율)
+    interaction: float = 0.0  # 금리충격손실 × (스프레드손실 + 신용리스크손실) 계수
+    loss_multiplier: object = 1.0  # 최종 손실 배수 (예: 부도위험가중치)
+    convexity: bool = False  # 금리충격손실에 컨벡서티(2차) 항 반영 여부
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오 × 채권 손실 행렬 묶음"""
+
+    scenario_names: list
+    bond_names: np.ndarray
+    components: dict  # 구성요소명 → (시나리오 수 × 채권 수) 배열
+
+    @property
+    def total(self):
+        """총손실 행렬 (시나리오 수 × 채권 수)"""
+        return self.components["총손실"]
+
+    def loss_matrix(self, component="총손실"):
+        """손실 행렬 DataFrame (행: 시나리오, 열: 종목명)"""
+        return pd.DataFrame(
+            self.components[component],
+            index=pd.Index(self.scenario_names, name="시나리오"),
+            columns=self.bond_names,
+        )
+
+    def portfolio_losses(self, holdings, component="총손실"):
+        """포트폴리오별 손실 (행: 시나리오, 열: 포트폴리오)"""
+        return pd.DataFrame(
+            holdings.aggregate(self.components[component].T).T,
+            index=pd.Index(self.scenario_names, name="시나리오"),
+            columns=pd.Index(holdings.portfolio_names, name="포트폴리오"),
+        )
+
+
+def loss_distribution(losses, quantiles=DEFAULT_QUANTILES, tail=0.99, index=None):
+    """표본 손실의 분포 통계 (평균, 표준편차, 분위수, 꼬리 통계)
+
+    Parameters:
+    -----------
+    losses : ndarray
+        표본별 손실 (표본 수 × 항목 수)
+    quantiles : sequence
+        보고할 분위수 (0~1)
+    tail : float
+        꼬리 통계 신뢰수준 (VaR, 기대손실(ES) 기준)
+    index : array-like
+        항목명 (채권명, 포트폴리오명 등)
+
+    Returns:
+    --------
+    DataFrame : 항목별 분포 통계
+    """
+    losses = np.asarray(losses, dtype=float)
+    var = np.quantile(losses, tail, axis=0)
+    tail_mask = losses >= var
+    expected_shortfall = (losses * tail_mask).sum(axis=0) / tail_mask.sum(axis=0)
+
+    results = pd.DataFrame(
+        {"평균": losses.mean(axis=0), "표준편차": losses.std(axis=0, ddof=1)},
+        index=index,
+    )
+    for q, values in zip(quantiles, np.quantile(losses, quantiles, axis=0)):
+        results[f"{q:.0%}"] = values
+    results[f"VaR({tail:.0%})"] = var
+    results[f"ES({tail:.0%})"] = expected_shortfall
+    results["최대손실"] = losses.max(axis=0)
+    return results
+
+
+def horizon_grid(months=24, steps_per_month=1):
+    """경과 기간 등간격 격자 (월 단위, 첫 구간 끝 ~ months)
+
+    예: horizon_grid(24, 4)는 24개월 동안 1/4개월 간격 격자
+    (실제 영업일 격자는 business_day_horizons 사용)
+    """
+    return np.arange(1, months * steps_per_month + 1) / steps_per_month
+
+
+def business_day_horizons(as_of, months=24, calendar=None):
+    """기준일 이후 영업일별 경과 기간 격자 (월 단위)
+
+    기준일 다음 영업일부터 months개월 뒤까지의 영업일을 KRX 달력에서 구하고,
+    각 영업일까지의 기간을 만기 표기 기준(ACT/365.25)으로 월 환산한다.
+
+    Parameters:
+    -----------
+    as_of : str or datetime
+        기준일
+    months : int
+        격자 기간 (월)
+    calendar : KoreanBusinessCalendar
+        영업일 달력 (기본값: get_krx_calendar())
+    """
+    if calendar is None:
+        calendar = get_krx_calendar()
+    start = pd.Timestamp(as_of).normalize()
+    days = calendar.business_days(
+        start + pd.Timedelta(days=1), start + pd.DateOffset(months=months)
+    )
+    return year_fraction(start, days, MATURITY_CONVENTION) * 12
+
+
+@dataclass
+class ProgressionResult:
+    """경과 기간별 손실 경로 (채권 수 × 기간 수 배열)"""
+
+    horizons: np.ndarray  # 경과 기간 (월)
+    bond_names: np.ndarray
+    intensity: np.ndarray  # 채권·기간별 강도 계수
+    losses: np.ndarray  # 채권·기간별 손실
+
+    def to_frame(self, values="losses"):
+        """2차원 DataFrame (행: 종목명, 열: 기간(월))"""
+        return pd.DataFrame(
+            getattr(self, values),
+            index=pd.Index(self.bond_names, name="종목명"),
+            columns=pd.Index(self.horizons, name="기간(월)"),
+        )
+
+    def total(self, holdings=None):
+        """기간별 전체 손실 (holdings 지정 시 포트폴리오 × 기간)"""
+        if holdings is None:
+            return self.losses.sum(axis=0)
+        return holdings.aggregate(self.losses)
+
+    def breaches(self, limit):
+        """기간별 전체 손실이 한도를 처음 넘는 기간 (넘지 않으면 NaN)"""
+        breached = self.total() > limit
+        return self.horizons[breached.argmax()] if breached.any() else np.nan
+
+
+class ScenarioEngine:
+    """공통 민감도 기반 시나리오 손실 엔진
+
+    PV01·가격·컨벡서티를 한 번만 계산해 두고, 여러 시나리오의 채권별
+    충격 배열을 (시나리오 × 채권) 행렬로 쌓아 손실을 한 번에 계산한다.
+
+    Parameters:
+    -----------
+    pv01_analyzer : PV01Analysis
+        민감도 계산에 사용할 PV01 분석 객체 (기본값: 새로 생성)
+    as_of : str or datetime
+        기준일 (pv01_analyzer를 새로 만드는 경우)
+    """
+
+    def __init__(self, pv01_analyzer=None, as_of=None):
+        self.pv01_analyzer = (
+            pv01_analyzer if pv01_analyzer is not None else PV01Analysis(as_of=as_of)
+        )
+        self.universe = self.pv01_analyzer.universe
+        self.notionals = self.universe.notionals.astype(float)
+        self._load_sensitivities()
+
+    def _load_sensitivities(self):
+        # 기준일·데이터 버전·유니버스별 공용 캐시 (다른 시나리오 객체와 공유)
+        self.sensitivities = self.pv01_analyzer.get_sensitivities()
+        self.pv01 = self.sensitivities.pv01
+        self.price = self.sensitivities.price
+        self.convexity = self.sensitivities.convexity
+        self.outstanding = self.universe.outstanding(self.sensitivities.as_of)
+
+        # 시세가 없어 민감도가 NaN인 발행 채권도 손실 집계에서 제외
+        self.priced = self.outstanding & np.isfinite(
+            self.pv01 + self.price + self.convexity
+        )
+        self._shock_grid = None
+
+    def refresh(self):
+        """기준일 민감도 캐시를 비우고 다시 계산 (시장금리 수정 후 사용)"""
+        self.pv01_analyzer.invalidate()
+        self._load_sensitivities()
+
+    @property
+    def shock_grid(self):
+        """완전 재평가 손익 격자 (최초 조회 시 계산)"""
+        if self._shock_grid is None:
+            self._shock_grid = self.pv01_analyzer.calculate_shock_grid()
+        return self._shock_grid
+
+    def _rows(self, scenario):
+        """시나리오의 행 수 (표본 × 채권 배열 필드가 있으면 표본 수)"""
+        fields = [
+            scenario.rate_shock_bp,
+            scenario.spread_shock_bp,
+            scenario.credit_spread,
+            scenario.credit_multiplier,
+            scenario.loss_multiplier,
+        ]
+        return max(np.shape(value)[0] if np.ndim(value) == 2 else 1 for value in fields)
+
+    def _stack(self, scenarios, field, rows):
+        return np.concatenate(
+            [
+                np.broadcast_to(
+                    np.asarray(getattr(s, field), dtype=float), (n, len(self.pv01))
+                )
+                for s, n in zip(scenarios, rows)
+            ]
+        )
+
+    def evaluate(self, scenarios, revaluation=False, holdings=None):
+        """시나리오 목록의 채권별 손실 일괄 계산
+
+        Parameters:
+        -----------
+        scenarios : list
+            ScenarioShock 목록. 필드가 (표본 수 × 채권 수) 배열인 시나리오는
+            표본 수만큼의 행으로 펼쳐진다 (몬테카를로 표본)
+        revaluation : bool
+            True이면 금리 충격의 완전 재평가 손실(재평가손실)도 계산
+        holdings : Holdings
+            지정하면 채권별 손실을 보유 비율(액면금액/발행액)로 조정
+
+        Returns:
+        --------
+        ScenarioResult : 구성요소별 (시나리오 행 수 × 채권 수) 손실 행렬
+            (기준일 현재 발행 전이거나 상환된 채권, 민감도가 NaN인 채권의
+            손실은 0)
+        """
+        rows = [self._rows(s) for s in scenarios]
+        rate_bp = self._stack(scenarios, "rate_shock_bp", rows)
+        spread_bp = self._stack(scenarios, "spread_shock_bp", rows)
+        credit_spread = self._stack(scenarios, "credit_spread", rows)
+        credit_multiplier = self._stack(scenarios, "credit_multiplier", rows)
+        loss_multiplier = self._stack(scenarios, "loss_multiplier", rows)
+        interaction = np.repeat([s.interaction for s in scenarios], rows)[:, None]
+        convexity = np.repeat([s.convexity for s in scenarios], rows)[:, None]
+
+        # 금리충격손실: PV01 × bp (컨벡서티 반영 시 2차 항 차감)
+        rate_loss = self.pv01 * rate_bp
+        convexity_gain = 0.5 * self.convexity * self.price * (rate_bp / 10000) ** 2
+        rate_loss = np.where(convexity, rate_loss - convexity_gain, rate_loss)
+
+        spread_loss = self.pv01 * spread_bp
+        credit_base = self.notionals * credit_spread
+        credit_loss = credit_base * credit_multiplier
+        interaction_loss = interaction * rate_loss * (spread_loss + credit_base)
+        total = (
+            rate_loss + spread_loss + credit_loss + interaction_loss
+        ) * loss_multiplier
+
+        components = {
+            "금리충격손실": rate_loss,
+            "스프레드손실": spread_loss,
+            "신용리스크손실": credit_base,
+            "신용손실": credit_loss,
+            "상호작용효과": interaction_loss,
+            "총손실": total,
+        }
+        if revaluation:
+            grid = self.shock_grid
+            components["재평가손실"] = -self.pv01_analyzer.lookup_shock_pnl(
+                grid, rate_bp
+            )
+
+        # 미발행·상환 채권은 신용손실 등 발행액 기준 손실도 없음
+        components = {
+            key: np.where(self.priced, value, 0.0) for key, value in components.items()
+        }
+
+        if holdings is not None:
+            ratio = holdings.bond_face / self.notionals
+            components = {key: value * ratio for key, value in components.items()}
+
+        return ScenarioResult(
+            scenario_names=list(np.repeat([s.name for s in scenarios], rows)),
+            bond_names=self.universe.names,
+            components=components,
+        )
+
+    def simulate(self, scenario, holdings=None, quantiles=DEFAULT_QUANTILES, tail=0.99):
+        """몬테카를로 표본 시나리오의 채권별·포트폴리오별 손실 분포
+
+        Parameters:
+        -----------
+        scenario : ScenarioShock
+            (표본 수 × 채권 수) 배열 필드를 가진 시나리오
+        holdings : Holdings
+            포트폴리오 집계용 보유 내역 (기본값: 보유 내역 파일 기준)
+        quantiles : sequence
+            보고할 분위수
+        tail : float
+            꼬리 통계 신뢰수준
+
+        Returns:
+        --------
+        dict : result (표본별 ScenarioResult), bond (채권별 분포 통계),
+            portfolio (포트폴리오별 분포 통계), excluded (민감도가 NaN이라
+            손실 0으로 처리한 발행 채권의 종목명)
+        """
+        if holdings is None:
+            holdings = Holdings.load(self.universe)
+        result = self.evaluate([scenario])
+        portfolio = holdings.aggregate(result.total.T).T
+
+        return {
+            "result": result,
+            "bond": loss_distribution(
+                result.total,
+                quantiles,
+                tail,
+                index=pd.Index(self.universe.names, name="종목명"),
+            ),
+            "portfolio": loss_distribution(
+                portfolio,
+                quantiles,
+                tail,
+                index=pd.Index(holdings.portfolio_names, name="포트폴리오"),
+            ),
+            "excluded": self.universe.names[self.outstanding & ~self.priced],
+        }
+
+    def progression(self, base_losses, horizons, annual_growth, maturity_slope=0.0):
+        """경과 기간별 손실 경로 (채권 × 기간 브로드캐스트 한 번으로 계산)
+
+        Parameters:
+        -----------
+        base_losses : array-like
+            채권별 기준 손실 (유니버스 순서)
+        horizons : array-like
+            경과 기간 (월), horizon_grid(등간격) 또는
+            business_day_horizons(영업일)로 격자 생성
+        annual_growth : float
+            연간 강도 증가율 (예: 0.2는 연 20% 악화)
+        maturity_slope : float
+            만기 10년당 추가 강도 (만기가 길수록 더 큰 악화)
+
+        Returns:
+        --------
+        ProgressionResult : 채권 수 × 기간 수 강도·손실 배열
+        """
+        horizons = np.asarray(horizons, dtype=float)
+        intensity = progression_intensity(
+            self.universe.tenors, horizons, annual_growth, maturity_slope
+        )
+        return ProgressionResult(
+            horizons=horizons,
+            bond_names=self.universe.names,
+            intensity=intensity,
+            losses=np.asarray(base_losses, dtype=float)[:, None] * intensity,
+        )
+
+    def portfolio_losses(self, scenarios, holdings=None, component="총손실"):
+        """시나리오 × 포트폴리오 손실 (기본값: 보유 내역 파일 기준)"""
+        if holdings is None:
+            holdings = Holdings.load(self.universe)
+        return self.evaluate(scenarios).portfolio_losses(holdings, component)
@@ -1,133 +1,100 @@
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
 from typing import Dict, List, Tuple
 from datetime import datetime
 from src.utils.data_loader import load_bond_info, load_individual_bond_data
+from src.utils.scenario_library import HISTORICAL_SCENARIO_FILE, compile_scenarios
 from src.analysis.pv01_analysis import PV01Analysis
 
 
-@dataclass
-class HistoricalScenario:
-    name: str
-    period: Tuple[str, str]
-    rate_changes: Dict[str, Dict[str, float]]
-    description: str
-
-
 class HistoricalStressTest:
-    def __init__(self):
+    def __init__(self, as_of=None, scenario_file=HISTORICAL_SCENARIO_FILE):
         """
         PV01Analysis 클래스를 활용하여 더 정확한 PV01 계산 구현
+
+        역사적 시나리오는 시나리오 파일(config/scenarios/historical.yaml)에서
+        읽어 채권별 금리변동 배열로 컴파일한다.
         """
         self.bond_data = load_bond_info()
-        self.pv01_analyzer = PV01Analysis()
-        self.scenarios = self._define_historical_scenarios()
+        self.pv01_analyzer = PV01Analysis(as_of=as_of)
+        self.universe = self.pv01_analyzer.universe
+        self.scenarios = compile_scenarios(scenario_file, self.universe)
         self.pv01_results = self.pv01_analyzer.calculate_portfolio_pv01()
 
-    def _define_historical_scenarios(self) -> Dict[str, HistoricalScenario]:
-        """역사적 스트레스 시나리오 정의"""
-        return {
-            "covid_crisis": HistoricalScenario(
-                name="코로나 위기",
-                period=("2020-02-28", "2020-08-27"),
-                rate_changes={
-                    "급락기": {  # 2020년 2월 28일 기준
-                        1.0: -0.041,  # 1년물
-                        2.0: -0.065,  # 2년물
-                        2.99: -0.090,  # 3년물
-                        3.0: -0.090,  # 3년물
-                        5.0: -0.110,  # 5년물
-                        10.0: -0.110,  # 10년물
-                    },
-                    "최저점": {  # 2020년 8월 27일 기준
-                        1.0: 0.680,  # 1년물
-                        2.0: 0.766,  # 2년물
-                        2.99: 0.852,  # 3년물
-                        3.0: 0.852,  # 3년물
-                        5.0: 1.102,  # 5년물
-                        10.0: 1.102,  # 10년물
-                    },
-                },
-                description="코로나19 팬데믹으로 인한 금리 급락 시기",
-            ),
-            "inflation_shock": HistoricalScenario(
-                name="인플레이션 충격 및 유동성(레고렌드) 위기",
-                period=("2022-09-26", "2022-11-08"),
-                rate_changes={
-                    "급등기": {  # 2022년 9월 26일 기준
-                        1.0: 0.262,  # 1년물
-                        2.0: 0.305,  # 2년물
-                        2.99: 0.349,  # 3년물
-                        3.0: 0.349,  # 3년물
-                        5.0: 0.370,  # 5년물
-                        10.0: 0.370,  # 10년물
-                    },
-                    "최고점": {  # 2022년 11월 8일 기준
-                        1.0: 4.256,  # 1년물
-                        2.0: 4.206,  # 2년물
-                        2.99: 4.156,  # 3년물
-                        3.0: 4.156,  # 3년물
-                        5.0: 4.178,  # 5년물
-                        10.0: 4.178,  # 10년물
-                    },
-                },
-                description="2022년 하반기 인플레이션 대응 급격한 금리 인상기",
-            ),
-        }
-
     def get_current_market_data(self, bond_series: str) -> float:
-        """개별 채권의 현재 시장 수익률 조회"""
-        bond_data = load_individual_bond_data(bond_series)
-        latest_data = bond_data[bond_data["일자"] == bond_data["일자"].max()]
-        return latest_data["채권평가사 평균수익률_수익률"].iloc[0]
+        """개별 채권의 기준일 시장 수익률 조회 (%)"""
+        return self.pv01_analyzer.get_market_rate(bond_series) * 100
 
     def run_stress_test(self) -> pd.DataFrame:
         """스트레스 테스트 실행"""
-        results = []
-
-        for scenario_id, scenario in self.scenarios.items():
-            for phase, rate_changes in scenario.rate_changes.items():
-                for _, bond in self.bond_data.iterrows():
-                    maturity_group = float(bond["만기그룹"].replace("년", ""))
-
-                    if maturity_group in rate_changes:
-                        rate_change = rate_changes[maturity_group]
-                        series_code = bond["종목명"].split("우리금융지주")[1]
-
-                        # PV01 가져오기
-                        bond_pv01 = self.pv01_results[
-                            self.pv01_results["종목명"] == bond["종목명"]
-                        ]["PV01"].iloc[0]
-
-                        # 현재 시장 수익률 가져오기
-                        bond_data = load_individual_bond_data(series_code)
-                        latest_yield = bond_data.iloc[0]["채권평가사 평균수익률_수익률"]
-
-                        # 손실액 계산 (금리 상승 시 손실이 발생하므로 음수 부호 사용)
-                        loss = -bond_pv01 * abs(rate_change) * 10000  # bp 단위로 변환
-
-                        results.append(
-                            {
-                                "시나리오": scenario.name,
-                                "국면": phase,
-                                "기준일자": (
-                                    scenario.period[0]
-                                    if phase.endswith("기")
-                                    else scenario.period[1]
-                                ),
-                                "종목명": bond["종목명"],
-                                "만기그룹": bond["만기그룹"],
-                                "발행액": bond["발행액"],
-                                "금리변동(bp)": rate_change * 100,
-                                "PV01": bond_pv01,
-                                "손실액": loss,
-                                "손실률(%)": (loss / bond["발행액"]) * 100,
-                                "채권수익률": latest_yield,
-                            }
-                        )
-
-        return pd.DataFrame(results)
+        bond_pv01 = self.pv01_results["PV01"].to_numpy()
+
+        # 채권별 시장 수익률 (종목별 데이터 파일의 첫 행, 1회만 로드)
+        latest_yields = np.array(
+            [
+                load_individual_bond_data(code).iloc[0]["채권평가사 평균수익률_수익률"]
+                for code in self.universe.series_codes
+            ]
+        )
+
+        # 국면 × 채권 금리변동 (%p)
+        scenarios = self.scenarios
+        rate_change = scenarios.bond_shocks / 100
+        n_phases, n_bonds = rate_change.shape
+
+        # 손실액 계산 (금리 상승 시 손실이 발생하므로 음수 부호 사용)
+        loss = -bond_pv01 * np.abs(rate_change) * 10000  # bp 단위
+
+        def repeat(values):
+            return np.repeat(values, n_bonds)
+
+        def tile(values):
+            return np.tile(values, n_phases)
+
+        return pd.DataFrame(
+            {
+                "시나리오": repeat(scenarios.names),
+                "국면": repeat(scenarios.phases),
+                "기준일자": repeat(scenarios.dates),
+                "종목명": tile(self.universe.names),
+                "만기그룹": tile(self.universe.maturity_groups),
+                "발행액": tile(self.universe.notionals),
+                "금리변동(bp)": rate_change.ravel() * 100,
+                "PV01": tile(bond_pv01),
+                "손실액": loss.ravel(),
+                "손실률(%)": (loss / self.universe.notionals).ravel() * 100,
+                "채권수익률": tile(latest_yields),
+            }
+        )
+
+    def run_key_rate_stress_test(self) -> pd.DataFrame:
+        """키레이트 PV01 기반 스트레스 테스트
+
+        국면별 만기 구간 금리변동을 국고채 기준만기 충격 벡터로 바꾸고,
+        손익을 (국면 × 기준만기) 충격 행렬과 (채권 × 기준만기) 키레이트
+        PV01 행렬의 곱 한 번으로 계산한다.
+        """
+        key_rate_pv01 = self.pv01_analyzer.calculate_key_rate_pv01()
+        pillars = np.array([float(col.replace("년", "")) for col in key_rate_pv01])
+
+        # 국면별 금리변동을 기준만기 지점으로 보간 (국면 × 기준만기, bp)
+        shocks = self.scenarios.shocks_at(pillars)
+        pnl = -shocks @ key_rate_pv01.to_numpy().T  # 국면 × 채권
+
+        n_phases, n_bonds = pnl.shape
+        notionals = np.tile(self.universe.notionals, n_phases)
+        return pd.DataFrame(
+            {
+                "시나리오": np.repeat(self.scenarios.names, n_bonds),
+                "국면": np.repeat(self.scenarios.phases, n_bonds),
+                "기준일자": np.repeat(self.scenarios.dates, n_bonds),
+                "종목명": np.tile(key_rate_pv01.index, n_phases),
+                "만기그룹": np.tile(self.universe.maturity_groups, n_phases),
+                "발행액": notionals,
+                "손익": pnl.ravel(),
+                "손익률(%)": pnl.ravel() / notionals * 100,
+            }
+        )
 
     def analyze_results(
         self, results: pd.DataFrame
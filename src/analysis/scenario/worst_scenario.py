@@ -2,161 +2,230 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from src.utils.data_loader import (
-    load_bond_info,
     load_spread_data,
     load_all_bond_data,
 )
-from src.analysis.pv01_analysis import PV01Analysis
+from src.utils.scenario_library import HYPOTHETICAL_SCENARIO_FILE, compile_scenarios
+from src.analysis.scenario.scenario_engine import (
+    ScenarioEngine,
+    ScenarioShock,
+    business_day_horizons,
+    maturity_buckets,
+    resolve_assumptions,
+)
+
+# Worst 시나리오 가정 (assumptions 인자로 일부만 바꿔 민감도 분석 가능)
+DEFAULT_ASSUMPTIONS = {
+    "interaction": 0.3,  # 금리충격손실 × 신용리스크손실 상호작용 계수
+    "liquidity_premium": 0.004,  # 만기 10년당 기본 유동성 프리미엄
+    "stress_sensitivity": 0.1,  # 현재 스프레드 대비 유동성 프리미엄 가중
+    "illiquidity_base": 0.05,  # 유동성 부족 할인율 기본값
+    "illiquidity_slope": 0.05,  # 만기 1년당 추가 할인율 (만기/20)
+    "annual_growth": 0.6,  # 연간 위기 악화율
+    "maturity_slope": 0.2,  # 만기 10년당 추가 악화율
+}
 
 
 class WorstScenarioAnalysis:
-    def __init__(self):
-        self.pv01_analyzer = PV01Analysis()
-        self.bond_info = load_bond_info()
+    def __init__(self, as_of=None, engine=None, assumptions=None):
+        # engine을 넘기면 다른 시나리오와 민감도(PV01 등)를 공유
+        self.assumptions = resolve_assumptions(DEFAULT_ASSUMPTIONS, assumptions)
+        self.engine = engine if engine is not None else ScenarioEngine(as_of=as_of)
+        self.pv01_analyzer = self.engine.pv01_analyzer
+        self.bond_info = self.pv01_analyzer.bond_info
+        self.universe = self.engine.universe
+        self.library = compile_scenarios(HYPOTHETICAL_SCENARIO_FILE, self.universe)
         self.bond_spreads = load_spread_data()
         self.market_data = load_all_bond_data()
+        # 채권별 최근 스프레드 (유동성 프리미엄 계산마다 재사용)
+        self.current_spreads = self.latest_spreads().to_numpy()
+
+    def rate_shock_bp(self):
+        """Bad 시나리오와 동일한 만기별 금리 충격 (100bp, 75bp, 50bp)"""
+        return self.library.bond_shock("rate_shock").copy()
+
+    def draw_spread_widening(self, rng=None, n_samples=None):
+        """극단적 신용경색 상황의 스프레드 확대 (60-80bp, 100-120bp, 150-180bp)
+
+        rng(np.random.Generator)와 n_samples를 주면 (표본 수 × 채권 수) 배열을
+        추출한다 (기본값: 전역 난수 상태에서 채권별 1개).
+        """
+        maturity = self.universe.tenors
+        low = maturity_buckets(maturity, [0.006, 0.010, 0.015])
+        high = maturity_buckets(maturity, [0.008, 0.012, 0.018])
+        if rng is None:
+            return np.random.uniform(low, high)
+        return rng.uniform(low, high, size=(n_samples, len(low)))
+
+    def liquidity_premium(self, assumptions=None):
+        """심화된 유동성 프리미엄 (현재 스프레드가 높을수록 스트레스 가중)"""
+        a = resolve_assumptions(self.assumptions, assumptions)
+        base_liquidity_premium = (self.universe.tenors / 10) * a["liquidity_premium"]
+        market_stress_factor = 1 + (self.current_spreads * a["stress_sensitivity"])
+        return base_liquidity_premium * market_stress_factor
+
+    def illiquidity_discount(self, assumptions=None):
+        """유동성 부족으로 인한 추가 할인율 (기본 가정: 5%~10%)"""
+        a = resolve_assumptions(self.assumptions, assumptions)
+        return a["illiquidity_base"] + self.universe.tenors * a["illiquidity_slope"]
+
+    def define_scenario(self, spread_widening=None, assumptions=None):
+        """Worst 시나리오 정의
+
+        신용손실 = 발행액 × (스프레드 확대 + 유동성 프리미엄) × (1 + 할인율),
+        상호작용 30% 가정, 최종 손실에 부도위험가중치 적용
+        """
+        a = resolve_assumptions(self.assumptions, assumptions)
+        if spread_widening is None:
+            spread_widening = self.draw_spread_widening()
+        discount = self.illiquidity_discount(a)
+        return ScenarioShock(
+            name="Worst",
+            rate_shock_bp=self.rate_shock_bp(),
+            credit_spread=spread_widening + self.liquidity_premium(a),
+            credit_multiplier=1 + discount,
+            interaction=a["interaction"],
+            # 부도위험 가중치 (만기와 유동성 할인율 반영)
+            loss_multiplier=1 + (self.universe.tenors / 5) * (1 + discount),
+        )
 
     def apply_rate_shock(self):
         """Bad 시나리오와 동일한 금리 충격 적용"""
-        results = []
-        pv01_results = self.pv01_analyzer.calculate_portfolio_pv01()
-
-        for _, bond in self.bond_info.iterrows():
-            maturity = float(bond["발행시만기"])
-
-            # Bad 시나리오와 동일한 금리 충격
-            if maturity <= 2:
-                rate_shock = 0.01  # 100bp
-            elif maturity <= 5:
-                rate_shock = 0.0075  # 75bp
-            else:
-                rate_shock = 0.005  # 50bp
-
-            bond_pv01 = pv01_results[pv01_results["종목명"] == bond["종목명"]][
-                "PV01"
-            ].iloc[0]
-            rate_loss = bond_pv01 * (rate_shock * 10000)
-
-            results.append(
-                {
-                    "종목명": bond["종목명"],
-                    "만기": maturity,
-                    "금리충격(bp)": rate_shock * 10000,
-                    "PV01": bond_pv01,
-                    "금리충격손실": rate_loss,
-                }
-            )
-
-        return pd.DataFrame(results)
-
-    def analyze_severe_credit_crisis(self):
+        rate_shock_bp = self.rate_shock_bp()
+        result = self.engine.evaluate(
+            [ScenarioShock(name="금리충격", rate_shock_bp=rate_shock_bp)],
+            revaluation=True,
+        )
+
+        # 재평가손실: 충격 격자 조회 (PV01 선형 근사와 달리 컨벡서티 반영)
+        return pd.DataFrame(
+            {
+                "종목명": self.universe.names,
+                "만기": self.universe.tenors,
+                "금리충격(bp)": rate_shock_bp,
+                "PV01": self.engine.pv01,
+                "금리충격손실": result.components["금리충격손실"][0],
+                "재평가손실": result.components["재평가손실"][0],
+            }
+        )
+
+    def latest_spreads(self):
+        """채권별 최근 스프레드 (유니버스 순서)"""
+        latest = self.bond_spreads.drop_duplicates("종목명", keep="last")
+        return latest.set_index("종목명")["스프레드"].reindex(self.universe.names)
+
+    def _credit_frame(self, spread_widening, scenario, result):
+        """신용위기 손실 테이블"""
+        liquidity_premium = self.liquidity_premium()
+        return pd.DataFrame(
+            {
+                "종목명": self.universe.names,
+                "만기": self.universe.tenors,
+                "현재스프레드(bp)": self.latest_spreads().to_numpy() * 10000,
+                "스프레드확대(bp)": spread_widening * 10000,
+                "유동성프리미엄(bp)": liquidity_premium * 10000,
+                "할인율": scenario.credit_multiplier - 1,
+                "신용리스크손실": result.components["신용리스크손실"][0],
+                "총손실": result.components["신용손실"][0],
+            }
+        )
+
+    def analyze_severe_credit_crisis(self, spread_widening=None):
         """심각한 신용경색 상황의 스프레드 확대 분석"""
-        results = []
-
-        for _, bond in self.bond_info.iterrows():
-            maturity = float(bond["발행시만기"])
-
-            # 극단적 신용경색 상황의 스프레드 확대
-            if maturity <= 2:
-                spread_widening = np.random.uniform(0.006, 0.008)  # 60-80bp
-            elif maturity <= 5:
-                spread_widening = np.random.uniform(0.010, 0.012)  # 100-120bp
-            else:
-                spread_widening = np.random.uniform(0.015, 0.018)  # 150-180bp
-
-            current_spread = self.bond_spreads[
-                self.bond_spreads["종목명"] == bond["종목명"]
-            ]["스프레드"].iloc[-1]
-
-            # 심화된 유동성 프리미엄 (시장 경색 반영)
-            base_liquidity_premium = (maturity / 10) * 0.004  # 기본 유동성 프리미엄
-            market_stress_factor = 1 + (
-                current_spread * 0.1
-            )  # 현재 스프레드가 높을수록 스트레스 가중
-            liquidity_premium = base_liquidity_premium * market_stress_factor
-
-            total_spread_widening = spread_widening + liquidity_premium
-
-            # 신용리스크로 인한 채권가치 하락 계산
-            credit_impact = bond["발행액"] * total_spread_widening
-
-            # 유동성 부족으로 인한 추가 할인율 적용
-            illiquidity_discount = 0.05 + (maturity / 20)  # 5%~10% 할인
-            total_impact = credit_impact * (1 + illiquidity_discount)
-
-            results.append(
-                {
-                    "종목명": bond["종목명"],
-                    "만기": maturity,
-                    "현재스프레드(bp)": current_spread * 10000,
-                    "스프레드확대(bp)": spread_widening * 10000,
-                    "유동성프리미엄(bp)": liquidity_premium * 10000,
-                    "할인율": illiquidity_discount,
-                    "신용리스크손실": credit_impact,
-                    "총손실": total_impact,
-                }
-            )
-
-        return pd.DataFrame(results)
+        if spread_widening is None:
+            spread_widening = self.draw_spread_widening()
+        scenario = self.define_scenario(spread_widening)
+        return self._credit_frame(
+            spread_widening, scenario, self.engine.evaluate([scenario])
+        )
 
     def calculate_crisis_impact(self):
         """신용위기 상황의 복합 효과 분석"""
-        rate_impact = self.apply_rate_shock()
-        credit_impact = self.analyze_severe_credit_crisis()
+        spread_widening = self.draw_spread_widening()
+        scenario = self.define_scenario(spread_widening)
+        result = self.engine.evaluate([scenario])
+        credit_impact = self._credit_frame(spread_widening, scenario, result)
 
         total_results = pd.merge(
-            rate_impact,
+            self.apply_rate_shock(),
             credit_impact[
                 ["종목명", "신용리스크손실", "유동성프리미엄(bp)", "할인율", "총손실"]
             ],
             on="종목명",
         )
+        total_results["상호작용효과"] = result.components["상호작용효과"][0]
+        total_results["부도위험가중치"] = scenario.loss_multiplier
+        total_results["최종위험조정손실"] = result.total[0]
 
-        # 신용위기 상황의 강화된 상호작용 효과 (30% 가정)
-        total_results["상호작용효과"] = (
-            total_results["금리충격손실"] * total_results["신용리스크손실"] * 0.3
-        )
+        return total_results
 
-        # 부도위험 가중치 계산 (만기와 현재 스프레드 수준 반영)
-        total_results["부도위험가중치"] = total_results.apply(
-            lambda x: 1 + (x["만기"] / 5) * (1 + x["할인율"]), axis=1
+    def simulate_credit_crisis(self, n_samples=10000, seed=None, holdings=None):
+        """신용위기 스프레드 확대 몬테카를로 손실 분포 (같은 seed면 같은 결과)
+
+        Parameters:
+        -----------
+        n_samples : int
+            채권별 스프레드 확대 표본 수
+        seed : int
+            난수 시드
+        holdings : Holdings
+            포트폴리오 집계용 보유 내역 (기본값: 보유 내역 파일 기준)
+
+        Returns:
+        --------
+        dict : result, bond (채권별 분포 통계), portfolio (포트폴리오별 분포 통계)
+        """
+        rng = np.random.default_rng(seed)
+        scenario = self.define_scenario(self.draw_spread_widening(rng, n_samples))
+        return self.engine.simulate(scenario, holdings)
+
+    def calculate_portfolio_losses(self, holdings=None):
+        """포트폴리오별 Worst 시나리오 손실 (기본값: 보유 내역 파일 기준)"""
+        return self.engine.portfolio_losses([self.define_scenario()], holdings)
+
+    def calculate_crisis_paths(self, horizons=None):
+        """경과 기간별 위기 손실 경로 (채권 수 × 기간 수)
+
+        연간 60% 악화, 만기 10년당 20% 추가 악화를 가정한다.
+
+        Parameters:
+        -----------
+        horizons : array-like
+            경과 기간 (월), 기본값: 기준일 이후 24개월간 KRX 영업일 격자
+        """
+        if horizons is None:
+            horizons = business_day_horizons(self.engine.sensitivities.as_of)
+        base_losses = self.engine.evaluate([self.define_scenario()]).total[0]
+        return self.engine.progression(
+            base_losses,
+            horizons,
+            annual_growth=self.assumptions["annual_growth"],
+            maturity_slope=self.assumptions["maturity_slope"],
         )
 
-        # 최종 손실 계산
-        total_results["최종위험조정손실"] = (
-            total_results["금리충격손실"]
-            + total_results["총손실"]
-            + total_results["상호작용효과"]
-        ) * total_results["부도위험가중치"]
-
-        return total_results
-
     def analyze_crisis_progression(self, periods=[3, 6, 12]):
-        """신용위기 진행 과정 분석"""
+        """신용위기 진행 과정 분석 (기간별 long format)"""
         base_results = self.calculate_crisis_impact()
-        crisis_results = []
-
-        for period in periods:
-            # 신용위기 진행에 따른 비선형적 악화
-            intensity_factor = 1 + (period / 12) * 0.6  # 연간 60% 악화
-
-            # 만기별 차별적 악화 반영
-            period_result = base_results.copy()
-            period_result["기간(월)"] = period
-            period_result["위기강도"] = intensity_factor
-
-            # 만기가 길수록 더 큰 악화 가정
-            period_result["만기조정위기강도"] = period_result.apply(
-                lambda x: intensity_factor * (1 + (x["만기"] / 10) * 0.2), axis=1
-            )
-
-            period_result["기간별조정손실"] = (
-                period_result["최종위험조정손실"] * period_result["만기조정위기강도"]
-            )
+        paths = self.engine.progression(
+            base_results["최종위험조정손실"].to_numpy(),
+            periods,
+            annual_growth=self.assumptions["annual_growth"],
+            maturity_slope=self.assumptions["maturity_slope"],
+        )
 
-            crisis_results.append(period_result)
+        n_bonds = len(base_results)
+        crisis_results = base_results.iloc[
+            np.tile(np.arange(n_bonds), len(periods))
+        ].reset_index(drop=True)
+        crisis_results["기간(월)"] = np.repeat(periods, n_bonds)
+        crisis_results["위기강도"] = np.repeat(
+            1 + (np.asarray(periods) / 12) * self.assumptions["annual_growth"],
+            n_bonds,
+        )
+        crisis_results["만기조정위기강도"] = paths.intensity.T.ravel()
+        crisis_results["기간별조정손실"] = paths.losses.T.ravel()
 
-        return pd.concat(crisis_results, ignore_index=True)
+        return crisis_results
 
 
 def run_worst_case_analysis():
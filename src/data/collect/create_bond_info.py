@@ -1,5 +1,7 @@
 import pandas as pd
 from datetime import datetime
+from src.utils.date_utils import calculate_remaining_maturity
+from src.utils.day_count import year_fraction, MATURITY_CONVENTION
 
 # 채권 기본 정보 데이터 생성
 bond_data = {
@@ -100,11 +102,13 @@ df["만기일"] = pd.to_datetime(df["만기일"])
 
 
 # 발행시 만기 계산 (연단위)
-df["발행시만기"] = ((df["만기일"] - df["발행일"]).dt.days / 365.25).round(2)
+df["발행시만기"] = year_fraction(df["발행일"], df["만기일"], MATURITY_CONVENTION).round(
+    2
+)
 
 # 현재 시점 기준 잔존만기 계산
 current_date = pd.Timestamp("2024-11-25")  # 현재 날짜
-df["잔존만기"] = ((df["만기일"] - current_date).dt.days / 365.25).round(2)
+df["잔존만기"] = calculate_remaining_maturity(df["만기일"], current_date)
 
 # 만기그룹은 발행시만기 기준으로 표시
 df["만기그룹"] = df["발행시만기"].astype(str) + "년"
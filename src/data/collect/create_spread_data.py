@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from pathlib import Path
+from src.utils.yield_curve import GovtYieldCurve
+from src.utils.date_utils import calculate_remaining_maturity
 
 
 def load_data():
@@ -23,69 +25,58 @@ def load_data():
     return woori_bonds, govt_rates
 
 
-def find_matching_govt_rate(row, govt_rates):
-    """각 회사채의 발행시만기에 맞는 국고채 금리를 찾는 함수"""
-    maturity = row["발행시만기"]
+def calculate_spreads(method="monotone"):
+    """스프레드 계산 및 데이터셋 생성
 
-    if maturity <= 1:
-        return govt_rates["국고채권(1년)"]
-    elif maturity <= 3:
-        return govt_rates["국고채권(3년)"]
-    elif maturity <= 5:
-        return govt_rates["국고채권(5년)"]
-    else:
-        return govt_rates["국고채권(10년)"]
-
-
-def calculate_spreads():
-    """스프레드 계산 및 데이터셋 생성"""
+    국고채 금리는 고시된 전 만기(통안증권 91일~국고채 10년)를 보간한
+    금리곡선에서 각 채권의 관측일자 기준 잔존만기에 맞춰 조회한다.
+    무이표 곡선 대비 Z스프레드는 PriceYieldAnalysis.spread_table에서 계산한다.
+    """
     # 데이터 로드
     woori_bonds, govt_rates = load_data()
+    govt_curve = GovtYieldCurve(govt_rates, method=method)
 
-    # 결과를 저장할 리스트
-    spread_data_list = []
-
-    # 각 채권별로 스프레드 계산
+    # 전 채권의 시장 데이터를 하나의 테이블로 결합
+    market_data_list = []
     for _, bond in woori_bonds.iterrows():
         # 채권 코드로 해당 채권의 시장 데이터 파일 경로 생성
         bond_market_data_path = f"data/processed/market_data/woori_bond_data_{bond['종목명'].split('우리금융지주')[1]}.csv"
 
         try:
-            # 해당 채권의 시장 데이터 로드
             bond_market_data = pd.read_csv(bond_market_data_path, parse_dates=["일자"])
+        except FileNotFoundError:
+            print(f"Warning: Market data not found for {bond['종목명']}")
+            continue
 
-            # 정부채 데이터와 날짜 기준으로 병합
-            merged_data = pd.merge(bond_market_data, govt_rates, on="일자", how="inner")
-
-            # 해당 만기에 맞는 국고채 금리 선택
-            govt_rate = find_matching_govt_rate(bond, merged_data)
-
-            # 스프레드 계산
-            merged_data["스프레드"] = (
-                merged_data["채권평가사 평균수익률_수익률"] - govt_rate
-            )
+        bond_market_data["종목명"] = bond["종목명"]
+        market_data_list.append(bond_market_data)
 
-            # 결과 데이터 구성
-            result_data = pd.DataFrame(
-                {
-                    "일자": merged_data["일자"],
-                    "종목명": bond["종목명"],
-                    "발행시만기": bond["발행시만기"],
-                    "잔존만기": bond["잔존만기"],
-                    "회사채수익률": merged_data["채권평가사 평균수익률_수익률"],
-                    "국고채수익률": govt_rate,
-                    "스프레드": merged_data["스프레드"],
-                }
-            )
+    market_data = pd.concat(market_data_list, ignore_index=True).merge(
+        woori_bonds[["종목명", "발행시만기", "만기일"]], on="종목명"
+    )
 
-            spread_data_list.append(result_data)
+    # 국고채 금리가 고시된 일자만 사용
+    market_data = market_data[market_data["일자"].isin(govt_rates["일자"])].copy()
 
-        except FileNotFoundError:
-            print(f"Warning: Market data not found for {bond['종목명']}")
-            continue
+    # 관측일자별 잔존만기 (채권·일자 쌍 일괄 계산)
+    market_data["잔존만기"] = calculate_remaining_maturity(
+        market_data["만기일"], market_data["일자"]
+    )
 
-    # 전체 데이터 합치기
-    final_spread_data = pd.concat(spread_data_list, ignore_index=True)
+    # 만기 매칭 국고채 금리 (전 채권·전 일자 일괄 조회)
+    govt_yield = govt_curve.rate(market_data["일자"], market_data["잔존만기"])
+
+    final_spread_data = pd.DataFrame(
+        {
+            "일자": market_data["일자"],
+            "종목명": market_data["종목명"],
+            "발행시만기": market_data["발행시만기"],
+            "잔존만기": market_data["잔존만기"],
+            "회사채수익률": market_data["채권평가사 평균수익률_수익률"],
+            "국고채수익률": govt_yield,
+            "스프레드": market_data["채권평가사 평균수익률_수익률"] - govt_yield,
+        }
+    ).reset_index(drop=True)
 
     # 결과 저장
     output_dir = Path("data/processed/spread_data")
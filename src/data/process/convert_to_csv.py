@@ -1,45 +1,185 @@
 import pandas as pd
 import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 
 # 입력/출력 경로 설정
 raw_data_path = "data/raw/market_data"
 processed_data_path = "data/processed/market_data"
 
+# 변환된 원본 파일의 해시 기록 (변경되지 않은 파일은 다시 변환하지 않음)
+manifest_path = f"{processed_data_path}/.convert_manifest.json"
+
+# 지원하는 출력 형식
+OUTPUT_FORMATS = ("csv", "parquet")
+
 # 디렉토리가 없으면 생성
 if not os.path.exists(processed_data_path):
     os.makedirs(processed_data_path)
 
 
+def file_hash(path, chunk_size=1 << 20):
+    """원본 파일의 SHA-256 해시 계산"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest():
+    """변환 기록 로드"""
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest):
+    """변환 기록 저장"""
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def write_outputs(df, output_stem, formats):
+    """확장자를 제외한 출력 경로에 지정된 형식으로 저장"""
+    for fmt in formats:
+        if fmt == "csv":
+            df.to_csv(f"{output_stem}.csv", index=False, encoding="utf-8")
+        elif fmt == "parquet":
+            # pyarrow 또는 fastparquet 필요
+            df.to_parquet(f"{output_stem}.parquet", index=False)
+        else:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {fmt}")
+
+
+# 국고채/통안채 데이터 변환 (Excel)
+def convert_govt_bond_rates_file(source, output_stem, formats):
+    df = pd.read_excel(source)
+    write_outputs(df, output_stem, formats)
+    return source
+
+
+# 회사채 유통수익률 데이터 변환 (txt)
+def convert_woori_bond_yield_file(source, output_stem, formats):
+    df = pd.read_csv(source, delimiter=",")  # 구분자는 실제 파일에 맞게 조정
+    write_outputs(df, output_stem, formats)
+    return source
+
+
+def govt_bond_rates_jobs():
+    """국고채 금리 변환 작업 목록"""
+    return [
+        (
+            convert_govt_bond_rates_file,
+            f"{raw_data_path}/govt_bond_rates.xls",
+            f"{processed_data_path}/govt_bond_rates",
+        )
+    ]
+
+
+def woori_bond_yields_jobs():
+    """회사채 유통수익률 변환 작업 목록"""
+    jobs = []
+    for file in sorted(os.listdir(f"{raw_data_path}/woori_bond_yields")):
+        if file.endswith(".txt"):
+            # 파일명에서 확장자 제거
+            output_stem = os.path.splitext(file)[0]
+            jobs.append(
+                (
+                    convert_woori_bond_yield_file,
+                    f"{raw_data_path}/woori_bond_yields/{file}",
+                    f"{processed_data_path}/{output_stem}",
+                )
+            )
+    return jobs
+
+
+def run_conversions(jobs, formats=("csv",), force=False, max_workers=None):
+    """변경된 원본 파일만 프로세스 풀에서 병렬 변환
+
+    Parameters:
+    -----------
+    jobs : list
+        (변환 함수, 원본 경로, 확장자를 제외한 출력 경로) 목록
+    formats : tuple
+        출력 형식 ('csv', 'parquet')
+    force : bool
+        해시와 관계없이 모두 다시 변환
+    max_workers : int
+        프로세스 수 (기본값: CPU 수)
+
+    Returns:
+    --------
+    list : 실제로 변환된 원본 파일 목록
+    """
+    for fmt in formats:
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {fmt}")
+
+    manifest = load_manifest()
+    pending = []
+    hashes = {}
+
+    for func, source, output_stem in jobs:
+        hashes[source] = file_hash(source)
+        record = manifest.get(source, {})
+        outputs_exist = all(os.path.exists(f"{output_stem}.{fmt}") for fmt in formats)
+        unchanged = (
+            record.get("hash") == hashes[source]
+            and set(formats) <= set(record.get("formats", []))
+            and outputs_exist
+        )
+        if force or not unchanged:
+            pending.append((func, source, output_stem))
+
+    if not pending:
+        return []
+
+    # 변환 대상이 하나면 프로세스 생성 비용 없이 바로 실행
+    if len(pending) == 1:
+        func, source, output_stem = pending[0]
+        converted = [func(source, output_stem, formats)]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(func, source, output_stem, formats)
+                for func, source, output_stem in pending
+            ]
+            converted = [future.result() for future in futures]
+
+    for source in converted:
+        manifest[source] = {"hash": hashes[source], "formats": sorted(formats)}
+    save_manifest(manifest)
+
+    return converted
+
+
 # 국고채/통안채 데이터 처리
-def process_govt_bond_rates():
-    # Excel 파일 읽기
-    df = pd.read_excel(f"{raw_data_path}/govt_bond_rates.xls")
-    # CSV로 저장
-    df.to_csv(
-        f"{processed_data_path}/govt_bond_rates.csv", index=False, encoding="utf-8"
-    )
+def process_govt_bond_rates(formats=("csv",), force=False):
+    return run_conversions(govt_bond_rates_jobs(), formats=formats, force=force)
 
 
 # 회사채 유통수익률 데이터 처리
-def process_woori_bond_yields():
-    for file in os.listdir(f"{raw_data_path}/woori_bond_yields"):
-        if file.endswith(".txt"):
-            # txt 파일 읽기
-            df = pd.read_csv(
-                f"{raw_data_path}/woori_bond_yields/{file}", delimiter=","
-            )  # 구분자는 실제 파일에 맞게 조정
+def process_woori_bond_yields(formats=("csv",), force=False, max_workers=None):
+    return run_conversions(
+        woori_bond_yields_jobs(), formats=formats, force=force, max_workers=max_workers
+    )
 
-            # 파일명에서 확장자 제거
-            output_filename = os.path.splitext(file)[0] + ".csv"
 
-            # CSV로 저장
-            df.to_csv(
-                f"{processed_data_path}/{output_filename}",
-                index=False,
-                encoding="utf-8",
-            )
+# 전체 시장 데이터 처리 (Excel 변환도 같은 프로세스 풀에서 병렬 실행)
+def process_market_data(formats=("csv",), force=False, max_workers=None):
+    return run_conversions(
+        govt_bond_rates_jobs() + woori_bond_yields_jobs(),
+        formats=formats,
+        force=force,
+        max_workers=max_workers,
+    )
 
 
 if __name__ == "__main__":
-    process_govt_bond_rates()
-    process_woori_bond_yields()
+    converted = process_market_data()
+    print(f"변환된 파일: {len(converted)}개")
+    for source in converted:
+        print(f" - {source}")
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+from src.utils.data_loader import load_bond_info
+
+# 종목명 앞의 발행사명 (나머지가 시리즈 코드)
+ISSUER_PREFIX = "우리금융지주"
+
+
+@dataclass(frozen=True)
+class BondUniverse:
+    """배열 기반 채권 유니버스
+
+    채권 기본 정보를 컬럼별 연속 배열로 보관한다. 채권 ID는 배열 위치
+    (0 ~ n-1)이며, 종목명 → ID 조회는 사전으로 처리한다.
+    """
+
+    names: np.ndarray  # 종목명
+    series_codes: np.ndarray  # 시리즈 코드 (예: '8-1')
+    issue_dates: np.ndarray  # 발행일, datetime64[D]
+    maturity_dates: np.ndarray  # 만기일, datetime64[D]
+    coupon_rates: np.ndarray  # 표면금리 (소수)
+    payment_freq: np.ndarray  # 이자지급주기 (월)
+    notionals: np.ndarray  # 발행액 (백만원)
+    tenors: np.ndarray  # 발행시만기 (년)
+    maturity_groups: np.ndarray  # 만기그룹 라벨 (예: '1.0년')
+    name_index: dict = field(init=False, repr=False, compare=False)
+    _lookup: pd.Index = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "name_index", {name: i for i, name in enumerate(self.names)}
+        )
+        object.__setattr__(self, "_lookup", pd.Index(self.names))
+
+    @classmethod
+    def from_frame(cls, bond_info):
+        """채권 기본 정보 DataFrame으로 생성"""
+        names = bond_info["종목명"].to_numpy(dtype=object)
+        if "만기그룹" in bond_info:
+            maturity_groups = bond_info["만기그룹"].to_numpy(dtype=object)
+        else:
+            maturity_groups = np.array(
+                [f"{tenor}년" for tenor in bond_info["발행시만기"]], dtype=object
+            )
+
+        return cls(
+            names=names,
+            series_codes=np.array(
+                [name.removeprefix(ISSUER_PREFIX) for name in names], dtype=object
+            ),
+            issue_dates=bond_info["발행일"].to_numpy().astype("datetime64[D]"),
+            maturity_dates=bond_info["만기일"].to_numpy().astype("datetime64[D]"),
+            coupon_rates=bond_info["표면금리"].to_numpy(dtype=float) / 100,
+            payment_freq=bond_info["이자지급주기"].to_numpy(dtype=np.int64),
+            notionals=bond_info["발행액"].to_numpy(),
+            tenors=bond_info["발행시만기"].to_numpy(dtype=float),
+            maturity_groups=maturity_groups,
+        )
+
+    @classmethod
+    def load(cls):
+        """채권 기본 정보 파일로 생성"""
+        return cls.from_frame(load_bond_info())
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def ids(self):
+        """채권 ID 배열"""
+        return np.arange(len(self.names))
+
+    def index_of(self, name):
+        """종목명의 채권 ID"""
+        try:
+            return self.name_index[name]
+        except KeyError:
+            raise KeyError(f"유니버스에 없는 종목입니다: {name}") from None
+
+    def indices(self, names):
+        """종목명 배열의 채권 ID 배열"""
+        ids = self._lookup.get_indexer(np.asarray(names, dtype=object))
+        if np.any(ids < 0):
+            missing = np.asarray(names, dtype=object)[ids < 0]
+            raise KeyError(f"유니버스에 없는 종목입니다: {', '.join(missing[:5])}")
+        return ids
+
+    def contains(self, names):
+        """종목명 배열의 유니버스 포함 여부"""
+        return self._lookup.get_indexer(np.asarray(names, dtype=object)) >= 0
+
+    def subset(self, ids):
+        """채권 ID 배열로 부분 유니버스 생성 (ID는 새로 부여)"""
+        ids = np.asarray(ids)
+        return BondUniverse(
+            names=self.names[ids],
+            series_codes=self.series_codes[ids],
+            issue_dates=self.issue_dates[ids],
+            maturity_dates=self.maturity_dates[ids],
+            coupon_rates=self.coupon_rates[ids],
+            payment_freq=self.payment_freq[ids],
+            notionals=self.notionals[ids],
+            tenors=self.tenors[ids],
+            maturity_groups=self.maturity_groups[ids],
+        )
+
+    def outstanding(self, as_of):
+        """기준일 현재 발행 후 미상환 채권 여부 (load_bond_info_as_of와 같은 기준)"""
+        as_of = np.datetime64(pd.Timestamp(as_of).normalize(), "D")
+        return (self.issue_dates <= as_of) & (self.maturity_dates > as_of)
+
+    def to_series(self, values, name=None):
+        """채권별 값 배열을 종목명 인덱스 Series로 변환"""
+        return pd.Series(values, index=pd.Index(self.names, name="종목명"), name=name)
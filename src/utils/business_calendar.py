@@ -0,0 +1,174 @@
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# 기본 KRX 휴장일 파일 (일자, 휴일명)
+DEFAULT_HOLIDAY_FILE = (
+    Path(__file__).parent.parent.parent
+    / "data"
+    / "raw"
+    / "calendar"
+    / "krx_holidays.csv"
+)
+
+# 기본 달력 구간
+DEFAULT_START = "2000-01-01"
+DEFAULT_END = "2050-12-31"
+
+ADJUST_CONVENTIONS = ("following", "preceding", "modified_following", "unadjusted")
+
+
+def load_holidays(file_path=DEFAULT_HOLIDAY_FILE):
+    """휴장일 파일 로드 (첫 번째 컬럼을 일자로 사용, 파일이 없으면 빈 배열)"""
+    file_path = Path(file_path)
+    if not file_path.exists():
+        return np.array([], dtype="datetime64[D]")
+
+    df = pd.read_csv(file_path)
+    return pd.to_datetime(df.iloc[:, 0]).to_numpy().astype("datetime64[D]")
+
+
+class KoreanBusinessCalendar:
+    """영업일 비트맵 기반 한국 영업일 달력
+
+    구간 내 모든 날짜의 영업일 여부와 누적 영업일 수를 미리 계산해 두고,
+    영업일 판정·조정·계산을 배열 인덱싱만으로 처리한다.
+
+    Parameters:
+    -----------
+    holidays : array-like
+        주말 외 휴장일 목록
+    start, end : str or datetime
+        달력 구간 (구간 밖 날짜 조회 시 ValueError)
+    """
+
+    def __init__(self, holidays=(), start=DEFAULT_START, end=DEFAULT_END):
+        self.start = np.datetime64(pd.Timestamp(start), "D")
+        self.end = np.datetime64(pd.Timestamp(end), "D")
+        n_days = int((self.end - self.start).astype(int)) + 1
+
+        # 1970-01-01(목요일) 기준 요일 계산 (월=0 ... 일=6)
+        days = self.start + np.arange(n_days)
+        weekday = (days.astype(int) + 3) % 7
+        self.bitmap = weekday < 5
+
+        holidays = np.asarray(holidays, dtype="datetime64[D]")
+        holidays = holidays[(holidays >= self.start) & (holidays <= self.end)]
+        self.bitmap[(holidays - self.start).astype(int)] = False
+
+        # cum_count[i] = 구간 시작일부터 i번째 날 전날까지의 영업일 수
+        self.cum_count = np.concatenate([[0], np.cumsum(self.bitmap)])
+
+        # 각 날짜 기준 당일 포함 다음/이전 영업일 인덱스 (없으면 구간 밖 값)
+        index = np.arange(n_days)
+        self._following = np.minimum.accumulate(
+            np.where(self.bitmap, index, n_days)[::-1]
+        )[::-1]
+        self._preceding = np.maximum.accumulate(np.where(self.bitmap, index, -1))
+
+    @classmethod
+    def from_file(
+        cls, file_path=DEFAULT_HOLIDAY_FILE, start=DEFAULT_START, end=DEFAULT_END
+    ):
+        """휴장일 파일로 달력 생성"""
+        return cls(load_holidays(file_path), start=start, end=end)
+
+    def _index(self, dates):
+        index = (np.asarray(dates, dtype="datetime64[D]") - self.start).astype(int)
+        if np.any((index < 0) | (index >= len(self.bitmap))):
+            raise ValueError(
+                f"달력 구간({self.start} ~ {self.end}) 밖의 날짜가 포함되어 있습니다"
+            )
+        return index
+
+    def _to_dates(self, index):
+        if np.any((index < 0) | (index >= len(self.bitmap))):
+            raise ValueError(
+                f"달력 구간({self.start} ~ {self.end}) 안에 해당 영업일이 없습니다"
+            )
+        return self.start + index
+
+    def is_business_day(self, dates):
+        """영업일 여부 (스칼라 또는 배열)"""
+        return self.bitmap[self._index(dates)]
+
+    def adjust(self, dates, convention="following"):
+        """영업일 조정
+
+        Parameters:
+        -----------
+        dates : array-like
+            조정할 날짜
+        convention : str
+            'following': 다음 영업일, 'preceding': 이전 영업일,
+            'modified_following': 다음 영업일이 다음 달이면 이전 영업일,
+            'unadjusted': 조정하지 않음
+
+        Returns:
+        --------
+        ndarray : 조정된 날짜 (datetime64[D])
+        """
+        if convention not in ADJUST_CONVENTIONS:
+            raise ValueError(f"지원하지 않는 영업일 조정 방식입니다: {convention}")
+
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        if convention == "unadjusted":
+            return dates
+
+        index = self._index(dates)
+        if convention == "preceding":
+            return self._to_dates(self._preceding[index])
+
+        following = self._to_dates(self._following[index])
+        if convention == "following":
+            return following
+
+        month_changed = following.astype("datetime64[M]") != dates.astype(
+            "datetime64[M]"
+        )
+        if not np.any(month_changed):
+            return following
+        preceding = self._to_dates(self._preceding[index])
+        return np.where(month_changed, preceding, following)
+
+    def next_business_day(self, dates):
+        """다음 영업일 (당일 제외)"""
+        return self.adjust(np.asarray(dates, dtype="datetime64[D]") + 1, "following")
+
+    def previous_business_day(self, dates):
+        """이전 영업일 (당일 제외)"""
+        return self.adjust(np.asarray(dates, dtype="datetime64[D]") - 1, "preceding")
+
+    def business_days_between(self, start_dates, end_dates):
+        """[시작일, 종료일) 구간의 영업일 수 (종료일이 앞서면 음수)"""
+        start_index = self._index(start_dates)
+        end_index = self._index(end_dates)
+        return self.cum_count[end_index] - self.cum_count[start_index]
+
+    def add_business_days(self, dates, n_days):
+        """영업일 기준 n일 이동 (휴일은 다음 영업일로 조정 후 이동)"""
+        index = self._following[self._index(dates)]
+        if np.any(index >= len(self.bitmap)):
+            raise ValueError(
+                f"달력 구간({self.start} ~ {self.end}) 안에 해당 영업일이 없습니다"
+            )
+        target = self.cum_count[index] + np.asarray(n_days)
+        result = np.searchsorted(self.cum_count, target + 1, side="left") - 1
+        if np.any((target < 0) | (target >= self.cum_count[-1])):
+            raise ValueError(
+                f"달력 구간({self.start} ~ {self.end}) 안에 해당 영업일이 없습니다"
+            )
+        return self.start + result
+
+    def business_days(self, start_date, end_date):
+        """구간 내 영업일 목록"""
+        start_index, end_index = self._index([start_date, end_date])
+        index = np.flatnonzero(self.bitmap[start_index : end_index + 1]) + start_index
+        return pd.DatetimeIndex(self.start + index)
+
+
+@lru_cache(maxsize=1)
+def get_krx_calendar():
+    """기본 KRX 영업일 달력 (휴장일 파일 기준, 최초 1회 생성)"""
+    return KoreanBusinessCalendar.from_file()
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+from src.utils.business_calendar import get_krx_calendar
+
+
+@dataclass(frozen=True)
+class CouponSchedule:
+    """전 채권의 이자지급 스케줄 (CSR 형태)
+
+    채권 i의 지급일은 dates[offsets[i]:offsets[i + 1]] 이며,
+    마지막 지급일은 만기일(원금 상환일)이다.
+    """
+
+    dates: np.ndarray  # 지급일 (영업일 조정 후), datetime64[D]
+    unadjusted_dates: np.ndarray  # 조정 전 지급일 (이자계산 기간 경계)
+    accrual_starts: np.ndarray  # 각 지급일의 이자계산 시작일
+    offsets: np.ndarray  # 채권별 시작 위치 (길이 = 채권 수 + 1)
+
+    @property
+    def n_bonds(self):
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self):
+        """채권별 지급 횟수"""
+        return np.diff(self.offsets)
+
+    @property
+    def bond_index(self):
+        """각 지급일이 속한 채권 인덱스"""
+        return np.repeat(np.arange(self.n_bonds), self.counts)
+
+    @property
+    def is_final(self):
+        """각 지급일의 만기(원금 상환) 여부"""
+        final = np.zeros(len(self.dates), dtype=bool)
+        final[self.offsets[1:] - 1] = True
+        return final
+
+    def dates_for(self, i):
+        """i번째 채권의 지급일"""
+        return self.dates[self.offsets[i] : self.offsets[i + 1]]
+
+
+def add_months(dates, months):
+    """날짜에 개월 수를 더함 (말일 초과 시 해당 월 말일로 조정, 벡터 연산)"""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    month_start = dates.astype("datetime64[M]")
+    day = (dates - month_start.astype("datetime64[D]")).astype(int)
+
+    target = month_start + np.asarray(months)
+    days_in_month = (
+        (target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")
+    ).astype(int)
+    return target.astype("datetime64[D]") + np.minimum(day, days_in_month - 1)
+
+
+def generate_schedules(
+    issue_dates, maturity_dates, payment_freq, convention="unadjusted"
+):
+    """전 채권의 이자지급 스케줄을 한 번의 배열 연산으로 생성
+
+    발행일부터 이자지급주기 간격으로 만기일 이전 지급일을 만들고 만기일을
+    마지막 지급일로 붙인다. 동일한 조건의 스케줄은 캐시에서 반환한다.
+
+    Parameters:
+    -----------
+    issue_dates : array-like
+        발행일
+    maturity_dates : array-like
+        만기일
+    payment_freq : int or array-like
+        이자지급 주기 (월 단위)
+    convention : str
+        영업일 조정 방식 ('unadjusted', 'following', 'preceding',
+        'modified_following'), KRX 영업일 달력 기준
+
+    Returns:
+    --------
+    CouponSchedule : CSR 형태 스케줄
+    """
+    issue_dates = np.atleast_1d(np.asarray(issue_dates, dtype="datetime64[D]"))
+    maturity_dates = np.atleast_1d(np.asarray(maturity_dates, dtype="datetime64[D]"))
+    payment_freq = np.broadcast_to(
+        np.asarray(payment_freq, dtype=np.int64), issue_dates.shape
+    )
+
+    return _cached_schedules(
+        issue_dates.astype(np.int64).tobytes(),
+        maturity_dates.astype(np.int64).tobytes(),
+        np.ascontiguousarray(payment_freq).tobytes(),
+        convention,
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_schedules(issue_key, maturity_key, freq_key, convention):
+    issue_dates = np.frombuffer(issue_key, dtype=np.int64).astype("datetime64[D]")
+    maturity_dates = np.frombuffer(maturity_key, dtype=np.int64).astype("datetime64[D]")
+    payment_freq = np.frombuffer(freq_key, dtype=np.int64)
+
+    schedule = _build_schedules(issue_dates, maturity_dates, payment_freq, convention)
+    for array in (
+        schedule.dates,
+        schedule.unadjusted_dates,
+        schedule.accrual_starts,
+        schedule.offsets,
+    ):
+        array.flags.writeable = False
+    return schedule
+
+
+def _build_schedules(issue_dates, maturity_dates, payment_freq, convention):
+    if np.any(payment_freq <= 0):
+        raise ValueError("이자지급주기는 1개월 이상이어야 합니다")
+    if np.any(maturity_dates <= issue_dates):
+        raise ValueError("만기일은 발행일 이후여야 합니다")
+
+    n_bonds = len(issue_dates)
+
+    # 발행일~만기일 개월 수 기준 후보 지급 횟수 (상한)
+    months = (
+        maturity_dates.astype("datetime64[M]") - issue_dates.astype("datetime64[M]")
+    ).astype(np.int64)
+    n_candidates = months // payment_freq + 1
+
+    candidate_bond = np.repeat(np.arange(n_bonds), n_candidates)
+    candidate_start = np.cumsum(n_candidates) - n_candidates
+    k = np.arange(n_candidates.sum()) - np.repeat(candidate_start, n_candidates) + 1
+    candidates = add_months(
+        issue_dates[candidate_bond], k * payment_freq[candidate_bond]
+    )
+
+    # 만기일 이전 정기 지급일만 남기고 만기일을 추가
+    keep = candidates < maturity_dates[candidate_bond]
+    regular_counts = np.bincount(candidate_bond[keep], minlength=n_bonds)
+    counts = regular_counts + 1
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    unadjusted = np.empty(offsets[-1], dtype="datetime64[D]")
+    unadjusted[offsets[candidate_bond[keep]] + k[keep] - 1] = candidates[keep]
+    unadjusted[offsets[1:] - 1] = maturity_dates
+
+    # 이자계산 시작일 = 직전 지급일 (첫 지급은 발행일)
+    accrual_starts = np.empty_like(unadjusted)
+    accrual_starts[1:] = unadjusted[:-1]
+    accrual_starts[offsets[:-1]] = issue_dates
+
+    dates = get_krx_calendar().adjust(unadjusted, convention)
+
+    return CouponSchedule(
+        dates=dates,
+        unadjusted_dates=unadjusted,
+        accrual_starts=accrual_starts,
+        offsets=offsets,
+    )
@@ -1,5 +1,8 @@
 from pathlib import Path
+import hashlib
 import pandas as pd
+from src.utils.yield_curve import GovtYieldCurve, bootstrap_zero_curve
+from src.utils.date_utils import calculate_remaining_maturity
 
 
 def get_project_root():
@@ -7,6 +10,44 @@ def get_project_root():
     return Path(__file__).parent.parent.parent
 
 
+def get_data_version():
+    """분석 입력 데이터 버전 (채권 정보·시장 데이터·휴장일 파일의 수정시각/크기 해시)
+
+    입력 파일이 바뀌면 값이 달라지므로 계산 결과 캐시의 키로 사용한다.
+    """
+    root_dir = get_project_root()
+    files = [
+        root_dir / "data" / "processed" / "bond_info" / "woori_bond_info.csv",
+        root_dir / "data" / "raw" / "calendar" / "krx_holidays.csv",
+    ]
+    files += sorted((root_dir / "data" / "processed" / "market_data").glob("*.csv"))
+    files += sorted((root_dir / "data" / "processed" / "market_data").glob("*.parquet"))
+
+    digest = hashlib.sha1()
+    for file_path in files:
+        if file_path.exists():
+            stat = file_path.stat()
+            digest.update(
+                f"{file_path.name}:{stat.st_mtime_ns}:{stat.st_size};".encode()
+            )
+    return digest.hexdigest()[:16]
+
+
+def read_market_table(file_path, parse_dates=None):
+    """시장 데이터 로드 (같은 이름의 최신 parquet 파일이 있으면 우선 사용)"""
+    parquet_path = file_path.with_suffix(".parquet")
+    if parquet_path.exists() and (
+        not file_path.exists()
+        or parquet_path.stat().st_mtime >= file_path.stat().st_mtime
+    ):
+        df = pd.read_parquet(parquet_path)
+        for column in parse_dates or []:
+            df[column] = pd.to_datetime(df[column])
+        return df
+
+    return pd.read_csv(file_path, parse_dates=parse_dates)
+
+
 def load_bond_info():
     """우리금융지주 채권 기본 정보 로드"""
     root_dir = get_project_root()
@@ -16,15 +57,34 @@ def load_bond_info():
     return df
 
 
+def load_bond_info_as_of(as_of):
+    """기준일 시점의 채권 유니버스 (발행 후 미상환 채권, 잔존만기 재계산)"""
+    as_of = pd.Timestamp(as_of)
+    df = load_bond_info()
+    df = df[(df["발행일"] <= as_of) & (df["만기일"] > as_of)].copy()
+    df["잔존만기"] = calculate_remaining_maturity(df["만기일"], as_of)
+    return df.reset_index(drop=True)
+
+
 def load_govt_rates():
     """국고채 금리 데이터 로드"""
     root_dir = get_project_root()
     file_path = root_dir / "data" / "processed" / "market_data" / "govt_bond_rates.csv"
 
-    df = pd.read_csv(file_path, parse_dates=["일자"])
+    df = read_market_table(file_path, parse_dates=["일자"])
     return df
 
 
+def load_govt_curve(method="monotone"):
+    """국고채 금리곡선 로드 (전 일자 일괄 구축)"""
+    return GovtYieldCurve(load_govt_rates(), method=method)
+
+
+def load_govt_zero_curve(method="monotone"):
+    """국고채 무이표 할인계수 곡선 로드 (전 일자 일괄 부트스트랩)"""
+    return bootstrap_zero_curve(load_govt_curve(method=method))
+
+
 def load_spread_data():
     """스프레드 데이터 로드"""
     root_dir = get_project_root()
@@ -55,7 +115,7 @@ def load_individual_bond_data(series_code):
         / f"woori_bond_data_{series_code}.csv"
     )
 
-    df = pd.read_csv(file_path, parse_dates=["일자"])
+    df = read_market_table(file_path, parse_dates=["일자"])
     return df
 
 
@@ -68,3 +128,20 @@ def load_all_bond_data():
         all_data[code] = load_individual_bond_data(code)
 
     return all_data
+
+
+def load_bond_market_panel():
+    """전 채권 시장 데이터를 하나의 패널로 로드 (일자, 종목명, 수익률(%), 가격)"""
+    market_data = []
+    for series_code, bond_data in load_all_bond_data().items():
+        market_data.append(
+            pd.DataFrame(
+                {
+                    "일자": bond_data["일자"],
+                    "종목명": f"우리금융지주{series_code}",
+                    "수익률": bond_data["채권평가사 평균수익률_수익률"],
+                    "가격": bond_data["채권평가사 평균가격_가격"],
+                }
+            )
+        )
+    return pd.concat(market_data, ignore_index=True)
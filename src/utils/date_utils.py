@@ -1,6 +1,9 @@
 import pandas as pd
 from datetime import datetime, timedelta
 import numpy as np
+from src.utils.business_calendar import get_krx_calendar
+from src.utils.coupon_schedule import generate_schedules
+from src.utils.day_count import year_fraction, MATURITY_CONVENTION
 
 
 def calculate_days_between(start_date, end_date):
@@ -8,10 +11,9 @@ def calculate_days_between(start_date, end_date):
     return (end_date - start_date).days
 
 
-def calculate_years_between(start_date, end_date):
+def calculate_years_between(start_date, end_date, convention=MATURITY_CONVENTION):
     """두 날짜 사이의 연수를 계산 (소수점 2자리까지)"""
-    days = calculate_days_between(start_date, end_date)
-    return round(days / 365.25, 2)
+    return round(float(year_fraction(start_date, end_date, convention)), 2)
 
 
 def get_remaining_maturity(maturity_date, base_date=None):
@@ -21,6 +23,24 @@ def get_remaining_maturity(maturity_date, base_date=None):
     return calculate_years_between(base_date, maturity_date)
 
 
+def calculate_remaining_maturity(maturity_dates, base_dates):
+    """(만기일, 기준일) 쌍별 잔존만기 계산 (연 단위, 소수점 2자리까지)
+
+    Parameters:
+    -----------
+    maturity_dates : array-like
+        만기일 (스칼라 또는 배열)
+    base_dates : array-like
+        기준일 (관측일자), maturity_dates와 브로드캐스트 가능한 형태
+
+    Returns:
+    --------
+    ndarray : 잔존만기 (만기 경과 시 0)
+    """
+    years = year_fraction(base_dates, maturity_dates, MATURITY_CONVENTION)
+    return np.round(np.maximum(years, 0), 2)
+
+
 def get_payment_dates(start_date, maturity_date, payment_freq=3):
     """이자지급일 배열 생성
 
@@ -37,24 +57,14 @@ def get_payment_dates(start_date, maturity_date, payment_freq=3):
     --------
     list : 이자지급일 리스트
     """
-    payment_dates = []
-    current_date = start_date
-
-    while current_date < maturity_date:
-        current_date += pd.DateOffset(months=payment_freq)
-        if current_date < maturity_date:
-            payment_dates.append(current_date)
-
-    payment_dates.append(maturity_date)
-    return payment_dates
+    schedule = generate_schedules(start_date, maturity_date, payment_freq)
+    return [pd.Timestamp(date) for date in schedule.dates]
 
 
 def get_last_business_day(year, month):
-    """해당 월의 마지막 영업일 반환"""
+    """해당 월의 마지막 영업일 반환 (KRX 휴장일 반영)"""
     last_day = pd.Timestamp(year=year, month=month, day=1) + pd.offsets.MonthEnd(1)
-    while last_day.weekday() > 4:  # 주말인 경우
-        last_day -= pd.Timedelta(days=1)
-    return last_day
+    return pd.Timestamp(get_krx_calendar().adjust(last_day, "preceding"))
 
 
 def create_date_range(start_date, end_date, freq="B"):
@@ -77,16 +87,23 @@ def create_date_range(start_date, end_date, freq="B"):
 
 
 def is_business_day(date):
-    """영업일 여부 확인"""
-    return bool(len(pd.bdate_range(date, date)))
+    """영업일 여부 확인 (KRX 휴장일 반영)"""
+    return bool(get_krx_calendar().is_business_day(date))
 
 
 def get_next_business_day(date):
-    """다음 영업일 반환"""
-    next_day = date + pd.Timedelta(days=1)
-    while not is_business_day(next_day):
-        next_day += pd.Timedelta(days=1)
-    return next_day
+    """다음 영업일 반환 (KRX 휴장일 반영)"""
+    return pd.Timestamp(get_krx_calendar().next_business_day(date))
+
+
+def get_previous_business_day(date):
+    """이전 영업일 반환 (KRX 휴장일 반영)"""
+    return pd.Timestamp(get_krx_calendar().previous_business_day(date))
+
+
+def count_business_days(start_date, end_date):
+    """[시작일, 종료일) 구간의 영업일 수 (KRX 휴장일 반영)"""
+    return int(get_krx_calendar().business_days_between(start_date, end_date))
 
 
 def quarter_end_dates(start_date, end_date):
@@ -0,0 +1,79 @@
+import numpy as np
+
+DAY_COUNT_CONVENTIONS = ("ACT/365F", "ACT/365.25", "ACT/ACT-ICMA", "30/360")
+
+# 가격 계산(할인 기간)에 사용하는 기준
+PRICING_CONVENTION = "ACT/365F"
+
+# 발행시만기·잔존만기 등 만기 표기에 사용하는 기준
+MATURITY_CONVENTION = "ACT/365.25"
+
+
+def _to_days(dates):
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def _ymd(dates):
+    """datetime64[D] 배열을 (연, 월, 일) 정수 배열로 분해"""
+    years = dates.astype("datetime64[Y]")
+    months = dates.astype("datetime64[M]")
+    year = years.astype(np.int64) + 1970
+    month = (months - years.astype("datetime64[M]")).astype(np.int64) + 1
+    day = (dates - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return year, month, day
+
+
+def year_fraction(
+    start_dates,
+    end_dates,
+    convention=PRICING_CONVENTION,
+    ref_start=None,
+    ref_end=None,
+    frequency=None,
+):
+    """날짜 쌍 배열의 연 환산 기간 계산 (벡터 연산)
+
+    Parameters:
+    -----------
+    start_dates, end_dates : array-like
+        시작일, 종료일 (스칼라 또는 브로드캐스트 가능한 배열)
+    convention : str
+        'ACT/365F': 실제일수/365
+        'ACT/365.25': 실제일수/365.25 (만기 표기용)
+        'ACT/ACT-ICMA': 실제일수/(연간 지급횟수 × 이자계산기간 일수)
+        '30/360': 30/360 채권 기준 (ISDA)
+    ref_start, ref_end : array-like
+        이자계산기간 시작일/종료일 (ACT/ACT-ICMA 필수)
+    frequency : int or array-like
+        연간 이자지급 횟수 (ACT/ACT-ICMA 필수)
+
+    Returns:
+    --------
+    ndarray : 연 환산 기간 (종료일이 앞서면 음수)
+    """
+    start_dates = _to_days(start_dates)
+    end_dates = _to_days(end_dates)
+
+    if convention == "ACT/365F":
+        return (end_dates - start_dates).astype(np.int64) / 365.0
+
+    if convention == "ACT/365.25":
+        return (end_dates - start_dates).astype(np.int64) / 365.25
+
+    if convention == "ACT/ACT-ICMA":
+        if ref_start is None or ref_end is None or frequency is None:
+            raise ValueError(
+                "ACT/ACT-ICMA는 이자계산기간(ref_start, ref_end)과 지급횟수(frequency)가 필요합니다"
+            )
+        period_days = (_to_days(ref_end) - _to_days(ref_start)).astype(np.int64)
+        days = (end_dates - start_dates).astype(np.int64)
+        return days / (np.asarray(frequency) * period_days)
+
+    if convention == "30/360":
+        y1, m1, d1 = _ymd(start_dates)
+        y2, m2, d2 = _ymd(end_dates)
+        d1 = np.minimum(d1, 30)
+        d2 = np.where(d1 == 30, np.minimum(d2, 30), d2)
+        return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360.0
+
+    raise ValueError(f"지원하지 않는 일수 계산 기준입니다: {convention}")
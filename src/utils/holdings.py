@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from src.utils.data_loader import get_project_root
+
+# 기본 보유 내역 파일 (포트폴리오, 종목명, 액면금액)
+DEFAULT_HOLDINGS_FILE = (
+    get_project_root() / "data" / "processed" / "holdings" / "holdings.csv"
+)
+
+# 보유 내역 파일이 없을 때 사용하는 포트폴리오명 (발행액 전액 보유 가정)
+DEFAULT_PORTFOLIO = "전체"
+
+
+class Holdings:
+    """포트폴리오별 채권 보유 내역 (포트폴리오 × 채권 희소 행렬)
+
+    채권별 위험지표는 발행액 전액 기준으로 계산되므로, 액면금액/발행액
+    비율 행렬과 곱해 포트폴리오별 값으로 집계한다. 같은 (포트폴리오, 채권)
+    행이 여러 개면 액면금액을 합산한다.
+
+    Parameters:
+    -----------
+    universe : BondUniverse
+        채권 유니버스
+    portfolio_ids : array-like
+        행별 포트폴리오 번호 (0 ~ 포트폴리오 수-1)
+    bond_ids : array-like
+        행별 채권 ID
+    face_amounts : array-like
+        행별 액면금액 (백만원)
+    portfolio_names : array-like
+        포트폴리오명
+    """
+
+    def __init__(
+        self, universe, portfolio_ids, bond_ids, face_amounts, portfolio_names
+    ):
+        self.universe = universe
+        self.portfolio_names = np.asarray(portfolio_names, dtype=object)
+        self.matrix = sparse.csr_matrix(
+            (
+                np.asarray(face_amounts, dtype=float),
+                (np.asarray(portfolio_ids), np.asarray(bond_ids)),
+            ),
+            shape=(len(self.portfolio_names), len(universe)),
+        )
+        self.matrix.sum_duplicates()
+        self.matrix.eliminate_zeros()
+
+    @classmethod
+    def from_frame(cls, positions, universe):
+        """보유 내역 DataFrame (포트폴리오, 종목명, 액면금액)으로 생성"""
+        portfolio_ids, portfolio_names = pd.factorize(positions["포트폴리오"])
+        return cls(
+            universe,
+            portfolio_ids,
+            universe.indices(positions["종목명"]),
+            positions["액면금액"].to_numpy(dtype=float),
+            portfolio_names,
+        )
+
+    @classmethod
+    def from_issue_amounts(cls, universe, portfolio=DEFAULT_PORTFOLIO):
+        """발행액 전액을 하나의 포트폴리오로 보유한다고 가정한 보유 내역"""
+        return cls(
+            universe,
+            np.zeros(len(universe), dtype=np.int64),
+            universe.ids,
+            universe.notionals,
+            [portfolio],
+        )
+
+    @classmethod
+    def load(cls, universe, file_path=DEFAULT_HOLDINGS_FILE):
+        """보유 내역 파일 로드 (파일이 없으면 발행액 기준 단일 포트폴리오)"""
+        if not file_path.exists():
+            return cls.from_issue_amounts(universe)
+        return cls.from_frame(pd.read_csv(file_path), universe)
+
+    @property
+    def n_portfolios(self):
+        return len(self.portfolio_names)
+
+    @property
+    def bond_face(self):
+        """채권별 전체 포트폴리오 보유 액면금액 합계"""
+        return np.asarray(self.matrix.sum(axis=0)).ravel()
+
+    @property
+    def exposure(self):
+        """포트폴리오 × 채권 보유 비율 행렬 (액면금액 / 발행액)"""
+        return self.matrix @ sparse.diags(1 / self.universe.notionals.astype(float))
+
+    def aggregate(self, values):
+        """발행액 기준 채권별 값을 포트폴리오별 값으로 집계
+
+        보유하지 않은 채권의 값은 NaN이어도 포트폴리오 합계에 반영하지 않는다.
+
+        Parameters:
+        -----------
+        values : array-like
+            채권별 값 (채권 수) 또는 (채권 수 × 항목 수)
+
+        Returns:
+        --------
+        ndarray : 포트폴리오별 값 (포트폴리오 수) 또는 (포트폴리오 수 × 항목 수)
+        """
+        values = np.asarray(values, dtype=float)
+
+        # 보유하지 않은 채권의 값(미발행 채권의 NaN 등)은 합계에서 제외
+        held = (self.bond_face != 0).reshape(-1, *[1] * (values.ndim - 1))
+        return self.exposure @ np.where(held, values, 0.0)
+
+    def positions(self):
+        """보유 내역 테이블 (포트폴리오, 종목명, 액면금액)"""
+        coo = self.matrix.tocoo()
+        return pd.DataFrame(
+            {
+                "포트폴리오": self.portfolio_names[coo.row],
+                "종목명": self.universe.names[coo.col],
+                "액면금액": coo.data,
+            }
+        )
@@ -0,0 +1,294 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+import yaml
+from src.utils.data_loader import get_project_root
+
+# 시나리오 라이브러리 파일 위치
+SCENARIO_DIR = get_project_root() / "config" / "scenarios"
+HISTORICAL_SCENARIO_FILE = SCENARIO_DIR / "historical.yaml"
+HYPOTHETICAL_SCENARIO_FILE = SCENARIO_DIR / "hypothetical.yaml"
+
+# 금리변동 단위별 bp 환산 배수
+UNITS = {"bp": 1.0, "pct": 100.0}
+
+# 만기별 금리변동 → 채권 만기 대응 방식
+INTERPOLATIONS = ("linear", "step")
+
+# 시나리오·국면에 쓸 수 있는 항목 (그 밖의 항목은 오타로 보고 거부)
+# period는 역사적 시나리오의 관측 기간 [시작일, 종료일]로, 충격 계산에는 쓰지 않는다
+SCENARIO_KEYS = (
+    "id",
+    "name",
+    "period",
+    "description",
+    "unit",
+    "interpolation",
+    "phases",
+)
+PHASE_KEYS = ("name", "date", "tenor_shocks")
+
+# linear 보간 시 기준만기 값을 그대로 쓰는 만기 차이 허용오차 (년)
+DEFAULT_TENOR_TOLERANCE = 0.05
+
+# (파일 내용 해시, 유니버스, 허용오차)별 컴파일 결과 캐시
+# 최대 SCENARIO_CACHE_SIZE개까지 보관하고, 넘치면 가장 오래 쓰지 않은 항목부터 삭제
+SCENARIO_CACHE_SIZE = 16
+_compiled_cache = OrderedDict()
+
+
+def clear_scenario_cache():
+    """시나리오 컴파일 결과 캐시 초기화"""
+    _compiled_cache.clear()
+
+
+@dataclass(frozen=True)
+class CompiledScenarios:
+    """컴파일된 시나리오 라이브러리 (행: 시나리오 국면)
+
+    금리변동은 모두 bp 단위이며, bond_shocks는 유니버스 순서의 채권별
+    금리 충격이다. 손실 계산은 (국면 × 채권) 충격과 채권별 민감도의
+    행렬 연산으로 처리한다.
+    """
+
+    content_hash: str
+    scenario_ids: np.ndarray  # 행별 시나리오 ID
+    names: np.ndarray  # 행별 시나리오명
+    phases: np.ndarray  # 행별 국면명
+    dates: np.ndarray  # 행별 기준일자 (문자열, 없으면 None)
+    descriptions: np.ndarray  # 행별 시나리오 설명
+    interpolations: np.ndarray  # 행별 보간 방식
+    pillars: np.ndarray  # 전 시나리오 기준만기 합집합 (년)
+    tenor_shocks: np.ndarray  # 국면 × 기준만기 금리변동 (bp, 미정의는 NaN)
+    bond_names: np.ndarray
+    bond_shocks: np.ndarray  # 국면 × 채권 금리변동 (bp)
+
+    def __len__(self):
+        return len(self.phases)
+
+    def rows(self, scenario_id=None):
+        """시나리오 ID의 행 번호 배열 (생략 시 전체)"""
+        if scenario_id is None:
+            return np.arange(len(self))
+        rows = np.flatnonzero(self.scenario_ids == scenario_id)
+        if len(rows) == 0:
+            raise KeyError(f"라이브러리에 없는 시나리오입니다: {scenario_id}")
+        return rows
+
+    def bond_shock(self, scenario_id, phase=None):
+        """시나리오(국면)의 채권별 금리변동 (bp, 국면 생략 시 첫 국면)"""
+        rows = self.rows(scenario_id)
+        if phase is not None:
+            rows = rows[self.phases[rows] == phase]
+            if len(rows) == 0:
+                raise KeyError(f"시나리오 {scenario_id}에 없는 국면입니다: {phase}")
+        return self.bond_shocks[rows[0]]
+
+    def shocks_at(self, maturities, tolerance=DEFAULT_TENOR_TOLERANCE):
+        """임의 만기의 국면별 금리변동 (bp, 국면 수 × 만기 수)"""
+        maturities = np.asarray(maturities, dtype=float)
+        return np.stack(
+            [
+                _map_tenors(
+                    self.pillars[np.isfinite(row)],
+                    row[np.isfinite(row)],
+                    maturities,
+                    interpolation,
+                    tolerance,
+                )
+                for row, interpolation in zip(self.tenor_shocks, self.interpolations)
+            ]
+        )
+
+    def to_frame(self):
+        """국면별 채권 금리변동 테이블 (bp)"""
+        index = pd.MultiIndex.from_arrays(
+            [self.scenario_ids, self.phases], names=["시나리오", "국면"]
+        )
+        return pd.DataFrame(self.bond_shocks, index=index, columns=self.bond_names)
+
+
+def _map_tenors(tenors, values, maturities, interpolation, tolerance):
+    """기준만기별 값을 만기 배열에 대응
+
+    linear: 선형 보간 (기준만기와 tolerance 이내면 그 값을 그대로 사용)
+    step: 만기 이상인 첫 기준만기의 값 (마지막 기준만기보다 길면 마지막 값)
+    """
+    if interpolation == "step":
+        bucket = np.searchsorted(tenors, maturities, side="left")
+        return values[np.minimum(bucket, len(tenors) - 1)]
+
+    mapped = np.interp(maturities, tenors, values)
+    nearest = np.abs(maturities[:, None] - tenors[None, :]).argmin(axis=1)
+    snap = np.abs(maturities - tenors[nearest]) <= tolerance
+    return np.where(snap, values[nearest], mapped)
+
+
+def _read_document(file_path):
+    """시나리오 파일 원문과 파싱 결과 (확장자로 YAML/JSON 구분)"""
+    raw = file_path.read_bytes()
+    if file_path.suffix.lower() == ".json":
+        return raw, json.loads(raw)
+    return raw, yaml.safe_load(raw)
+
+
+def _check_keys(mapping, allowed, where):
+    """허용하지 않는 항목이 있으면 ValueError"""
+    unknown = [str(key) for key in mapping if key not in allowed]
+    if unknown:
+        raise ValueError(f"{where}: 알 수 없는 항목입니다: {unknown}")
+
+
+def _validate_period(period, where):
+    """관측 기간 [시작일, 종료일] 검증 (문자열 튜플로 정규화)"""
+    if period is None:
+        return None
+    try:
+        start, end = (pd.Timestamp(str(day)) for day in period)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"{where}: 'period'는 [시작일, 종료일] 형식이어야 합니다"
+        ) from None
+    if start > end:
+        raise ValueError(f"{where}: 'period'의 시작일이 종료일보다 늦습니다")
+    return tuple(str(day) for day in period)
+
+
+def _validate(document, source):
+    """시나리오 문서 검증 및 정규화 (오류 시 ValueError)"""
+    if not isinstance(document, dict) or not isinstance(
+        document.get("scenarios"), list
+    ):
+        raise ValueError(f"{source}: 최상위 'scenarios' 목록이 필요합니다")
+
+    scenarios = []
+    seen = set()
+    for i, scenario in enumerate(document["scenarios"]):
+        where = f"{source} scenarios[{i}]"
+        if not isinstance(scenario, dict):
+            raise ValueError(f"{where}: 시나리오는 사전이어야 합니다")
+        for key in ("id", "phases"):
+            if key not in scenario:
+                raise ValueError(f"{where}: '{key}' 항목이 없습니다")
+        _check_keys(scenario, SCENARIO_KEYS, where)
+
+        scenario_id = str(scenario["id"])
+        if scenario_id in seen:
+            raise ValueError(f"{where}: 중복된 시나리오 ID입니다: {scenario_id}")
+        seen.add(scenario_id)
+
+        unit = scenario.get("unit", "bp")
+        if unit not in UNITS:
+            raise ValueError(f"{where}: 지원하지 않는 단위입니다: {unit}")
+        interpolation = scenario.get("interpolation", "linear")
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"{where}: 지원하지 않는 보간 방식입니다: {interpolation}")
+
+        phases = []
+        for j, phase in enumerate(scenario["phases"]):
+            shocks = phase.get("tenor_shocks") if isinstance(phase, dict) else None
+            if not shocks or "name" not in phase:
+                raise ValueError(
+                    f"{where} phases[{j}]: 'name'과 'tenor_shocks'가 필요합니다"
+                )
+            _check_keys(phase, PHASE_KEYS, f"{where} phases[{j}]")
+            try:
+                tenor_shocks = {float(t): float(v) for t, v in shocks.items()}
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"{where} phases[{j}]: 만기와 금리변동은 숫자여야 합니다"
+                ) from None
+            if min(tenor_shocks) <= 0 or not np.all(
+                np.isfinite(list(tenor_shocks.values()))
+            ):
+                raise ValueError(
+                    f"{where} phases[{j}]: 만기는 양수, 금리변동은 유한값이어야 합니다"
+                )
+            phases.append(
+                {
+                    "name": str(phase["name"]),
+                    "date": None if phase.get("date") is None else str(phase["date"]),
+                    "tenor_shocks": {
+                        t: v * UNITS[unit] for t, v in sorted(tenor_shocks.items())
+                    },
+                }
+            )
+
+        scenarios.append(
+            {
+                "id": scenario_id,
+                "name": str(scenario.get("name", scenario_id)),
+                "period": _validate_period(scenario.get("period"), where),
+                "description": str(scenario.get("description", "")),
+                "interpolation": interpolation,
+                "phases": phases,
+            }
+        )
+    return scenarios
+
+
+def compile_scenarios(file_path, universe, tolerance=DEFAULT_TENOR_TOLERANCE):
+    """시나리오 파일을 검증·컴파일하여 (국면 × 채권) 충격 배열 생성
+
+    같은 파일 내용·유니버스·허용오차의 결과는 캐시에서 반환한다
+    (파일 내용 해시 기준이므로 파일을 고치면 자동으로 다시 컴파일되며,
+    최근 SCENARIO_CACHE_SIZE개 결과만 보관).
+
+    Parameters:
+    -----------
+    file_path : Path
+        YAML(.yaml, .yml) 또는 JSON(.json) 시나리오 파일
+    universe : BondUniverse
+        충격을 대응시킬 채권 유니버스 (채권 만기 = 발행시만기)
+    tolerance : float
+        linear 보간 시 기준만기 값을 그대로 쓰는 만기 차이 (년)
+
+    Returns:
+    --------
+    CompiledScenarios : 읽기 전용 컴파일 결과
+    """
+    raw, document = _read_document(file_path)
+    content_hash = hashlib.sha1(raw).hexdigest()[:16]
+    key = (content_hash, tuple(universe.names), tuple(universe.tenors), tolerance)
+    if key in _compiled_cache:
+        _compiled_cache.move_to_end(key)
+        return _compiled_cache[key]
+
+    scenarios = _validate(document, file_path.name)
+    rows = [(scenario, phase) for scenario in scenarios for phase in scenario["phases"]]
+    pillars = np.array(
+        sorted({tenor for _, phase in rows for tenor in phase["tenor_shocks"]})
+    )
+
+    tenor_shocks = np.full((len(rows), len(pillars)), np.nan)
+    bond_shocks = np.empty((len(rows), len(universe)))
+    for i, (scenario, phase) in enumerate(rows):
+        tenors = np.array(list(phase["tenor_shocks"]))
+        values = np.array(list(phase["tenor_shocks"].values()))
+        tenor_shocks[i, np.searchsorted(pillars, tenors)] = values
+        bond_shocks[i] = _map_tenors(
+            tenors, values, universe.tenors, scenario["interpolation"], tolerance
+        )
+
+    compiled = CompiledScenarios(
+        content_hash=content_hash,
+        scenario_ids=np.array([s["id"] for s, _ in rows], dtype=object),
+        names=np.array([s["name"] for s, _ in rows], dtype=object),
+        phases=np.array([p["name"] for _, p in rows], dtype=object),
+        dates=np.array([p["date"] for _, p in rows], dtype=object),
+        descriptions=np.array([s["description"] for s, _ in rows], dtype=object),
+        interpolations=np.array([s["interpolation"] for s, _ in rows], dtype=object),
+        pillars=pillars,
+        tenor_shocks=tenor_shocks,
+        bond_names=universe.names,
+        bond_shocks=bond_shocks,
+    )
+    for array in (compiled.tenor_shocks, compiled.bond_shocks):
+        array.flags.writeable = False
+    _compiled_cache[key] = compiled
+    while len(_compiled_cache) > SCENARIO_CACHE_SIZE:
+        _compiled_cache.popitem(last=False)
+    return compiled
@@ -0,0 +1,278 @@
+import numpy as np
+import pandas as pd
+
+# 국고채/통안채 금리 컬럼별 만기(년)
+GOVT_TENORS = {
+    "통안증권(91일)": 0.25,
+    "국고채권(1년)": 1.0,
+    "통안증권(2년)": 2.0,
+    "국고채권(3년)": 3.0,
+    "국고채권(5년)": 5.0,
+    "국고채권(10년)": 10.0,
+}
+
+# 국고채 금리 결측 시 대체할 동일 만기 통안증권 금리
+FALLBACK_TENORS = {"국고채권(1년)": "통안증권(1년)"}
+
+INTERPOLATION_METHODS = ("linear", "monotone")
+
+# 부트스트랩 기준 국고채 이자지급 횟수 (연 2회) 및 최장 만기(년)
+KTB_COUPON_FREQUENCY = 2
+KTB_MAX_MATURITY = 10.0
+
+# 할인채로 취급하는 단기 금리 (만기 1년 미만 통안증권, 단리)
+MONEY_MARKET_TENOR = "통안증권(91일)"
+
+
+class GovtYieldCurve:
+    """일자별 국고채 금리곡선
+
+    전체 일자의 곡선을 한 번에 구축하고, (일자, 만기) 배열을 한 번의
+    벡터 연산으로 보간 조회한다. 금리 단위는 원본 데이터와 같은 % 이다.
+
+    Parameters:
+    -----------
+    govt_rates : DataFrame
+        load_govt_rates() 결과 ('일자' + 만기별 금리 컬럼)
+    method : str
+        보간 방법 ('linear': 선형, 'monotone': 단조 3차(PCHIP))
+    """
+
+    def __init__(self, govt_rates, method="monotone"):
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError(f"지원하지 않는 보간 방법입니다: {method}")
+
+        data = (
+            govt_rates.sort_values("일자")
+            .drop_duplicates("일자", keep="last")
+            .reset_index(drop=True)
+        )
+        rates = data[list(GOVT_TENORS)].copy()
+        for column, fallback in FALLBACK_TENORS.items():
+            if fallback in data:
+                rates[column] = rates[column].fillna(data[fallback])
+
+        self.method = method
+        self.dates = data["일자"].to_numpy().astype("datetime64[D]")
+        self.tenors = np.array(list(GOVT_TENORS.values()), dtype=float)
+        self.rates = rates.ffill().bfill().to_numpy(dtype=float)
+        self._slopes = None
+
+    @property
+    def slopes(self):
+        """일자별 단조 3차 보간 기울기 (최초 조회 시 전 일자 일괄 계산 후 캐시)"""
+        if self._slopes is None:
+            self._slopes = _pchip_slopes(self.tenors, self.rates)
+        return self._slopes
+
+    def date_index(self, dates):
+        """각 일자에 적용할 곡선 인덱스 (해당일 이전 최근 고시일 기준)"""
+        return _date_index(self.dates, dates)
+
+    def rate(self, dates, maturities):
+        """(일자, 만기) 배열에 대한 보간 금리 조회
+
+        Parameters:
+        -----------
+        dates : array-like
+            조회 일자 (스칼라 또는 배열)
+        maturities : array-like
+            만기(년), 양 끝 만기 밖은 끝점 금리로 고정
+
+        Returns:
+        --------
+        ndarray : 보간 금리 (%), 입력을 브로드캐스트한 형태
+        """
+        dates, maturities = np.broadcast_arrays(
+            np.asarray(dates, dtype="datetime64[D]"),
+            np.asarray(maturities, dtype=float),
+        )
+        row = self.date_index(dates)
+        x = np.clip(maturities, self.tenors[0], self.tenors[-1])
+
+        k = np.searchsorted(self.tenors, x, side="right") - 1
+        k = np.clip(k, 0, len(self.tenors) - 2)
+        h = self.tenors[k + 1] - self.tenors[k]
+        s = (x - self.tenors[k]) / h
+
+        y0 = self.rates[row, k]
+        y1 = self.rates[row, k + 1]
+
+        if self.method == "linear":
+            return y0 + s * (y1 - y0)
+
+        # 3차 에르미트 기저함수
+        m0 = self.slopes[row, k]
+        m1 = self.slopes[row, k + 1]
+        s2 = s * s
+        s3 = s2 * s
+        return (
+            (2 * s3 - 3 * s2 + 1) * y0
+            + (s3 - 2 * s2 + s) * h * m0
+            + (-2 * s3 + 3 * s2) * y1
+            + (s3 - s2) * h * m1
+        )
+
+    def curve(self, date, maturities=None):
+        """특정 일자의 금리곡선 (기본값: 고시 만기 구간)"""
+        if maturities is None:
+            maturities = self.tenors
+        return pd.Series(
+            self.rate(np.datetime64(pd.Timestamp(date), "D"), maturities),
+            index=maturities,
+        )
+
+
+class ZeroCurve:
+    """일자별 국고채 무이표(zero) 할인계수 곡선
+
+    만기 격자의 할인계수를 일자별로 보관하고, 격자 사이는 로그 할인계수를
+    선형 보간(구간별 순간 선도금리 일정)한다. 최장 만기 이후는 최장 만기
+    무이표금리를 그대로 적용한다.
+
+    Parameters:
+    -----------
+    dates : array-like
+        곡선 일자 (오름차순)
+    times : array-like
+        만기 격자(년), 0보다 큰 오름차순
+    discount_factors : ndarray
+        할인계수 (일자 수 × 만기 격자 수)
+    """
+
+    def __init__(self, dates, times, discount_factors):
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.times = np.asarray(times, dtype=float)
+        self.discount_factors = np.asarray(discount_factors, dtype=float)
+        self._log_df = np.log(self.discount_factors)
+
+    def date_index(self, dates):
+        """각 일자에 적용할 곡선 인덱스 (해당일 이전 최근 고시일 기준)"""
+        return _date_index(self.dates, dates)
+
+    def discount_factor(self, dates, maturities):
+        """(일자, 만기) 배열에 대한 할인계수 (입력을 브로드캐스트한 형태)"""
+        dates, maturities = np.broadcast_arrays(
+            np.asarray(dates, dtype="datetime64[D]"),
+            np.asarray(maturities, dtype=float),
+        )
+        row = self.date_index(dates)
+        t = np.maximum(maturities, 0.0)
+
+        # 원점(할인계수 1)을 포함한 격자에서 로그 할인계수 선형 보간
+        grid = np.concatenate([[0.0], self.times])
+        k = np.clip(np.searchsorted(grid, t, side="right") - 1, 0, len(grid) - 2)
+        log_df = np.concatenate([np.zeros((len(self.dates), 1)), self._log_df], axis=1)
+        s = (t - grid[k]) / (grid[k + 1] - grid[k])
+        interpolated = log_df[row, k] + s * (log_df[row, k + 1] - log_df[row, k])
+
+        # 최장 만기 이후는 최장 만기 무이표금리 유지
+        beyond = t > grid[-1]
+        flat = log_df[row, -1] * t / grid[-1]
+        return np.exp(np.where(beyond, flat, interpolated))
+
+    def zero_rate(self, dates, maturities):
+        """연 복리 무이표금리 (%), 만기 0 근처는 첫 격자 금리 적용"""
+        maturities = np.maximum(np.asarray(maturities, dtype=float), self.times[0])
+        discount = self.discount_factor(dates, maturities)
+        return (discount ** (-1 / maturities) - 1) * 100
+
+
+def bootstrap_zero_curve(
+    curve, frequency=KTB_COUPON_FREQUENCY, max_maturity=KTB_MAX_MATURITY
+):
+    """국고채 금리곡선(만기수익률)에서 전 일자 무이표 할인계수 곡선 부트스트랩
+
+    통안증권 91일 금리는 단리 할인채로, 나머지 만기는 액면가(par) 이표채로
+    보고 이표 주기 간격 만기 격자에서 짧은 만기부터 할인계수를 차례로
+    구한다. 각 단계는 전 일자를 한 번에 계산한다.
+
+    Parameters:
+    -----------
+    curve : GovtYieldCurve
+        국고채 금리곡선
+    frequency : int
+        가정 이자지급 횟수 (연간)
+    max_maturity : float
+        부트스트랩 최장 만기(년)
+
+    Returns:
+    --------
+    ZeroCurve : 일자별 할인계수 곡선
+    """
+    short_tenor = GOVT_TENORS[MONEY_MARKET_TENOR]
+    coupon_times = np.arange(1, int(round(max_maturity * frequency)) + 1) / frequency
+
+    # 단기: 단리 할인
+    short_rate = curve.rates[:, list(GOVT_TENORS).index(MONEY_MARKET_TENOR)] / 100
+    short_df = 1 / (1 + short_rate * short_tenor)
+
+    # 이표 주기별 par 금리 (전 일자 × 만기 격자 일괄 보간)
+    par = curve.rate(curve.dates[:, None], coupon_times[None, :]) / 100 / frequency
+
+    coupon_df = np.empty_like(par)
+    annuity = np.zeros(len(curve.dates))
+    for k in range(len(coupon_times)):
+        coupon_df[:, k] = (1 - par[:, k] * annuity) / (1 + par[:, k])
+        annuity += coupon_df[:, k]
+
+    return ZeroCurve(
+        curve.dates,
+        np.concatenate([[short_tenor], coupon_times]),
+        np.column_stack([short_df, coupon_df]),
+    )
+
+
+def _date_index(curve_dates, dates):
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    idx = np.searchsorted(curve_dates, dates, side="right") - 1
+    if np.any(idx < 0):
+        raise ValueError("금리곡선 시작일 이전의 일자가 포함되어 있습니다")
+    return idx
+
+
+def _pchip_slopes(x, y):
+    """Fritsch-Carlson 방식 단조 3차 보간 기울기 (행=일자 단위 벡터 계산)"""
+    h = np.diff(x)
+    delta = np.diff(y, axis=1) / h
+    slopes = np.zeros_like(y)
+
+    # 내부 점: 인접 구간 기울기의 가중 조화평균 (부호가 바뀌면 0)
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    d0 = delta[:, :-1]
+    d1 = delta[:, 1:]
+    same_sign = d0 * d1 > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        harmonic = (w1 + w2) / (w1 / d0 + w2 / d1)
+    slopes[:, 1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    # 양 끝점: 3점 공식 후 단조성 조건 보정
+    slopes[:, 0] = _pchip_edge(h[0], h[1], delta[:, 0], delta[:, 1])
+    slopes[:, -1] = _pchip_edge(h[-1], h[-2], delta[:, -1], delta[:, -2])
+    return slopes
+
+
+def _pchip_edge(h0, h1, d0, d1):
+    d = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+    d = np.where(np.sign(d) != np.sign(d0), 0.0, d)
+    overshoot = (np.sign(d0) != np.sign(d1)) & (np.abs(d) > np.abs(3 * d0))
+    return np.where(overshoot, 3 * d0, d)
+
+
+def key_rate_weights(maturities, pillars):
+    """만기별 키레이트 삼각형 가중치 (pillars × maturities 형태)
+
+    각 만기 구간 기준점에서 1, 인접 기준점에서 0이 되는 삼각형 함수이며,
+    양 끝 기준점 밖은 끝 기준점 가중치를 1로 고정한다. 모든 기준점의
+    가중치 합은 1이므로 전 기준점 동시 충격은 평행이동과 같다.
+    """
+    maturities = np.asarray(maturities, dtype=float)
+    pillars = np.asarray(pillars, dtype=float)
+    identity = np.eye(len(pillars))
+    return np.stack(
+        [
+            np.interp(maturities, pillars, identity[k]).reshape(maturities.shape)
+            for k in range(len(pillars))
+        ]
+    )